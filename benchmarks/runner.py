@@ -0,0 +1,199 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from benchmarks.synthetic import generate_dataset
+from datahub.loaders.data_loader import DataLoader
+from datahub.views.data_source import DataSource
+
+EXCLUDE_FOLDERS = {"event_schedules", "topsky"}
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+@dataclass
+class Workspace:
+    """Temporary working directory holding the synthetic data/ tree"""
+
+    root: Path
+    data_dir: Path
+    api_dir: Path
+    _data: list[DataSource] | None = field(default=None, repr=False)
+
+    @property
+    def data(self) -> list[DataSource]:
+        """loaded (unsorted) data, loaded once and shared between benchmarks"""
+        if self._data is None:
+            self._data = quiet(DataLoader.load, self.data_dir, exclude_folders=EXCLUDE_FOLDERS)
+        return self._data
+
+    def fresh_data(self) -> list[DataSource]:
+        """shallow copy of the loaded data, safe to be sorted in place"""
+        return [DataSource(source=ds.source, data=list(ds.data)) for ds in self.data]
+
+    @property
+    def station_count(self) -> int:
+        return sum(len(ds.data) for ds in self.data)
+
+
+@dataclass
+class Benchmark:
+    """
+    run receives the value returned by setup (called untimed before every repetition) and
+    returns the number of processed items, e.g. stations.
+    """
+
+    name: str
+    run: Callable[[Any], int]
+    setup: Callable[[Workspace], Any] = lambda ws: ws
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, setup: Callable[[Workspace], Any] | None = None):
+    """registers a benchmark function"""
+
+    def decorator(func: Callable[[Any], int]):
+        BENCHMARKS.append(Benchmark(name, func, setup or (lambda ws: ws)))
+        return func
+
+    return decorator
+
+
+def quiet(func: Callable, *args, **kwargs):
+    """calls func with stdout suppressed, the CLI entry points print progress"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def measure(bench: Benchmark, workspace: Workspace, repeat: int) -> dict:
+    timings = []
+    items = 0
+
+    for _ in range(repeat):
+        state = quiet(bench.setup, workspace)
+        start = time.perf_counter()
+        items = quiet(bench.run, state)
+        timings.append(time.perf_counter() - start)
+
+    # separate run for the memory measurement, tracemalloc distorts the timings
+    state = quiet(bench.setup, workspace)
+    tracemalloc.start()
+    quiet(bench.run, state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "seconds": best,
+        "items": items,
+        "items_per_second": items / best if best else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """returns the names of all benchmarks which are slower than baseline by more than threshold"""
+    regressions = []
+
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<32} no baseline")
+            continue
+
+        ratio = result["seconds"] / reference["seconds"] if reference["seconds"] else 1.0
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<32} {ratio:6.2f}x baseline {flag}")
+
+        if flag:
+            regressions.append(name)
+
+    return regressions
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the datahub load, sort and export stages"
+    )
+    parser.add_argument("--firs", type=int, default=10, help="synthetic FIR folders")
+    parser.add_argument("--files", type=int, default=8, help="files per FIR folder")
+    parser.add_argument("--stations", type=int, default=100, help="stations per file")
+    parser.add_argument("--no-real-data", action="store_true", help="do not mix in data/")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions, the best is reported")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store results as baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    # register the benchmark definitions
+    import benchmarks.stages  # noqa: F401
+
+    cwd = Path.cwd()
+    real_data = None if args.no_real_data else cwd / "data"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        workspace = Workspace(root=root, data_dir=root / "data", api_dir=root / "api")
+        generate_dataset(workspace.data_dir, args.firs, args.files, args.stations, real_data)
+
+        print(f"Dataset: {workspace.station_count} stations in {len(workspace.data)} files")
+
+        results = {}
+        os.chdir(root)
+        try:
+            for bench in BENCHMARKS:
+                if args.filter and args.filter not in bench.name:
+                    continue
+
+                result = measure(bench, workspace, args.repeat)
+                results[bench.name] = result
+                print(
+                    f"{bench.name:<32} {result['seconds'] * 1000:10.1f} ms"
+                    f" {result['items_per_second'] or 0:12.0f} items/s"
+                    f" {result['peak_memory_bytes'] / 2**20:8.1f} MiB peak"
+                )
+        finally:
+            os.chdir(cwd)
+
+    report = {
+        "python": platform.python_version(),
+        "dataset": {
+            "firs": args.firs,
+            "files": args.files,
+            "stations": args.stations,
+            "real_data": real_data is not None,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+
+    regressions = []
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+    elif args.baseline.is_file():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("dataset") != report["dataset"]:
+            print("Warning: baseline was recorded with a different dataset")
+        regressions = compare(results, baseline["results"], args.threshold)
+
+    if regressions and args.fail_on_regression:
+        raise SystemExit(1)
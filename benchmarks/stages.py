@@ -0,0 +1,232 @@
+import shutil
+from datetime import date
+
+import datahub
+from benchmarks.runner import EXCLUDE_FOLDERS, Workspace, benchmark
+from benchmarks.synthetic import generate_vateud_page
+from datahub.exports.calendar_exporter import CalendarExporter
+from datahub.exports.data_exporter import DataExporter
+from datahub.exports.schedule_exporter import ScheduleExporter
+from datahub.exports.snapshot_exporter import SnapshotExporter
+from datahub.exports.topsky_exporter import TopskyExporter
+from datahub.exports.ts_exporter import TeamspeakExporter
+from datahub.exports.vateud_exporter import VateudExporter
+from datahub.loaders.data_loader import DataLoader
+from datahub.loaders.snapshot_loader import StationSnapshot
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.serializers import JSON_SERIALIZERS, TOML_SERIALIZERS, available, json_serializer
+from datahub.settings import JSON_INDENT, VALIDATION_CACHE
+from datahub.sorting.station_sorter import StationSorter
+from datahub.views.event_schedule import EVENT_RULES, EventSchedule
+from datahub.views.station import Station
+
+
+def _count(data) -> int:
+    return sum(len(ds.data) for ds in data)
+
+
+def _sorted_data(ws: Workspace):
+    return ws, StationSorter.sort(ws.fresh_data())
+
+
+def _warm_cache(ws: Workspace):
+    cache_file = ws.root / "bench_cache.json"
+    DataLoader.load(ws.data_dir, exclude_folders=EXCLUDE_FOLDERS, cache=ValidationCache(cache_file))
+    return ws, cache_file
+
+
+@benchmark("load")
+def load(ws: Workspace) -> int:
+    return _count(DataLoader.load(ws.data_dir, exclude_folders=EXCLUDE_FOLDERS))
+
+
+@benchmark("load/threads")
+def load_threads(ws: Workspace) -> int:
+    data = DataLoader.load(ws.data_dir, exclude_folders=EXCLUDE_FOLDERS, workers=4, pool="thread")
+    return _count(data)
+
+
+@benchmark("load/processes")
+def load_processes(ws: Workspace) -> int:
+    data = DataLoader.load(ws.data_dir, exclude_folders=EXCLUDE_FOLDERS, workers=4, pool="process")
+    return _count(data)
+
+
+@benchmark("load/cached", setup=_warm_cache)
+def load_cached(state) -> int:
+    ws, cache_file = state
+    data = DataLoader.load(
+        ws.data_dir, exclude_folders=EXCLUDE_FOLDERS, cache=ValidationCache(cache_file)
+    )
+    return _count(data)
+
+
+@benchmark("sort", setup=lambda ws: ws.fresh_data())
+def sort(data) -> int:
+    return _count(StationSorter.sort(data))
+
+
+@benchmark("export/data", setup=_sorted_data)
+def export_data(state) -> int:
+    ws, data = state
+    DataExporter.export(ws.api_dir, data, combine=True)
+    return _count(data)
+
+
+@benchmark("export/teamspeak", setup=_sorted_data)
+def export_teamspeak(state) -> int:
+    ws, data = state
+    TeamspeakExporter.export(ws.api_dir / "legacy/atc_station_mappings.json", data)
+    return _count(data)
+
+
+@benchmark("export/schedule", setup=_sorted_data)
+def export_schedule(state) -> int:
+    ws, data = state
+    ScheduleExporter.export(ws.api_dir / "legacy/schedule.json", data)
+    return _count(data)
+
+
+@benchmark("export/topsky", setup=_sorted_data)
+def export_topsky(state) -> int:
+    ws, data = state
+    TopskyExporter.export(
+        ws.api_dir / "topsky/TopSkyCPDLC.txt", data, ws.data_dir / "topsky/cpdlcMap.json"
+    )
+    return _count(data)
+
+
+@benchmark("export/snapshot", setup=_sorted_data)
+def export_snapshot(state) -> int:
+    ws, data = state
+    SnapshotExporter.export(ws.api_dir / "stations.snapshot", data)
+    return _count(data)
+
+
+def _combined_outputs(ws: Workspace):
+    data = StationSorter.sort(ws.fresh_data())
+    DataExporter.export_combined(ws.api_dir, data)
+    SnapshotExporter.export(ws.api_dir / "stations.snapshot", data)
+    logons = [station.logon for ds in data for station in ds.data]
+    return ws, logons[:: max(1, len(logons) // 100)]
+
+
+@benchmark("cold-start/stations.json", setup=_combined_outputs)
+def cold_start_json(state) -> int:
+    """what a consumer of stations.json pays on every restart for a few lookups"""
+    ws, logons = state
+    stations = {
+        station["logon"]: Station.from_trusted(station)
+        for station in json_serializer().loads((ws.api_dir / "stations.json").read_bytes())
+    }
+    return sum(logon in stations for logon in logons)
+
+
+@benchmark("cold-start/snapshot", setup=_combined_outputs)
+def cold_start_snapshot(state) -> int:
+    ws, logons = state
+    with StationSnapshot(ws.api_dir / "stations.snapshot") as snapshot:
+        return sum(snapshot.get(logon) is not None for logon in logons)
+
+
+def _event_schedules(ws: Workspace):
+    rules = []
+    for i in range(100):
+        booking = [f"ED{i:02d}"]
+        rules.extend([
+            {"day": str(i % 7 + 1), "booking": booking},
+            {
+                "rule": "every_X_days",
+                "one_date": "2025-01-01",
+                "days": str(i + 1),
+                "booking": booking,
+            },
+            {
+                "rule": "every_X_day_in_month",
+                "day_of_week": i % 7 + 1,
+                "number_day_in_month": i % 4,
+                "booking": booking,
+            },
+        ])
+
+    return ws, [EventSchedule(source="synthetic.json", rules=EVENT_RULES.validate_python(rules))]
+
+
+@benchmark("export/calendar", setup=_event_schedules)
+def export_calendar(state) -> int:
+    ws, schedules = state
+    CalendarExporter.export(ws.api_dir / "event_calendar.json", schedules, date(2026, 1, 1))
+    return sum(len(schedule.rules) for schedule in schedules)
+
+
+def _vateud_page(ws: Workspace) -> str:
+    page = ws.root / "vateud8.html"
+    if not page.is_file():
+        generate_vateud_page(page, [station.logon for ds in ws.data for station in ds.data])
+    return page.read_text(encoding="utf-8")
+
+
+@benchmark("vateud/parse-bs4", setup=_vateud_page)
+def vateud_parse_bs4(page: str) -> int:
+    return len(VateudExporter._get_vateud_stations(page, VateudExporter.exclude_rules()))
+
+
+@benchmark("vateud/parse-lxml", setup=_vateud_page)
+def vateud_parse_lxml(page: str) -> int:
+    return len(list(VateudExporter._parse_vateud_stations(page)))
+
+
+def _contents(suffix: str):
+    def setup(ws: Workspace) -> list[bytes]:
+        return [path.read_bytes() for path in sorted(ws.data_dir.rglob(f"*{suffix}"))]
+
+    return setup
+
+
+def _station_dicts(ws: Workspace) -> list[list[dict]]:
+    return [[station.to_dict() for station in ds.data] for ds in ws.data]
+
+
+def _register_serializers():
+    """compares every installed serializer backend on the files of the workspace"""
+    for name, serializer in available(JSON_SERIALIZERS).items():
+
+        @benchmark(f"serializers/json-load/{name}", setup=_contents(".json"))
+        def json_load(contents: list[bytes], serializer=serializer) -> int:
+            return sum(len(serializer.loads(content)) for content in contents)
+
+        @benchmark(f"serializers/json-dump/{name}", setup=_station_dicts)
+        def json_dump(files: list[list[dict]], serializer=serializer) -> int:
+            for stations in files:
+                serializer.dumps(stations, indent=JSON_INDENT, ensure_ascii=False)
+            return sum(len(stations) for stations in files)
+
+    for name, serializer in available(TOML_SERIALIZERS).items():
+
+        @benchmark(f"serializers/toml-load/{name}", setup=_contents(".toml"))
+        def toml_load(contents: list[bytes], serializer=serializer) -> int:
+            return sum(len(serializer.loads(content)["stations"]) for content in contents)
+
+
+_register_serializers()
+
+
+def _cold_combine(ws: Workspace):
+    """drops the caches and outputs of previous runs, so every repetition parses and writes all"""
+    shutil.rmtree(ws.root / VALIDATION_CACHE.parent, ignore_errors=True)
+    shutil.rmtree(ws.api_dir, ignore_errors=True)
+    return ws
+
+
+@benchmark("combine_data", setup=_cold_combine)
+def combine_data(ws: Workspace) -> int:
+    # combine_data works on data/ and api/ relative to the working directory (the workspace)
+    datahub.combine_data()
+    return ws.station_count
+
+
+@benchmark("combine_data/cached")
+def combine_data_cached(ws: Workspace) -> int:
+    """repeated run with a warm validation cache and unchanged outputs"""
+    datahub.combine_data()
+    return ws.station_count
@@ -0,0 +1,127 @@
+import json
+import random
+import shutil
+import string
+from pathlib import Path
+
+import toml
+
+from datahub.validators.logon import LOGON_SUFFIXES
+from datahub.views.schedules import MIL_SCHEDULE, SCHEDULE_TYPES
+
+# MIL is derived from the ET logons (the synthetic prefixes include some), stations cannot name it
+STATION_SCHEDULE_TYPES = [schedule for schedule in SCHEDULE_TYPES if schedule != MIL_SCHEDULE]
+
+
+def generate_dataset(
+    target_dir: Path | str,
+    firs: int,
+    files: int,
+    stations: int,
+    real_data_dir: Path | str | None = "data",
+    seed: int = 0,
+) -> int:
+    """
+    Generates a synthetic data directory with firs FIR folders, each holding files station files
+    with stations stations. JSON and TOML files alternate. If real_data_dir is given, its FIR
+    folders and the topsky mapping are copied next to the synthetic ones.
+
+    Returns the number of generated synthetic stations.
+    """
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+
+    if real_data_dir is not None:
+        for folder in Path(real_data_dir).iterdir():
+            if folder.is_dir() and folder.name != "event_schedules":
+                shutil.copytree(folder, target_dir / folder.name, dirs_exist_ok=True)
+
+    # stations with a CPDLC login need a prefix known to the TopSky callsign mapping
+    cpdlc_mapping = target_dir / "topsky" / "cpdlcMap.json"
+    if not cpdlc_mapping.is_file():
+        cpdlc_mapping.parent.mkdir(exist_ok=True)
+        cpdlc_mapping.write_text(json.dumps({"ESYN": "SYNTHETIC RADAR CTR"}), encoding="utf-8")
+    cpdlc_prefixes = sorted(json.loads(cpdlc_mapping.read_text(encoding="utf-8")))
+
+    count = 0
+    for fir in range(firs):
+        fir_dir = target_dir / f"syn{fir:03d}"
+        fir_dir.mkdir(exist_ok=True)
+
+        for file_index in range(files):
+            file_stations = [
+                _station(rng, f"{fir:03d}{file_index:03d}{i:04d}", cpdlc_prefixes)
+                for i in range(stations)
+            ]
+            count += len(file_stations)
+
+            if file_index % 2 == 0:
+                with (fir_dir / f"file{file_index:03d}.json").open("w", encoding="utf-8") as f:
+                    json.dump(file_stations, f, indent=4, ensure_ascii=False)
+            else:
+                with (fir_dir / f"file{file_index:03d}.toml").open("w", encoding="utf-8") as f:
+                    toml.dump({"stations": file_stations}, f)
+
+    return count
+
+
+def _station(rng: random.Random, unique: str, cpdlc_prefixes: list[str]) -> dict:
+    cpdlc = rng.random() < 0.1
+
+    if cpdlc:
+        prefix = rng.choice(cpdlc_prefixes)
+    else:
+        prefix = "E" + "".join(rng.choices(string.ascii_uppercase, k=3))
+    # 25 kHz steps are always valid 8.33 kHz channels
+    frequency = 118000 + rng.randrange(0, 19975, 25)
+
+    station = {
+        "logon": f"{prefix}_{unique}_{rng.choice(LOGON_SUFFIXES)}",
+        "frequency": f"{frequency // 1000}.{frequency % 1000:03d}",
+        "abbreviation": "".join(rng.choices(string.ascii_uppercase, k=3)),
+        "description": f"Synthetic station {unique}",
+    }
+
+    if rng.random() < 0.3:
+        station["schedule_show_always"] = [rng.choice(STATION_SCHEDULE_TYPES)]
+    if rng.random() < 0.3:
+        station["schedule_show_booked"] = rng.sample(STATION_SCHEDULE_TYPES, k=2)
+    if rng.random() < 0.5:
+        station["relevant_airports"] = [prefix]
+    if rng.random() < 0.2:
+        station["gcap_status"] = rng.choice(["AFIS", "1", "2"])
+    if cpdlc:
+        station["cpdlc_login"] = prefix
+
+    return station
+
+
+def generate_vateud_page(target_file: Path | str, logons: list[str], seed: int = 0):
+    """
+    Writes a page shaped like the VATEUD station list (second table, five columns per row)
+    listing the given logons mixed with ATIS and foreign stations, which are filtered out.
+    """
+    rng = random.Random(seed)
+    rows = []
+
+    for logon in logons:
+        country_id = "2" if rng.random() < 0.8 else str(rng.randint(3, 30))
+        rows.append((country_id, logon, f"Station {logon}", "118.000", logon[:4]))
+
+        if rng.random() < 0.2:
+            rows.append(("2", f"{logon[:4]}_ATIS", "ATIS", "123.125", logon[:4]))
+        if rng.random() < 0.2:
+            rows.append(("2", f"L{logon[1:]}", "Foreign station", "119.000", "LXXX"))
+
+    lines = [
+        "<!DOCTYPE html>",
+        "<html><head><title>VATEUD stations</title></head><body>",
+        "<table><tr><td>Division overview</td></tr></table>",
+        "<table>",
+        "<tr><th>Country</th><th>Callsign</th><th>Name</th><th>Frequency</th><th>Region</th></tr>",
+    ]
+    lines.extend("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    lines.append("</table></body></html>")
+
+    Path(target_file).write_text("\n".join(lines), encoding="utf-8")
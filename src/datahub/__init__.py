@@ -1,41 +1,45 @@
-from pathlib import Path
+"""
+Programmatic entry points, the command line interface lives in datahub.cli.
 
-from datahub.exports.data_exporter import DataExporter
-from datahub.exports.schedule_exporter import ScheduleExporter
-from datahub.exports.topsky_exporter import TopskyExporter
-from datahub.exports.ts_exporter import TeamspeakExporter
-from datahub.exports.vateud_exporter import VateudExporter
-from datahub.loaders.data_loader import DataLoader
-from datahub.sorting.station_sorter import StationSorter
+The implementations are imported on first use to keep the package import cheap.
+"""
 
-DATA_DIR = Path("data/")
-API_DIR = Path("api/")
+from datahub.instrumentation import instrumented
+from datahub.settings import API_DIR, DATA_DIR
 
 
-def check_data():
-    DataLoader.load(DATA_DIR, exclude_folders={"event_schedules", "topsky"})
+@instrumented
+def check_data(data_dir=DATA_DIR, **kwargs):
+    from datahub import commands
 
+    commands.check(data_dir, **kwargs)
 
-def combine_data():
-    data = DataLoader.load(DATA_DIR, exclude_folders={"event_schedules", "topsky"})
 
-    data = StationSorter.sort(data)
+@instrumented
+def combine_data(
+    incremental: bool = False,
+    changed_files: set[str] | None = None,
+    data_dir=DATA_DIR,
+    api_dir=API_DIR,
+    **kwargs,
+):
+    """builds all API outputs, see datahub.commands.combine"""
+    from datahub import commands
 
-    DataExporter.export(API_DIR, data, combine=True)
-    TeamspeakExporter.export(API_DIR / "legacy/atc_station_mappings.json", data)
-    ScheduleExporter.export(API_DIR / "legacy/schedule.json", data)
-    TopskyExporter.export(API_DIR / "topsky/TopSkyCPDLC.txt", data)
+    commands.combine(
+        data_dir, api_dir, incremental=incremental, changed_files=changed_files, **kwargs
+    )
 
 
-def sort_data():
-    data = DataLoader.load(DATA_DIR, exclude_folders={"event_schedules", "topsky"})
+@instrumented
+def sort_data(data_dir=DATA_DIR, **kwargs):
+    from datahub import commands
 
-    data = StationSorter.sort(data)
+    commands.sort(data_dir, **kwargs)
 
-    DataExporter.export(DATA_DIR, data)
 
+@instrumented
+def vateud(data_dir=DATA_DIR, **kwargs):
+    from datahub import commands
 
-def vateud():
-    data = DataLoader.load(DATA_DIR, exclude_folders={"event_schedules", "topsky"})
-
-    VateudExporter.export("vateud.csv", data)
+    commands.vateud(data_dir, **kwargs)
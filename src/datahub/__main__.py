@@ -0,0 +1,3 @@
+from datahub.cli import main
+
+main()
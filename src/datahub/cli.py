@@ -0,0 +1,210 @@
+import argparse
+import contextlib
+import os
+import sys
+from pathlib import Path
+
+from datahub.instrumentation import PROFILE_ENV, REPORT_ENV, instrumentation
+from datahub.settings import API_DIR, DATA_DIR, EXPORTERS, VATEUD_TTL
+
+# kept free of heavy imports, the commands (and their exporters) are imported once the
+# arguments are parsed, so that --help and argument errors return immediately
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--data-dir", type=Path, default=DATA_DIR, help="station data (default: %(default)s)"
+    )
+    common.add_argument("--workers", type=int, help="parse the files concurrently")
+    common.add_argument("--pool", choices=("thread", "process"), default="thread")
+    common.add_argument(
+        "--no-cache", dest="use_cache", action="store_false", help="ignore the validation cache"
+    )
+    common.add_argument(
+        "--report",
+        type=Path,
+        default=os.environ.get(REPORT_ENV),
+        help=f"write a JSON report of all stages (env: {REPORT_ENV})",
+    )
+    common.add_argument(
+        "--profile",
+        type=Path,
+        default=os.environ.get(PROFILE_ENV),
+        help=f"write a cProfile dump, pyinstrument for .html files (env: {PROFILE_ENV})",
+    )
+
+    parser = argparse.ArgumentParser(prog="datahub", description="VATGER DataHub tooling")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("check", parents=[common], help="validate the station data")
+
+    combine = subparsers.add_parser("combine", parents=[common], help="build the API outputs")
+    combine.add_argument(
+        "--api-dir", type=Path, default=API_DIR, help="output folder (default: %(default)s)"
+    )
+    combine.add_argument(
+        "--only",
+        dest="exporters",
+        nargs="+",
+        choices=EXPORTERS,
+        metavar="EXPORTER",
+        help=f"run the given exporters instead of the default ones ({', '.join(EXPORTERS)})",
+    )
+    combine.add_argument(
+        "--incremental", action="store_true", help="only rewrite outputs whose inputs changed"
+    )
+    combine.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="only inspect files changed since the given git revision (implies --incremental)",
+    )
+
+    subparsers.add_parser("sort", parents=[common], help="sort and normalize the station files")
+
+    watch = subparsers.add_parser(
+        "watch", parents=[common], help="revalidate changed files continuously"
+    )
+    watch.add_argument("--api-dir", type=Path, help="also rebuild the affected outputs here")
+    watch.add_argument(
+        "--only",
+        dest="exporters",
+        nargs="+",
+        choices=EXPORTERS,
+        metavar="EXPORTER",
+        help="only rebuild the outputs of the given exporters",
+    )
+    watch.add_argument("--interval", type=float, default=0.5, help="seconds between scans")
+    watch.add_argument(
+        "--poll", action="store_true", help="always poll, even if watchdog is installed"
+    )
+
+    serve = subparsers.add_parser("serve", parents=[common], help="serve station lookups over HTTP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument(
+        "--interval", type=float, default=1.0, help="seconds between checks for changed files"
+    )
+
+    vateud = subparsers.add_parser("vateud", parents=[common], help="export the VATEUD csv")
+    vateud.add_argument(
+        "--output",
+        type=Path,
+        default=Path("vateud"),
+        help="output file, the suffix of the format is added if it has none and replaced if "
+        "several formats are written (default: vateud.<format>)",
+    )
+    vateud.add_argument(
+        "--format",
+        dest="formats",
+        nargs="+",
+        choices=("csv", "json"),
+        default=["csv"],
+        help="output formats (default: csv)",
+    )
+    vateud.add_argument(
+        "--ttl",
+        type=float,
+        default=VATEUD_TTL,
+        help="seconds a fetched page is reused without revalidation (default: %(default)s)",
+    )
+    vateud.add_argument(
+        "--offline", action="store_true", help="only use the cached page, never fetch"
+    )
+    vateud.add_argument(
+        "--snapshot", type=Path, help="read the VATEUD page from this file instead of fetching"
+    )
+
+    return parser
+
+
+def run(args: argparse.Namespace):
+    from datahub import commands
+
+    common = {
+        "data_dir": args.data_dir,
+        "workers": args.workers,
+        "pool": args.pool,
+        "use_cache": args.use_cache,
+    }
+
+    if args.command == "check":
+        commands.check(**common)
+    elif args.command == "combine":
+        changed_files = None
+        if args.changed_since:
+            from datahub.exports.build_manifest import changed_files_from_git
+
+            changed_files = changed_files_from_git(args.data_dir, args.changed_since)
+
+        commands.combine(
+            api_dir=args.api_dir,
+            exporters=args.exporters,
+            incremental=args.incremental or changed_files is not None,
+            changed_files=changed_files,
+            **common,
+        )
+    elif args.command == "sort":
+        commands.sort(**common)
+    elif args.command == "watch":
+        from datahub.watch import DataWatcher
+
+        watcher = DataWatcher(
+            args.data_dir,
+            args.api_dir,
+            args.exporters,
+            workers=args.workers,
+            pool=args.pool,
+            cache=commands.validation_cache(args.use_cache),
+        )
+        with contextlib.suppress(KeyboardInterrupt):
+            watcher.watch(args.interval, args.poll)
+    elif args.command == "serve":
+        from datahub.serve import serve
+
+        with contextlib.suppress(KeyboardInterrupt):
+            serve(
+                args.data_dir,
+                args.host,
+                args.port,
+                args.interval,
+                workers=args.workers,
+                pool=args.pool,
+                cache=commands.validation_cache(args.use_cache),
+            )
+    elif args.command == "vateud":
+        from datahub.loaders.http_cache import OfflineError
+
+        try:
+            commands.vateud(
+                output=args.output,
+                formats=args.formats,
+                ttl=args.ttl,
+                offline=args.offline,
+                snapshot=args.snapshot,
+                **common,
+            )
+        except OfflineError as e:
+            sys.exit(f"datahub vateud: error: {e}")
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+
+    with instrumentation.session(args.command, args.report, args.profile):
+        run(args)
+
+
+def _legacy(command: str):
+    def entry_point():
+        main([command, *sys.argv[1:]])
+
+    entry_point.__name__ = f"{command}_main"
+    return entry_point
+
+
+# entry points of the former project.scripts
+data_check = _legacy("check")
+data_combine = _legacy("combine")
+data_sort = _legacy("sort")
+data_vateud = _legacy("vateud")
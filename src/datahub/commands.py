@@ -0,0 +1,303 @@
+"""
+Implementation of the CLI commands.
+
+Exporters are imported inside the commands which use them, so that e.g. check does not pay for
+importing requests and bs4 (needed by the VateudExporter only).
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from datahub.instrumentation import instrumentation
+from datahub.loaders.data_loader import DataLoader, PoolMode
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.settings import (
+    API_DIR,
+    CPDLC_MAPPING,
+    DATA_DIR,
+    DEFAULT_EXPORTERS,
+    EVENT_SCHEDULES,
+    EXCLUDE_FOLDERS,
+    HTTP_CACHE,
+    VALIDATION_CACHE,
+    VATEUD_TTL,
+)
+from datahub.views.data_source import DataSource
+
+if TYPE_CHECKING:
+    from datahub.exports.build_manifest import BuildManifest
+    from datahub.exports.output_writer import OutputWriter
+    from datahub.views.event_schedule import EventSchedule
+
+
+def load(
+    data_dir: Path | str = DATA_DIR,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    cache: ValidationCache | None = None,
+    all_errors: bool = False,
+) -> list[DataSource]:
+    return DataLoader.load(
+        data_dir,
+        exclude_folders=set(EXCLUDE_FOLDERS),
+        workers=workers,
+        pool=pool,
+        cache=cache,
+        all_errors=all_errors,
+    )
+
+
+def load_sorted(
+    data_dir: Path | str = DATA_DIR,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    cache: ValidationCache | None = None,
+) -> list[DataSource]:
+    from datahub.sorting.station_sorter import StationSorter
+
+    data = load(data_dir, workers, pool, cache)
+
+    with instrumentation.stage("sort", items=sum(len(ds.data) for ds in data)):
+        return StationSorter.sort(data)
+
+
+def load_event_schedules(data_dir: Path | str = DATA_DIR) -> "list[EventSchedule]":
+    from datahub.loaders.event_schedule_loader import EventScheduleLoader
+
+    schedule_dir = Path(data_dir) / EVENT_SCHEDULES
+    if not schedule_dir.is_dir():
+        return []
+
+    return EventScheduleLoader.load(schedule_dir)
+
+
+def validation_cache(enabled: bool = True) -> ValidationCache | None:
+    return ValidationCache(VALIDATION_CACHE) if enabled else None
+
+
+def check(
+    data_dir: Path | str = DATA_DIR,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    use_cache: bool = True,
+):
+    from datahub.validators.consistency import (
+        find_conflicts,
+        find_dangling_bookings,
+        report_conflicts,
+        report_dangling_bookings,
+    )
+    from datahub.views.logon_index import LogonIndex
+
+    data = load(data_dir, workers, pool, validation_cache(use_cache), all_errors=True)
+    event_schedules = load_event_schedules(data_dir)
+
+    with instrumentation.stage("consistency", items=sum(len(ds.data) for ds in data)):
+        conflicts = find_conflicts(data)
+        dangling = find_dangling_bookings(event_schedules, LogonIndex.from_data(data))
+
+    report_conflicts(conflicts, data_dir)
+    report_dangling_bookings(dangling, Path(data_dir) / EVENT_SCHEDULES)
+
+
+def combine(
+    data_dir: Path | str = DATA_DIR,
+    api_dir: Path | str = API_DIR,
+    exporters: list[str] | None = None,
+    incremental: bool = False,
+    changed_files: set[str] | None = None,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    use_cache: bool = True,
+):
+    """
+    Builds the API outputs of the selected exporters (DEFAULT_EXPORTERS if omitted).
+
+    In incremental mode only outputs whose inputs changed since the last build are rewritten,
+    changed_files (relative to data_dir) limits which sources are inspected at all.
+    """
+    from datahub.exports.build_manifest import BuildManifest
+
+    data = load_sorted(data_dir, workers, pool, validation_cache(use_cache))
+
+    manifest = (
+        BuildManifest(BuildManifest.path_for(api_dir), api_dir, changed_files)
+        if incremental
+        else None
+    )
+
+    event_schedules = load_event_schedules(data_dir)
+
+    writer = export(
+        data, api_dir, Path(data_dir) / CPDLC_MAPPING, exporters, manifest, event_schedules
+    )
+
+    if manifest is not None:
+        manifest.save()
+
+    print(f"OutputWriter: {writer.summary()}")
+
+
+def export(
+    data: list[DataSource],
+    api_dir: Path | str,
+    cpdlc_mapping: Path | str,
+    exporters: list[str] | None = None,
+    manifest: "BuildManifest | None" = None,
+    event_schedules: "list[EventSchedule] | None" = None,
+) -> "OutputWriter":
+    """
+    Runs the selected exporters (DEFAULT_EXPORTERS if omitted) on sorted data, returns the
+    writer holding the changed files.
+
+    With a manifest, only outputs whose inputs changed are rebuilt. Saving the manifest is left
+    to the caller. The event calendar (it depends on the current date) and the expanded
+    bookings are written, if changed, whenever event schedules are given.
+    """
+    from datahub.exports.airport_exporter import AirportExporter, AirportVisitor
+    from datahub.exports.data_exporter import CombinedDataVisitor, DataVisitor
+    from datahub.exports.output_writer import OutputWriter
+    from datahub.exports.pipeline import ExportPipeline
+    from datahub.exports.schedule_exporter import ScheduleExporter, ScheduleVisitor
+    from datahub.exports.snapshot_exporter import SnapshotVisitor
+    from datahub.exports.topsky_exporter import TopskyExporter, TopskyVisitor
+    from datahub.exports.ts_exporter import TeamspeakExporter, TeamspeakVisitor
+
+    api_dir = Path(api_dir)
+    selected = set(exporters or DEFAULT_EXPORTERS)
+
+    def is_stale(output, projection, extra_inputs=()):
+        return manifest is None or manifest.is_stale(output, data, projection, extra_inputs)
+
+    # all exporters share a single pass over the stations
+    pipeline = ExportPipeline()
+    writer = OutputWriter()
+
+    changed_sources = _changed_sources(data, manifest) if "data" in selected else []
+    if changed_sources:
+        pipeline.register(DataVisitor(api_dir, sources=changed_sources, writer=writer))
+
+    if "stations" in selected and is_stale("stations.json", _station_dict):
+        pipeline.register(CombinedDataVisitor(api_dir, writer=writer))
+
+    ts_path = "legacy/atc_station_mappings.json"
+    if "teamspeak" in selected and is_stale(ts_path, TeamspeakExporter.projection):
+        pipeline.register(TeamspeakVisitor(api_dir / ts_path, writer))
+
+    schedule_path = "legacy/schedule.json"
+    if "schedule" in selected and is_stale(schedule_path, ScheduleExporter.projection):
+        pipeline.register(ScheduleVisitor(api_dir / schedule_path, writer))
+
+    airport_path = "legacy/airport_stations.json"
+    if "airports" in selected and is_stale(airport_path, AirportExporter.projection):
+        pipeline.register(AirportVisitor(api_dir / airport_path, writer))
+
+    topsky_path = "topsky/TopSkyCPDLC.txt"
+    if "topsky" in selected and is_stale(
+        topsky_path, TopskyExporter.projection, extra_inputs=[cpdlc_mapping]
+    ):
+        pipeline.register(TopskyVisitor(api_dir / topsky_path, cpdlc_mapping, writer))
+
+    snapshot_path = "stations.snapshot"
+    if "snapshot" in selected and is_stale(snapshot_path, _station_dict):
+        pipeline.register(SnapshotVisitor(api_dir / snapshot_path, writer))
+
+    pipeline.run(data)
+
+    if event_schedules is not None:
+        _export_events(data, api_dir, selected, event_schedules, writer)
+
+    return writer
+
+
+def _changed_sources(data: list[DataSource], manifest: "BuildManifest | None") -> list[str]:
+    """data sources whose own output file has to be rebuilt"""
+    if manifest is None:
+        return [ds.source for ds in data]
+
+    return [ds.source for ds in data if manifest.is_stale(ds.source, [ds], _station_dict)]
+
+
+def _station_dict(station) -> dict:
+    """manifest projection of the outputs holding whole stations, Station or StationView"""
+    return station.to_dict()
+
+
+def _export_events(
+    data: list[DataSource],
+    api_dir: Path,
+    selected: set[str],
+    event_schedules: "list[EventSchedule]",
+    writer: "OutputWriter",
+):
+    """writes the event calendar and the expanded bookings, if selected"""
+    if "calendar" in selected:
+        from datahub.exports.calendar_exporter import CalendarExporter
+
+        with instrumentation.stage("export/CalendarExporter"):
+            CalendarExporter.export(
+                api_dir / "event_calendar.json",
+                event_schedules,
+                datetime.now(UTC).date(),
+                writer=writer,
+            )
+
+    if "bookings" in selected:
+        from datahub.exports.booking_exporter import BookingExporter
+        from datahub.views.logon_index import LogonIndex
+
+        with instrumentation.stage("export/BookingExporter"):
+            BookingExporter.export(
+                api_dir / "event_bookings.json",
+                event_schedules,
+                LogonIndex.from_data(data),
+                writer=writer,
+            )
+
+
+def sort(
+    data_dir: Path | str = DATA_DIR,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    use_cache: bool = True,
+):
+    from datahub.exports.data_exporter import DataExporter
+    from datahub.exports.output_writer import OutputWriter
+
+    cache = validation_cache(use_cache)
+    data = load_sorted(data_dir, workers, pool, cache)
+
+    # the sorted files are known to be valid, later runs load them without validation
+    writer = OutputWriter()
+    DataExporter.export(data_dir, data, cache=cache, writer=writer)
+
+    print(f"OutputWriter: {writer.summary()}")
+
+
+def vateud(
+    data_dir: Path | str = DATA_DIR,
+    output: Path | str = "vateud",
+    formats: list[str] | None = None,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    use_cache: bool = True,
+    ttl: float = VATEUD_TTL,
+    offline: bool = False,
+    snapshot: Path | str | None = None,
+):
+    """
+    Compares the stations with the VATEUD station list (fetched at most every ttl seconds) and
+    writes the differences in the given formats (csv by default). offline only uses the cached
+    page, snapshot reads the page from a file instead.
+    """
+    from datahub.exports.vateud_exporter import VateudExporter
+    from datahub.loaders.http_cache import HttpCache
+
+    data = load(data_dir, workers, pool, validation_cache(use_cache))
+    http_cache = HttpCache(HTTP_CACHE, ttl=ttl, offline=offline)
+
+    with instrumentation.stage("export/VateudExporter", items=sum(len(ds.data) for ds in data)):
+        VateudExporter.export(
+            output, data, http_cache=http_cache, snapshot=snapshot, formats=formats or ["csv"]
+        )
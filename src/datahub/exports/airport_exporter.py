@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.serializers import json_serializer
+from datahub.settings import JSON_INDENT
+from datahub.views.airport_index import AirportIndex
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class AirportExporter:
+    @staticmethod
+    def projection(station: Station) -> list | None:
+        """fields of a station the index depends on, None if the station is on no airport"""
+        if not station.relevant_airports:
+            return None
+
+        return [station.logon, station.relevant_airports]
+
+    @staticmethod
+    def export(file_path: Path | str, data: list[DataSource], writer: OutputWriter | None = None):
+        ExportPipeline([AirportVisitor(file_path, writer)]).run(data)
+
+
+class AirportVisitor(StationVisitor):
+    def __init__(self, file_path: Path | str, writer: OutputWriter | None = None):
+        self.file_path = Path(file_path)
+        self.writer = writer or OutputWriter()
+        self.index = AirportIndex()
+
+    def visit(self, source: DataSource, station: Station):
+        self.index.add(station)
+
+    def finish(self):
+        airport_stations = self.index.to_dict()
+
+        print(f"AirportExporter: exported {len(airport_stations['airports'])} airports")
+
+        with self.writer.open(self.file_path) as output_json_file:
+            json_serializer().dump(airport_stations, output_json_file, indent=JSON_INDENT)
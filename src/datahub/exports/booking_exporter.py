@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from datahub.exports.output_writer import OutputWriter
+from datahub.serializers import json_serializer
+from datahub.settings import JSON_INDENT
+from datahub.views.event_schedule import EventSchedule
+from datahub.views.logon_index import LogonIndex
+
+
+class BookingExporter:
+    """Resolves the booking entries of all event schedules to the logons they stand for"""
+
+    @staticmethod
+    def bookings(schedules: list[EventSchedule], index: LogonIndex) -> dict:
+        expanded: dict[str, dict[str, list[str]]] = {}
+
+        for schedule in schedules:
+            entries = sorted({entry for rule in schedule.rules for entry in rule.booking})
+            expanded[Path(schedule.source).stem] = {
+                entry: index.resolve(entry) for entry in entries
+            }
+
+        return expanded
+
+    @staticmethod
+    def export(
+        file_path: Path | str,
+        schedules: list[EventSchedule],
+        index: LogonIndex,
+        writer: OutputWriter | None = None,
+    ):
+        writer = writer or OutputWriter()
+        bookings = BookingExporter.bookings(schedules, index)
+
+        print(f"BookingExporter: exported {sum(len(b) for b in bookings.values())} booking entries")
+
+        with writer.open(file_path) as f:
+            json_serializer().dump(bookings, f, indent=JSON_INDENT)
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+import subprocess
+from collections.abc import Callable, Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from datahub.settings import BUILD_MANIFEST
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+logger = logging.getLogger(__name__)
+
+Projection = Callable[[Station], Any]
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+# sources (relative to the package) whose code defines the format of the outputs
+OUTPUT_SOURCES = (
+    "exports",
+    "serializers.py",
+    "settings.py",
+    "loaders/snapshot_loader.py",
+    "views/station.py",
+)
+
+
+class BuildManifest:
+    """
+    Records which input files and stations feed each generated output.
+
+    For every output the manifest stores, per input file, the logons of the contributing stations
+    and a digest over the station fields the output depends on (the exporter's projection). An
+    output only has to be rebuilt if one of these contributions changed. The whole manifest is
+    discarded as soon as the code of an exporter or serializer changes.
+    """
+
+    def __init__(
+        self,
+        manifest_path: Path | str,
+        output_dir: Path | str,
+        changed_files: Iterable[str] | None = None,
+    ):
+        """
+        changed_files: sources (relative to the data directory) which changed since the last
+        build. If omitted, the contributions of all sources are recomputed.
+        """
+        self.manifest_path = Path(manifest_path)
+        self.output_dir = Path(output_dir)
+        self.changed_files = set(changed_files) if changed_files is not None else None
+        self.fingerprint = BuildManifest.output_fingerprint()
+        self.outputs: dict[str, dict[str, dict]] = {}
+        self._pending: dict[str, dict[str, dict]] = {}
+
+        self._read()
+
+    def is_stale(
+        self,
+        output: str,
+        data: list[DataSource],
+        projection: Projection,
+        extra_inputs: Iterable[Path] = (),
+    ) -> bool:
+        """
+        Checks whether the output (relative to the output directory) has to be rebuilt.
+
+        extra_inputs are additional files the output depends on, they are compared by content.
+        """
+        previous = self.outputs.get(output)
+        current = {}
+
+        for ds in data:
+            if (
+                previous is not None
+                and self.changed_files is not None
+                and ds.source not in self.changed_files
+            ):
+                if ds.source in previous:
+                    current[ds.source] = previous[ds.source]
+                continue
+
+            contribution = BuildManifest.contribution(ds.data, projection)
+            if contribution is not None:
+                current[ds.source] = contribution
+
+        for path in extra_inputs:
+            current[str(path)] = {"digest": BuildManifest._digest(Path(path).read_bytes())}
+
+        self._pending[output] = current
+
+        return previous != current or not (self.output_dir / output).is_file()
+
+    @staticmethod
+    def path_for(output_dir: Path | str) -> Path:
+        """manifest location for an output directory, every output directory has its own"""
+        key = hashlib.sha256(str(Path(output_dir).resolve()).encode()).hexdigest()[:12]
+        return BUILD_MANIFEST.with_name(f"{BUILD_MANIFEST.stem}-{key}{BUILD_MANIFEST.suffix}")
+
+    @staticmethod
+    @cache
+    def output_fingerprint() -> str:
+        """
+        Hash over the source code of the exporters and serializers.
+
+        The files are read instead of inspected, importing every exporter would pull in the
+        dependencies of the VateudExporter.
+        """
+        digest = hashlib.sha256()
+
+        for source in OUTPUT_SOURCES:
+            path = _PACKAGE_DIR / source
+            for file_path in sorted(path.glob("*.py")) if path.is_dir() else [path]:
+                digest.update(file_path.relative_to(_PACKAGE_DIR).as_posix().encode())
+                digest.update(file_path.read_bytes())
+
+        return digest.hexdigest()
+
+    def save(self):
+        """marks all checked outputs as built and writes the manifest"""
+        self.outputs.update(self._pending)
+        self._pending = {}
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.manifest_path.open("w", encoding="utf-8") as f:
+            json.dump({"fingerprint": self.fingerprint, "outputs": self.outputs}, f)
+
+    @staticmethod
+    def contribution(stations: list[Station], projection: Projection) -> dict | None:
+        """logons and digest of the stations feeding an output, None if no station does"""
+        logons = []
+        values = []
+
+        for station in stations:
+            value = projection(station)
+            if value is None:
+                continue
+
+            logons.append(station.logon)
+            values.append(value)
+
+        if not logons:
+            return None
+
+        return {
+            "digest": BuildManifest._digest(json.dumps(values, sort_keys=True).encode()),
+            "stations": logons,
+        }
+
+    @staticmethod
+    def _digest(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _read(self):
+        if not self.manifest_path.is_file():
+            return
+
+        try:
+            with self.manifest_path.open("r", encoding="utf-8") as f:
+                manifest_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable build manifest %s: %s", self.manifest_path, e)
+            return
+
+        # outputs written by another version of the exporters are rebuilt
+        if manifest_data.get("fingerprint") != self.fingerprint:
+            return
+
+        self.outputs = manifest_data.get("outputs", {})
+
+
+def changed_files_from_git(data_dir: Path | str, base: str = "HEAD") -> set[str]:
+    """
+    Lists the files below data_dir which differ from the given git revision, including untracked
+    files. The paths are relative to data_dir, matching DataSource.source.
+    """
+    data_dir = Path(data_dir)
+
+    commands = [
+        ["git", "diff", "--name-only", "--relative", base, "--", "."],
+        ["git", "ls-files", "--others", "--exclude-standard", "--", "."],
+    ]
+
+    changed = set()
+    for command in commands:
+        result = subprocess.run(command, cwd=data_dir, capture_output=True, text=True, check=True)
+        changed.update(Path(line).as_posix() for line in result.stdout.splitlines() if line)
+
+    return changed
@@ -0,0 +1,50 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+from datahub.exports.output_writer import OutputWriter
+from datahub.serializers import json_serializer
+from datahub.settings import JSON_INDENT
+from datahub.views.event_schedule import EventSchedule
+
+CALENDAR_DAYS = 365
+
+
+class CalendarExporter:
+    """
+    Precomputes the wanted bookings of all event schedules for the next days.
+
+    The calendar maps every date with bookings to the booking entries (logon prefixes) of every
+    schedule, so consumers do not have to evaluate the recurrence rules themselves.
+    """
+
+    @staticmethod
+    def calendar(schedules: list[EventSchedule], start: date, days: int = CALENDAR_DAYS) -> dict:
+        end = start + timedelta(days=days - 1)
+        dates: dict[str, dict[str, list[str]]] = {}
+
+        for schedule in schedules:
+            name = Path(schedule.source).stem
+            for day, bookings in schedule.wanted(start, end).items():
+                dates.setdefault(day.isoformat(), {})[name] = bookings
+
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "dates": dict(sorted(dates.items())),
+        }
+
+    @staticmethod
+    def export(
+        file_path: Path | str,
+        schedules: list[EventSchedule],
+        start: date,
+        days: int = CALENDAR_DAYS,
+        writer: OutputWriter | None = None,
+    ):
+        writer = writer or OutputWriter()
+        calendar = CalendarExporter.calendar(schedules, start, days)
+
+        print(f"CalendarExporter: exported {len(calendar['dates'])} days with bookings")
+
+        with writer.open(file_path) as f:
+            json_serializer().dump(calendar, f, indent=JSON_INDENT)
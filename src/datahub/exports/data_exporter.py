@@ -1,11 +1,15 @@
-import json
+from collections.abc import Iterable
 from pathlib import Path
 
-import toml
-
+from datahub.exports.json_stream import dump_array
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.serializers import json_serializer, toml_serializer
 from datahub.settings import JSON_INDENT
 from datahub.sorting.station_sorter import StationSorter
 from datahub.views.data_source import DataSource
+from datahub.views.station import Station
 
 
 class DataExporter:
@@ -15,43 +19,116 @@ class DataExporter:
         data: list[DataSource],
         combine: bool = False,
         target_format: str | None = None,
+        cache: ValidationCache | None = None,
+        writer: OutputWriter | None = None,
     ):
-        folder_path = Path(folder_path)
+        """
+        Writes every data source into its own file below folder_path.
 
-        combined_data = []
+        If a validation cache is given, the written files are registered in it as already
+        validated, so loading them again skips the validation.
+        """
+        writer = writer or OutputWriter()
+        pipeline = ExportPipeline([
+            DataVisitor(folder_path, target_format, cache=cache, writer=writer)
+        ])
 
-        for file in data:
-            original_path = Path(file.source)
-            file_path = folder_path / original_path
+        if combine:
+            pipeline.register(CombinedDataVisitor(folder_path, target_format, writer=writer))
 
-            if target_format:
-                file_path = file_path.with_suffix(f".{target_format}")
+        pipeline.run(data)
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def export_combined(
+        folder_path: str | Path,
+        data: list[DataSource],
+        target_format: str | None = None,
+        writer: OutputWriter | None = None,
+    ):
+        """exports all stations sorted into a single stations.json / stations.toml file"""
+        ExportPipeline([CombinedDataVisitor(folder_path, target_format, writer)]).run(data)
 
-            if combine:
-                combined_data.extend(file.data)
 
-            stations_data = [station.to_dict() for station in file.data]
+class DataVisitor(StationVisitor):
+    """writes every data source into its own file below folder_path"""
 
-            if file_path.suffix == ".json":
-                with file_path.open("w+", encoding="utf-8") as f:
-                    json.dump(stations_data, f, indent=JSON_INDENT, ensure_ascii=False)
-            elif file_path.suffix == ".toml":
-                with file_path.open("w+", encoding="utf-8") as f:
-                    toml.dump({"stations": stations_data}, f)
-            else:
-                msg = f"Unsupported file extension: {file_path.suffix}"
-                raise ValueError(msg)
+    def __init__(
+        self,
+        folder_path: str | Path,
+        target_format: str | None = None,
+        sources: Iterable[str] | None = None,
+        cache: ValidationCache | None = None,
+        writer: OutputWriter | None = None,
+    ):
+        """
+        sources: only export these data sources, all if omitted
+        cache: validation cache the written files are registered in
+        """
+        self.folder_path = Path(folder_path)
+        self.target_format = target_format
+        self.sources = set(sources) if sources is not None else None
+        self.cache = cache
+        self.writer = writer or OutputWriter()
 
-        if combine:
-            combined_path = folder_path / f"stations.{target_format or 'json'}"
+    def end_source(self, source: DataSource):
+        if self.sources is not None and source.source not in self.sources:
+            return
+
+        file_path = self.folder_path / Path(source.source)
+
+        if self.target_format:
+            file_path = file_path.with_suffix(f".{self.target_format}")
+
+        stations_data = [station.to_dict() for station in source.data]
 
-            combined_data = StationSorter.sort(combined_data)
-            serializable_data = [s.to_dict() for s in combined_data]
+        if file_path.suffix == ".json":
+            content = json_serializer().dumps(stations_data, indent=JSON_INDENT, ensure_ascii=False)
+        elif file_path.suffix == ".toml":
+            content = toml_serializer().dumps({"stations": stations_data})
+        else:
+            msg = f"Unsupported file extension: {file_path.suffix}"
+            raise ValueError(msg)
 
-            with combined_path.open("w+", encoding="utf-8") as f:
-                if (target_format or "json") == "json":
-                    json.dump(serializable_data, f, indent=JSON_INDENT, ensure_ascii=False)
-                else:
-                    toml.dump({"stations": serializable_data}, f)
+        self.writer.write_text(file_path, content)
+
+        if self.cache is not None:
+            content_hash = ValidationCache.content_hash(content.encode("utf-8"))
+            self.cache.put(file_path, content_hash, source.data)
+
+    def finish(self):
+        if self.cache is not None:
+            self.cache.save()
+
+
+class CombinedDataVisitor(StationVisitor):
+    """writes all stations sorted into a single stations.json / stations.toml file"""
+
+    def __init__(
+        self,
+        folder_path: str | Path,
+        target_format: str | None = None,
+        writer: OutputWriter | None = None,
+    ):
+        self.folder_path = Path(folder_path)
+        self.target_format = target_format
+        self.writer = writer or OutputWriter()
+        self.source_data: list[list[Station]] = []
+
+    def begin_source(self, source: DataSource):
+        self.source_data.append([])
+
+    def visit(self, source: DataSource, station: Station):
+        self.source_data[-1].append(station)
+
+    def finish(self):
+        combined_path = self.folder_path / f"stations.{self.target_format or 'json'}"
+
+        # the per-file lists are usually sorted already and only have to be merged
+        combined_data = StationSorter.imerge(self.source_data)
+
+        with self.writer.open(combined_path) as f:
+            if (self.target_format or "json") == "json":
+                # stream the stations to keep the memory usage flat for large datasets
+                dump_array((s.to_dict() for s in combined_data), f)
+            else:
+                f.write(toml_serializer().dumps({"stations": [s.to_dict() for s in combined_data]}))
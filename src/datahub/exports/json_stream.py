@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+from typing import TextIO
+
+from datahub.serializers import json_serializer
+from datahub.settings import JSON_INDENT
+
+
+def dump_array(
+    items: Iterable,
+    f: TextIO,
+    indent: int = JSON_INDENT,
+    ensure_ascii: bool = False,
+):
+    """
+    Writes items as a JSON array one element at a time.
+
+    The output is identical to json.dump(list(items), f, indent=indent, ensure_ascii=ensure_ascii)
+    but neither the list nor its serialized form have to be held in memory at once.
+    """
+    serializer = json_serializer()
+    padding = " " * indent
+    empty = True
+
+    for item in items:
+        f.write("[\n" if empty else ",\n")
+        f.write(
+            padding + serializer.dumps(item, indent, ensure_ascii).replace("\n", "\n" + padding)
+        )
+        empty = False
+
+    f.write("[]" if empty else "\n]")
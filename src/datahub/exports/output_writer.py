@@ -0,0 +1,91 @@
+import hashlib
+import os
+import secrets
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+CHUNK_SIZE = 1 << 16
+
+
+class OutputWriter:
+    """
+    Writes exporter outputs atomically and only if their content changed.
+
+    Every output is written into a temporary file next to its target. If the content hash equals
+    the one of the existing file, the temporary file is discarded and the target is left
+    untouched (including its mtime), otherwise it atomically replaces the target.
+    """
+
+    def __init__(self):
+        self.changed: list[Path] = []
+        self.unchanged: list[Path] = []
+
+    @contextmanager
+    def open(
+        self, path: Path | str, newline: str | None = None, binary: bool = False
+    ) -> Generator[IO]:
+        """opens a text or binary file for writing, the target is replaced when the context exits"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+
+        try:
+            if binary:
+                f = tmp_path.open("xb")
+            else:
+                f = tmp_path.open("x", encoding="utf-8", newline=newline)
+
+            with f:
+                yield f
+
+            if OutputWriter._same_content(tmp_path, path):
+                tmp_path.unlink()
+                self.unchanged.append(path)
+            else:
+                tmp_path.replace(path)
+                self.changed.append(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def write_text(self, path: Path | str, content: str) -> bool:
+        """writes content to path, returns True if the file changed"""
+        changed_before = len(self.changed)
+
+        with self.open(path) as f:
+            f.write(content)
+
+        return len(self.changed) > changed_before
+
+    def write_bytes(self, path: Path | str, content: bytes) -> bool:
+        """writes content to path, returns True if the file changed"""
+        changed_before = len(self.changed)
+
+        with self.open(path, binary=True) as f:
+            f.write(content)
+
+        return len(self.changed) > changed_before
+
+    def summary(self) -> str:
+        total = len(self.changed) + len(self.unchanged)
+        return f"{len(self.changed)} of {total} files changed"
+
+    @staticmethod
+    def _same_content(new_path: Path, old_path: Path) -> bool:
+        if not old_path.is_file() or new_path.stat().st_size != old_path.stat().st_size:
+            return False
+
+        return OutputWriter._file_hash(new_path) == OutputWriter._file_hash(old_path)
+
+    @staticmethod
+    def _file_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+
+        with path.open("rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                digest.update(chunk)
+
+        return digest.hexdigest()
@@ -0,0 +1,94 @@
+import time
+
+from datahub.instrumentation import instrumentation
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class StationVisitor:
+    """
+    Receives the loaded data station by station from an ExportPipeline.
+
+    All hooks are no-ops by default, exporters override the ones they need.
+    """
+
+    def begin_source(self, source: DataSource):
+        """called before the stations of a data source are visited"""
+
+    def visit(self, source: DataSource, station: Station):
+        """called once for every station"""
+
+    def end_source(self, source: DataSource):
+        """called after all stations of a data source were visited"""
+
+    def finish(self):
+        """called after all data sources were visited, writes the output"""
+
+
+class ExportPipeline:
+    """Streams the loaded data once and fans every station out to all registered visitors"""
+
+    def __init__(self, visitors: list[StationVisitor] | None = None):
+        self.visitors: list[StationVisitor] = list(visitors or [])
+
+    def register(self, visitor: StationVisitor) -> StationVisitor:
+        self.visitors.append(visitor)
+        return visitor
+
+    def run(self, data: list[DataSource]):
+        if instrumentation.enabled:
+            self._run_instrumented(data)
+            return
+
+        visitors = self.visitors
+
+        for source in data:
+            for visitor in visitors:
+                visitor.begin_source(source)
+
+            for station in source.data:
+                for visitor in visitors:
+                    visitor.visit(source, station)
+
+            for visitor in visitors:
+                visitor.end_source(source)
+
+        for visitor in visitors:
+            visitor.finish()
+
+    def _run_instrumented(self, data: list[DataSource]):
+        """same as run, but attributes the time spent in every hook to an export/<visitor> stage"""
+        timings = {id(visitor): [0.0, 0.0] for visitor in self.visitors}
+
+        def timed(visitor: StationVisitor, hook, *args):
+            wall = time.perf_counter()
+            cpu = time.thread_time()
+            hook(*args)
+            timing = timings[id(visitor)]
+            timing[0] += time.perf_counter() - wall
+            timing[1] += time.thread_time() - cpu
+
+        stations = 0
+        for source in data:
+            for visitor in self.visitors:
+                timed(visitor, visitor.begin_source, source)
+
+            for station in source.data:
+                stations += 1
+                for visitor in self.visitors:
+                    timed(visitor, visitor.visit, source, station)
+
+            for visitor in self.visitors:
+                timed(visitor, visitor.end_source, source)
+
+        for visitor in self.visitors:
+            timed(visitor, visitor.finish)
+
+        for visitor in self.visitors:
+            wall_seconds, cpu_seconds = timings[id(visitor)]
+            instrumentation.add(
+                f"export/{type(visitor).__name__}",
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                items=stations,
+            )
@@ -1,55 +1,50 @@
-import json
-import operator
 from pathlib import Path
 
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.serializers import json_serializer
 from datahub.settings import JSON_INDENT
 from datahub.views.data_source import DataSource
+from datahub.views.schedule_index import ScheduleIndex
+from datahub.views.station import Station
 
 
 class ScheduleExporter:
     @staticmethod
-    def export(schedule_path: Path | str, data: list[DataSource]):
-        inverted_schedule: list[dict[str, list[str]]] = []
+    def projection(station: Station) -> list | None:
+        """fields of a station the schedule depends on, None if the station is in no schedule"""
+        if not station.schedule_show_always and not station.schedule_show_booked:
+            return None
 
-        schedule_types = ["EDGG", "EDMM", "EDWW", "MIL"]
+        return [station.logon, station.schedule_show_always, station.schedule_show_booked]
 
-        for schedule_type in schedule_types:
-            schedule_entry = {
+    @staticmethod
+    def export(
+        schedule_path: Path | str, data: list[DataSource], writer: OutputWriter | None = None
+    ):
+        ExportPipeline([ScheduleVisitor(schedule_path, writer)]).run(data)
+
+
+class ScheduleVisitor(StationVisitor):
+    def __init__(self, schedule_path: Path | str, writer: OutputWriter | None = None):
+        self.schedule_path = Path(schedule_path)
+        self.writer = writer or OutputWriter()
+        self.index = ScheduleIndex()
+
+    def visit(self, source: DataSource, station: Station):
+        self.index.add(station)
+
+    def finish(self):
+        inverted_schedule: list[dict[str, list[str]]] = [
+            {
                 "name": schedule_type,
-                "schedule_show_always": [],
-                "schedule_show_booked": [],
+                "schedule_show_always": self.index.show_always(schedule_type),
+                "schedule_show_booked": self.index.show_booked(schedule_type),
             }
-
-            for file in data:
-                for station in file.data:
-                    # mil stations:
-                    if station.logon.startswith("ET") and schedule_type == "MIL":
-                        if station.schedule_show_always:
-                            schedule_entry["schedule_show_always"].append(station.logon)
-                        if station.schedule_show_booked:
-                            schedule_entry["schedule_show_booked"].append(station.logon)
-
-                    if (
-                        station.schedule_show_always
-                        and schedule_type in station.schedule_show_always
-                    ):
-                        schedule_entry["schedule_show_always"].append(station.logon)
-                    if (
-                        station.schedule_show_booked
-                        and schedule_type in station.schedule_show_booked
-                    ):
-                        schedule_entry["schedule_show_booked"].append(station.logon)
-
-            schedule_entry["schedule_show_always"].sort()
-            schedule_entry["schedule_show_booked"].sort()
-
-            inverted_schedule.append(schedule_entry)
-
-        inverted_schedule.sort(key=operator.itemgetter("name"))
+            for schedule_type in self.index.schedule_types
+        ]
 
         print(f"ScheduleExporter: exported {len(inverted_schedule)} schedules")
 
-        schedule_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with Path.open(schedule_path, "w+", encoding="utf-8") as output_json_file:
-            json.dump(inverted_schedule, output_json_file, indent=JSON_INDENT)
+        with self.writer.open(self.schedule_path) as output_json_file:
+            json_serializer().dump(inverted_schedule, output_json_file, indent=JSON_INDENT)
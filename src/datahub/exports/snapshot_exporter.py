@@ -0,0 +1,114 @@
+import struct
+from pathlib import Path
+
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.loaders.snapshot_loader import (
+    BOOL_FIELDS,
+    BOOL_NONE,
+    HEADER,
+    LAYOUT,
+    LIST_FIELDS,
+    MAGIC,
+    NONE,
+    RECORD,
+    STRING_FIELDS,
+    VERSION,
+)
+from datahub.sorting.station_sorter import StationSorter
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class SnapshotExporter:
+    @staticmethod
+    def export(file_path: Path | str, data: list[DataSource], writer: OutputWriter | None = None):
+        ExportPipeline([SnapshotVisitor(file_path, writer)]).run(data)
+
+    @staticmethod
+    def snapshot(stations: list[Station]) -> bytes:
+        """encodes the stations in the layout read by StationSnapshot"""
+        strings: dict[str, int] = {}
+        lists: dict[tuple[int, ...], int] = {}
+
+        def string_id(value: str | None) -> int:
+            if value is None:
+                return NONE
+            return strings.setdefault(value, len(strings))
+
+        def list_id(values: list[str] | None) -> int:
+            if values is None:
+                return NONE
+            return lists.setdefault(tuple(string_id(value) for value in values), len(lists))
+
+        layout = string_id(LAYOUT)
+        records = bytearray()
+        for station in stations:
+            records += RECORD.pack(
+                *(string_id(getattr(station, name)) for name in STRING_FIELDS),
+                *(list_id(getattr(station, name)) for name in LIST_FIELDS),
+                *(_bool(getattr(station, name)) for name in BOOL_FIELDS),
+            )
+
+        index = sorted(range(len(stations)), key=lambda number: stations[number].logon.encode())
+
+        encoded = [value.encode() for value in strings]
+        string_offsets = _offsets(len(value) for value in encoded)
+        list_offsets = _offsets(len(items) for items in lists)
+        list_items = [string for items in lists for string in items]
+
+        sections = [
+            _u32s(string_offsets),
+            b"".join(encoded),
+            _u32s(list_offsets),
+            _u32s(list_items),
+            bytes(records),
+            _u32s(index),
+        ]
+
+        offsets = []
+        position = HEADER.size
+        for section in sections:
+            offsets.append(position)
+            position += len(section)
+
+        header = HEADER.pack(
+            MAGIC, VERSION, layout, len(stations), len(strings), len(lists), *offsets
+        )
+        return header + b"".join(sections)
+
+
+class SnapshotVisitor(StationVisitor):
+    """writes all stations, sorted like stations.json, into a binary snapshot"""
+
+    def __init__(self, file_path: Path | str, writer: OutputWriter | None = None):
+        self.file_path = Path(file_path)
+        self.writer = writer or OutputWriter()
+        self.source_data: list[list[Station]] = []
+
+    def begin_source(self, source: DataSource):
+        self.source_data.append([])
+
+    def visit(self, source: DataSource, station: Station):
+        self.source_data[-1].append(station)
+
+    def finish(self):
+        stations = list(StationSorter.imerge(self.source_data))
+        self.writer.write_bytes(self.file_path, SnapshotExporter.snapshot(stations))
+
+        print(f"SnapshotExporter: exported {len(stations)} stations")
+
+
+def _bool(value: bool | None) -> int:
+    return BOOL_NONE if value is None else int(value)
+
+
+def _offsets(lengths) -> list[int]:
+    offsets = [0]
+    for length in lengths:
+        offsets.append(offsets[-1] + length)
+    return offsets
+
+
+def _u32s(values: list[int]) -> bytes:
+    return struct.pack(f"<{len(values)}I", *values)
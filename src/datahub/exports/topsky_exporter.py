@@ -2,32 +2,60 @@ import json
 import operator
 from pathlib import Path
 
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
 from datahub.views.data_source import DataSource
+from datahub.views.station import Station
 
 
 class TopskyExporter:
+    @staticmethod
+    def projection(station: Station) -> list | None:
+        """fields of a station the CPDLC file depends on, None for stations without CPDLC login"""
+        if not station.cpdlc_login:
+            return None
+
+        return [station.cpdlc_login, station.logon.split("_")[0], station.abbreviation]
+
     @staticmethod
     def export(
         ts_path: Path | str,
         data: list[DataSource],
         cpdlc_mapping=Path("data/topsky/cpdlcMap.json"),
+        writer: OutputWriter | None = None,
     ):
-        cpdlc_callsign_map = json.load(Path.open(cpdlc_mapping, "r", encoding="utf-8"))
+        ExportPipeline([TopskyVisitor(ts_path, cpdlc_mapping, writer)]).run(data)
 
-        cpdlc_station_data = []
 
-        for file in data:
-            for station in file.data:
-                if not station.cpdlc_login:
-                    continue
+class TopskyVisitor(StationVisitor):
+    def __init__(
+        self,
+        ts_path: Path | str,
+        cpdlc_mapping=Path("data/topsky/cpdlcMap.json"),
+        writer: OutputWriter | None = None,
+    ):
+        self.ts_path = Path(ts_path)
+        self.writer = writer or OutputWriter()
 
-                callsign = cpdlc_callsign_map.get(station.logon.split("_")[0])
+        with Path.open(cpdlc_mapping, "r", encoding="utf-8") as f:
+            self.cpdlc_callsign_map = json.load(f)
 
-                cpdlc_station_data.append({
-                    "login": station.cpdlc_login,
-                    "callsign": callsign,
-                    "abbreviation": station.abbreviation,
-                })
+        self.cpdlc_station_data = []
+
+    def visit(self, source: DataSource, station: Station):
+        if not station.cpdlc_login:
+            return
+
+        callsign = self.cpdlc_callsign_map.get(station.logon.split("_")[0])
+
+        self.cpdlc_station_data.append({
+            "login": station.cpdlc_login,
+            "callsign": callsign,
+            "abbreviation": station.abbreviation,
+        })
+
+    def finish(self):
+        cpdlc_station_data = self.cpdlc_station_data
 
         # sort data by callsign then by login
         cpdlc_station_data.sort(key=operator.itemgetter("callsign", "login"))
@@ -48,7 +76,5 @@ class TopskyExporter:
 
         print(f"TopskyExporter: exported {len(cpdlc_station_data)} stations")
 
-        ts_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with Path.open(ts_path, "w+", encoding="utf-8") as output_text:
+        with self.writer.open(self.ts_path) as output_text:
             output_text.writelines(output_lines)
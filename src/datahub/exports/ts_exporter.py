@@ -1,36 +1,48 @@
-import json
 import operator
 from pathlib import Path
 
+from datahub.exports.output_writer import OutputWriter
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.serializers import json_serializer
 from datahub.settings import JSON_INDENT
 from datahub.views.data_source import DataSource
+from datahub.views.station import Station
 
 
 class TeamspeakExporter:
     @staticmethod
-    def export(folder_path: Path | str, data: list[DataSource]):
-        folder_path = Path(folder_path)
-        mapping_data = []
+    def projection(station: Station) -> list:
+        """fields of a station the mapping depends on"""
+        return [station.abbreviation, station.logon.split("_")[0], station.frequency]
 
-        for file in data:
-            for station in file.data:
-                callsign_parts = station.logon.split("_")
-                callsign_prefix = callsign_parts[0] if callsign_parts else ""
+    @staticmethod
+    def export(folder_path: Path | str, data: list[DataSource], writer: OutputWriter | None = None):
+        ExportPipeline([TeamspeakVisitor(folder_path, writer)]).run(data)
 
-                station_mapping = {
-                    "id": station.abbreviation,
-                    "callsignPrefix": callsign_prefix,
-                    "frequency": station.frequency,
-                }
 
-                mapping_data.append(station_mapping)
+class TeamspeakVisitor(StationVisitor):
+    def __init__(self, folder_path: Path | str, writer: OutputWriter | None = None):
+        self.folder_path = Path(folder_path)
+        self.writer = writer or OutputWriter()
+        self.mapping_data = []
 
-        # sort mapping_data by 'callsignPrefix' first, then by 'id'
-        mapping_data.sort(key=operator.itemgetter("callsignPrefix", "id"))
+    def visit(self, source: DataSource, station: Station):
+        callsign_parts = station.logon.split("_")
+        callsign_prefix = callsign_parts[0] if callsign_parts else ""
+
+        station_mapping = {
+            "id": station.abbreviation,
+            "callsignPrefix": callsign_prefix,
+            "frequency": station.frequency,
+        }
 
-        folder_path.parent.mkdir(parents=True, exist_ok=True)
+        self.mapping_data.append(station_mapping)
+
+    def finish(self):
+        # sort mapping_data by 'callsignPrefix' first, then by 'id'
+        self.mapping_data.sort(key=operator.itemgetter("callsignPrefix", "id"))
 
-        with Path.open(folder_path, "w+", encoding="utf-8") as output_json_file:
-            json.dump(mapping_data, output_json_file, indent=JSON_INDENT)
+        with self.writer.open(self.folder_path) as output_json_file:
+            json_serializer().dump(self.mapping_data, output_json_file, indent=JSON_INDENT)
 
-        print(f"TeamspeakExporter: exported {len(mapping_data)} stations")
+        print(f"TeamspeakExporter: exported {len(self.mapping_data)} stations")
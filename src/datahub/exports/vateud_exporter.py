@@ -1,18 +1,31 @@
 import csv
-from collections.abc import Callable
-from dataclasses import dataclass
+import io
+import json
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 
+from datahub.exports.output_writer import OutputWriter
+from datahub.loaders.http_cache import HttpCache
+from datahub.settings import HTTP_CACHE, JSON_INDENT, VATEUD_URL
 from datahub.sorting.station_sorter import StationSorter
+from datahub.validators.frequency import frequency_validator
 from datahub.views.data_source import DataSource
 
 if TYPE_CHECKING:
     from datahub.views.station import Station
 
+VateudParser = Literal["lxml", "bs4"]
+
+# rows of the VATEUD list which belong to us
+VATEUD_COUNTRY_ID = "2"
+VATEUD_PREFIXES = ("ED", "ET")
+VATEUD_EXCLUDED_SUFFIXES = ("ATIS",)
+
 
 @dataclass
 class VateudStation:
@@ -23,35 +36,154 @@ class VateudStation:
     airport_region: str
 
 
+MISSING_IN_VATEUD = "Missing in VATEUD"
+MISSING_IN_STATIONS = "Missing in Stations"
+FREQUENCY_MISMATCH = "Frequency mismatch"
+NAME_MISMATCH = "Name mismatch"
+
+VateudFormat = Literal["csv", "json"]
+
+
+@dataclass
+class VateudChange:
+    """a station missing on one side, or present on both sides with differing fields"""
+
+    callsign: str
+    remarks: list[str]
+    vateud: VateudStation | None = None
+    station: "Station | None" = None
+
+    def to_dict(self) -> dict:
+        return {
+            "callsign": self.callsign,
+            "remarks": self.remarks,
+            "vateud": asdict(self.vateud) if self.vateud is not None else None,
+            "station": self.station.to_dict() if self.station is not None else None,
+        }
+
+
 class VateudExporter:
     @staticmethod
-    def export(file_path: Path | str, data: list[DataSource]):
+    def export(
+        file_path: Path | str,
+        data: list[DataSource],
+        writer: OutputWriter | None = None,
+        http_cache: HttpCache | None = None,
+        snapshot: Path | str | None = None,
+        parser: VateudParser = "lxml",
+        formats: Iterable[VateudFormat] = ("csv",),
+    ):
+        """
+        Compares the stations with the VATEUD station list.
+
+        The list is fetched through http_cache (a default cache if omitted), or read from the
+        snapshot file if given, e.g. a previously saved page. The bs4 parser is the former
+        BeautifulSoup implementation, kept for comparison.
+
+        The differences are written to file_path in every requested format, a summary is
+        printed. file_path is used as given for a single format, the suffix of the format is
+        only set if file_path has none or several formats are written.
+        """
         stations: list[Station] = [station for ds in data for station in ds.data]
 
-        vateud_stations_exclude_rules = [
-            lambda s: s.country_id != "2",
-            lambda s: not s.callsign.startswith(("ED", "ET")),
-            lambda s: s.callsign.endswith("ATIS"),
-        ]
+        if snapshot is not None:
+            page = Path(snapshot).read_text(encoding="utf-8")
+        else:
+            page = (http_cache or HttpCache(HTTP_CACHE)).get_text(VATEUD_URL)
 
-        vateud_stations = VateudExporter._get_vateud_stations(vateud_stations_exclude_rules)
+        if parser == "bs4":
+            vateud_stations = VateudExporter._get_vateud_stations(
+                page, VateudExporter.exclude_rules()
+            )
+        else:
+            vateud_stations = list(VateudExporter._parse_vateud_stations(page))
         print(f"Fetched {len(vateud_stations)} VATEUD stations")
 
-        station_map = {s.logon: s for s in stations}
+        changes = VateudExporter.diff(stations, vateud_stations)
+        summary = VateudExporter.summary(changes, len(stations), len(vateud_stations))
+
+        writer = writer or OutputWriter()
+        file_path = Path(file_path)
+        formats = list(formats)
+
+        for output_format in formats:
+            output_path = file_path
+            if not file_path.suffix or len(formats) > 1:
+                output_path = file_path.with_suffix(f".{output_format}")
+
+            if output_format == "json":
+                VateudExporter._write_json(output_path, changes, summary, writer)
+            else:
+                VateudExporter._write_csv(output_path, changes, writer)
+
+            print(f"{output_format.upper()} written to {output_path}")
+
+        print("Summary: " + ", ".join(f"{key}: {value}" for key, value in summary.items()))
+
+    @staticmethod
+    def diff(stations: list["Station"], vateud_stations: list[VateudStation]) -> list[VateudChange]:
+        """
+        Joins both lists on the callsign in a single pass over the stations.
+
+        Frequencies are compared after normalizing them with the frequency validator, names
+        (the station description) ignoring case and whitespace. The result holds the stations
+        missing in VATEUD, the VATEUD stations missing in the stations and the mismatches, each
+        group in logon order.
+        """
         vateud_map = {vs.callsign: vs for vs in vateud_stations}
+        matched = set()
+        missing_in_vateud = []
+        mismatches = []
 
-        station_callsigns = set(station_map)
-        vateud_callsigns = set(vateud_map)
+        for station in stations:
+            vs = vateud_map.get(station.logon)
 
-        missing_in_vateud = station_callsigns - vateud_callsigns
-        missing_in_stations = vateud_callsigns - station_callsigns
+            if vs is None:
+                missing_in_vateud.append(
+                    VateudChange(station.logon, [MISSING_IN_VATEUD], None, station)
+                )
+                continue
+
+            matched.add(vs.callsign)
+            remarks = []
+            if _normalize_frequency(vs.frequency) != station.frequency:
+                remarks.append(FREQUENCY_MISMATCH)
+            if _normalize_name(vs.name) != _normalize_name(station.description or ""):
+                remarks.append(NAME_MISMATCH)
 
-        csv_path = Path(file_path)
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
+            if remarks:
+                mismatches.append(VateudChange(station.logon, remarks, vs, station))
+
+        missing_in_stations = [
+            VateudChange(vs.callsign, [MISSING_IN_STATIONS], vs, None)
+            for vs in vateud_map.values()
+            if vs.callsign not in matched
+        ]
 
-        with Path.open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f, delimiter=";")
-            writer.writerow([
+        return [
+            change
+            for group in (missing_in_vateud, missing_in_stations, mismatches)
+            for change in sorted(group, key=lambda c: StationSorter.logon_key(c.callsign))
+        ]
+
+    @staticmethod
+    def summary(changes: list[VateudChange], stations: int, vateud_stations: int) -> dict:
+        counts = Counter(remark for change in changes for remark in change.remarks)
+
+        return {
+            "stations": stations,
+            "vateud_stations": vateud_stations,
+            MISSING_IN_VATEUD: counts[MISSING_IN_VATEUD],
+            MISSING_IN_STATIONS: counts[MISSING_IN_STATIONS],
+            FREQUENCY_MISMATCH: counts[FREQUENCY_MISMATCH],
+            NAME_MISMATCH: counts[NAME_MISMATCH],
+        }
+
+    @staticmethod
+    def _write_csv(csv_path: Path, changes: list[VateudChange], writer: OutputWriter):
+        with writer.open(csv_path, newline="") as f:
+            csv_writer = csv.writer(f, delimiter=";")
+            csv_writer.writerow([
                 "Callsign (old)",
                 "Name (old)",
                 "Frequency (old)",
@@ -61,41 +193,99 @@ class VateudExporter:
                 "Remark",
             ])
 
-            for callsign in sorted(missing_in_vateud, key=StationSorter.sort_key):
-                s = station_map[callsign]
-                writer.writerow([
-                    "",
-                    "",
-                    "",
-                    s.logon,
-                    s.description or "",
-                    s.frequency or "",
-                    "Missing in VATEUD",
+            for change in changes:
+                vs, s = change.vateud, change.station
+                csv_writer.writerow([
+                    vs.callsign if vs else "",
+                    vs.name if vs else "",
+                    vs.frequency if vs else "",
+                    s.logon if s else "",
+                    (s.description or "") if s else "",
+                    (s.frequency or "") if s else "",
+                    ", ".join(change.remarks),
                 ])
 
-            for callsign in sorted(missing_in_stations, key=StationSorter.sort_key):
-                vs = vateud_map[callsign]
-                writer.writerow([
-                    vs.callsign,
-                    vs.name,
-                    vs.frequency,
-                    "",
-                    "",
-                    "",
-                    "Missing in Stations",
-                ])
+    @staticmethod
+    def _write_json(
+        json_path: Path, changes: list[VateudChange], summary: dict, writer: OutputWriter
+    ):
+        with writer.open(json_path) as f:
+            json.dump(
+                {"summary": summary, "changes": [change.to_dict() for change in changes]},
+                f,
+                indent=JSON_INDENT,
+            )
+
+    @staticmethod
+    def exclude_rules() -> list[Callable[[VateudStation], bool]]:
+        return [
+            lambda s: s.country_id != VATEUD_COUNTRY_ID,
+            lambda s: not s.callsign.startswith(VATEUD_PREFIXES),
+            lambda s: s.callsign.endswith(VATEUD_EXCLUDED_SUFFIXES),
+        ]
+
+    @staticmethod
+    def _parse_vateud_stations(page: str | bytes) -> Iterator[VateudStation]:
+        """
+        Streams the rows of the second table of the VATEUD page.
+
+        Rows are filtered on the raw cell texts before any object is created, every processed
+        row is cleared to keep the memory usage flat. Cell texts are normalized like
+        BeautifulSoup's get_text(strip=True).
+        """
+        if isinstance(page, str):
+            page = page.encode("utf-8")
+
+        parser = etree.iterparse(
+            io.BytesIO(page),
+            events=("start", "end"),
+            tag=("table", "tr"),
+            html=True,
+            encoding="utf-8",
+        )
+
+        table_index = -1
+        header_skipped = False
+
+        for event, element in parser:
+            if element.tag == "table":
+                if event == "start":
+                    table_index += 1
+                elif table_index == 1:
+                    break
+                continue
+
+            if event != "end" or table_index != 1:
+                if event == "end":
+                    element.clear()
+                continue
+
+            if not header_skipped:
+                header_skipped = True
+                element.clear()
+                continue
+
+            cells = [_cell_text(cell) for cell in element.iter("td", "th")]
+            element.clear()
+
+            if (
+                len(cells) < 5
+                or cells[0] != VATEUD_COUNTRY_ID
+                or not cells[1].startswith(VATEUD_PREFIXES)
+                or cells[1].endswith(VATEUD_EXCLUDED_SUFFIXES)
+            ):
+                continue
 
-        print(f"CSV written to {csv_path}")
+            yield VateudStation(cells[0], cells[1], cells[2], cells[3], cells[4])
 
     @staticmethod
     def _get_vateud_stations(
+        page: str,
         exclude_rules: list[Callable[[VateudStation], bool]] | None = None,
     ) -> list[VateudStation]:
-        url = "https://fsmine.dhis.org/vateud8"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        from bs4 import BeautifulSoup
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(page, "lxml")
         table = soup.find_all("table")[1]
         rows = table.find_all("tr")[1:]
 
@@ -114,3 +304,22 @@ class VateudExporter:
             stations.append(station)
 
         return stations
+
+
+def _cell_text(cell) -> str:
+    # cells usually hold plain text only, which avoids walking the subtree
+    if len(cell) == 0:
+        return (cell.text or "").strip()
+    return "".join(text.strip() for text in cell.itertext())
+
+
+def _normalize_frequency(frequency: str) -> str:
+    try:
+        return frequency_validator(frequency)
+    except ValueError:
+        # compared as is, an invalid frequency never matches a station
+        return frequency
+
+
+def _normalize_name(name: str) -> str:
+    return " ".join(name.split()).casefold()
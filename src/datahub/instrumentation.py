@@ -0,0 +1,194 @@
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# environment variables enabling the instrumentation of the CLI entry points
+REPORT_ENV = "DATAHUB_REPORT"
+PROFILE_ENV = "DATAHUB_PROFILE"
+
+
+@dataclass
+class StageMetrics:
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    allocated_bytes: int = 0
+    items: int = 0
+
+
+@dataclass(slots=True)
+class StageRecord:
+    """handed out by Instrumentation.stage, allows to set the item count of a running stage"""
+
+    items: int = 0
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time, allocations and item counts per stage.
+
+    Disabled by default, in this state stages cost a single attribute check. CPU time is the time
+    of the calling thread. Allocations are measured with tracemalloc as net bytes allocated
+    during a stage and are only available while tracing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages: dict[str, StageMetrics] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0) -> Generator[StageRecord]:
+        record = StageRecord(items)
+
+        if not self.enabled:
+            yield record
+            return
+
+        tracing = tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else 0
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+
+        try:
+            yield record
+        finally:
+            self.add(
+                name,
+                wall_seconds=time.perf_counter() - wall,
+                cpu_seconds=time.thread_time() - cpu,
+                allocated_bytes=(tracemalloc.get_traced_memory()[0] - allocated) if tracing else 0,
+                items=record.items,
+            )
+
+    def add(
+        self,
+        name: str,
+        wall_seconds: float = 0.0,
+        cpu_seconds: float = 0.0,
+        allocated_bytes: int = 0,
+        items: int = 0,
+        calls: int = 1,
+    ):
+        """adds measurements taken elsewhere to a stage"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            metrics = self.stages.setdefault(name, StageMetrics())
+            metrics.calls += calls
+            metrics.wall_seconds += wall_seconds
+            metrics.cpu_seconds += cpu_seconds
+            metrics.allocated_bytes += allocated_bytes
+            metrics.items += items
+
+    def report(self) -> dict:
+        return {name: asdict(metrics) for name, metrics in self.stages.items()}
+
+    @contextmanager
+    def session(
+        self,
+        command: str,
+        report_path: Path | str | None = None,
+        profile_path: Path | str | None = None,
+        trace_allocations: bool = True,
+    ) -> Generator[None]:
+        """
+        Enables the instrumentation while running a command.
+
+        The JSON report is written to report_path (also if the command fails). If profile_path
+        is given, the command is profiled with cProfile (or pyinstrument for .html files) and the
+        profile is written there.
+        """
+        if report_path is None and profile_path is None:
+            yield
+            return
+
+        self.enabled = True
+        self.stages = {}
+
+        started_tracing = trace_allocations and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        profiler = Instrumentation._start_profiler(profile_path) if profile_path else None
+
+        try:
+            with self.stage("total"):
+                yield
+        finally:
+            if profiler is not None:
+                Instrumentation._stop_profiler(profiler, Path(profile_path))
+
+            peak_memory = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+            if started_tracing:
+                tracemalloc.stop()
+
+            self.enabled = False
+
+            if report_path is not None:
+                report = {
+                    "command": command,
+                    "peak_traced_memory_bytes": peak_memory,
+                    "stages": self.report(),
+                }
+
+                Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+                with Path(report_path).open("w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=4)
+
+    @staticmethod
+    def _start_profiler(profile_path: Path | str):
+        if Path(profile_path).suffix == ".html":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logger.warning("pyinstrument is not installed, falling back to cProfile")
+            else:
+                profiler = Profiler()
+                profiler.start()
+                return profiler
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    @staticmethod
+    def _stop_profiler(profiler, profile_path: Path):
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        else:
+            profiler.stop()
+            profile_path.write_text(profiler.output_html(), encoding="utf-8")
+
+
+instrumentation = Instrumentation()
+
+
+def instrumented(func):
+    """runs a CLI entry point in an instrumentation session configured by the environment"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with instrumentation.session(
+            func.__name__,
+            report_path=os.environ.get(REPORT_ENV),
+            profile_path=os.environ.get(PROFILE_ENV),
+        ):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -1,50 +1,99 @@
 import json
 import logging
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
-import toml
 from pydantic import ValidationError
 
+from datahub.instrumentation import instrumentation
+from datahub.loaders.source_positions import (
+    Position,
+    RecordPositions,
+    json_positions,
+    toml_positions,
+)
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.serializers import DECODE_ERRORS, json_serializer, toml_serializer
 from datahub.views.data_source import DataSource
 from datahub.views.station import Station
 
 logger = logging.getLogger(__name__)
 
+PoolMode = Literal["thread", "process"]
+
+_TOML_ERROR_POSITION = re.compile(r"at line (\d+), column (\d+)")
+
+
+@dataclass(frozen=True)
+class FileError:
+    file_path: Path
+    message: str
+    line: int = 1
+    column: int = 1
+
+    def annotation(self) -> str:
+        return f"::error file={self.file_path},line={self.line},col={self.column}::{self.message}"
+
 
 class DataLoader:
     """Reads raw data from files"""
 
     @staticmethod
-    def load(data_dir: Path | str, exclude_folders: set[str] | None = None) -> list[DataSource]:
+    def load(
+        data_dir: Path | str,
+        exclude_folders: set[str] | None = None,
+        workers: int | None = None,
+        pool: PoolMode = "thread",
+        cache: ValidationCache | None = None,
+        all_errors: bool = False,
+    ) -> list[DataSource]:
+        """
+        Load and validate all station files below data_dir.
+
+        With workers > 1 the files are parsed concurrently, either in a thread pool (I/O bound
+        workloads) or in a process pool (validation bound workloads). The order of the returned
+        data sources is identical to a sequential run.
+
+        If a validation cache is given, files whose content did not change since the last run are
+        neither decoded nor validated again.
+
+        all_errors revalidates every invalid file station by station and reports all errors at
+        their line and column, instead of the first error of the file at line 1.
+        """
         data_dir = Path(data_dir)
         data = []
         errors = []
 
-        if exclude_folders is None:
-            exclude_folders = set()
+        with instrumentation.stage("walk") as stage:
+            files = DataLoader._collect_files(data_dir, exclude_folders or set())
+            stage.items = len(files)
 
-        for folder in data_dir.iterdir():
-            if not folder.is_dir() or folder.name in exclude_folders:
-                continue
+        with instrumentation.stage("load", items=len(files)):
+            results = DataLoader._parse_files(files, workers, pool, cache)
 
-            for file_path in folder.iterdir():
-                if not file_path.is_file():
-                    continue
+        for file_path, (stations, error) in zip(files, results, strict=True):
+            if error is not None:
+                errors.append((file_path, error))
+            elif stations:
+                relative_path = file_path.relative_to(data_dir)
+                data.append(DataSource(source=str(relative_path), data=stations))
 
-                try:
-                    stations = DataLoader._parse_file(file_path)
-                    if stations:
-                        relative_path = file_path.relative_to(data_dir)
-                        data.append(DataSource(source=str(relative_path), data=stations))
-                except Exception as e:  # noqa: BLE001
-                    errors.append((file_path, str(e)))
+        if cache is not None:
+            cache.save()
 
         # print errors
         if errors:
             logger.error("::group::Data validation summary")
             # create per-file annotation
             for file_path, err in errors:
-                print(f"::error file={file_path},line=1::Validation or parsing failed: {err}")
+                details = DataLoader.validate_file(file_path) if all_errors else []
+                for detail in details:
+                    print(detail.annotation())
+                if not details:
+                    print(f"::error file={file_path},line=1::Validation or parsing failed: {err}")
             logger.error("::endgroup::")
 
             msg = f"DataLoader encountered {len(errors)} errors."
@@ -59,38 +108,233 @@ class DataLoader:
         return data
 
     @staticmethod
-    def _parse_file(file_path: Path) -> list[Station]:
-        """Parse a file and return list of stations"""
-        file_data = None
+    def _collect_files(data_dir: Path, exclude_folders: set[str]) -> list[Path]:
+        """Walk the FIR folders and return all files in load order"""
+        files = []
+
+        for folder in data_dir.iterdir():
+            if not folder.is_dir() or folder.name in exclude_folders:
+                continue
+
+            files.extend(file_path for file_path in folder.iterdir() if file_path.is_file())
+
+        return files
+
+    @staticmethod
+    def _parse_files(
+        files: list[Path],
+        workers: int | None,
+        pool: PoolMode,
+        cache: ValidationCache | None = None,
+    ) -> list[tuple[list[Station], str | None]]:
+        """Parse all files, concurrently if workers > 1, preserving the order of files"""
+        results: list[tuple[list[Station], str | None] | None] = [None] * len(files)
+        contents: list[bytes | None] = [None] * len(files)
+        hashes: list[str | None] = [None] * len(files)
 
+        if cache is not None:
+            DataLoader._lookup_cache(files, cache, results, contents, hashes)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        parsed = DataLoader._map_parse(
+            [files[i] for i in pending], [contents[i] for i in pending], workers, pool
+        )
+
+        for i, result in zip(pending, parsed, strict=True):
+            results[i] = result
+
+            stations, error = result
+            if cache is not None and error is None and hashes[i] is not None:
+                cache.put(files[i], hashes[i], stations)
+
+        return results
+
+    @staticmethod
+    def _lookup_cache(
+        files: list[Path],
+        cache: ValidationCache,
+        results: list,
+        contents: list[bytes | None],
+        hashes: list[str | None],
+    ):
+        """fills results with the cached stations of unchanged files"""
+        with instrumentation.stage("cache") as stage:
+            for i, file_path in enumerate(files):
+                try:
+                    contents[i] = file_path.read_bytes()
+                except OSError:
+                    # leave the error reporting to _parse_file
+                    continue
+
+                hashes[i] = ValidationCache.content_hash(contents[i])
+                stations = cache.get(file_path, hashes[i])
+                if stations is not None:
+                    results[i] = (stations, None)
+                    stage.items += len(stations)
+
+    @staticmethod
+    def _map_parse(
+        files: list[Path],
+        contents: list[bytes | None],
+        workers: int | None,
+        pool: PoolMode,
+    ) -> list[tuple[list[Station], str | None]]:
+        if not workers or workers <= 1 or len(files) <= 1:
+            return list(map(DataLoader._try_parse_file, files, contents))
+
+        executor: Executor
+        if pool == "process":
+            executor = ProcessPoolExecutor(max_workers=workers)
+            chunksize = max(1, len(files) // (workers * 4))
+        elif pool == "thread":
+            executor = ThreadPoolExecutor(max_workers=workers)
+            chunksize = 1
+        else:
+            msg = f"Unsupported pool type: {pool}"
+            raise ValueError(msg)
+
+        with executor:
+            return list(
+                executor.map(DataLoader._try_parse_file, files, contents, chunksize=chunksize)
+            )
+
+    @staticmethod
+    def _try_parse_file(
+        file_path: Path, content: bytes | None = None
+    ) -> tuple[list[Station], str | None]:
+        """Parse a file, returning the error message instead of raising"""
         try:
-            if file_path.suffix == ".json":
-                with file_path.open("r") as f:
-                    file_data = json.load(f)
-            elif file_path.suffix == ".toml":
-                with file_path.open("r") as f:
-                    file_data = toml.load(f)
-        except (json.JSONDecodeError, toml.TomlDecodeError) as e:
-            msg = f"Failed to decode {file_path.suffix} file: {e}"
-            raise ValueError(msg) from e
-        except Exception as e:
-            msg = f"Error reading file: {e}"
-            raise ValueError(msg) from e
+            return DataLoader._parse_file(file_path, content), None
+        except Exception as e:  # noqa: BLE001
+            return [], str(e)
+
+    @staticmethod
+    def _parse_file(file_path: Path, content: bytes | None = None) -> list[Station]:
+        """Parse a file and return list of stations, content is read from file_path if omitted"""
+        with instrumentation.stage("parse", items=1):
+            file_data = DataLoader._decode_file(file_path, content)
 
         if file_data is None:
             return []
 
         try:
-            if isinstance(file_data, list):
-                return [Station(**item) for item in file_data]
-            elif isinstance(file_data, dict):
-                stations_list = file_data.get("stations")
-                if stations_list and isinstance(stations_list, list):
-                    return [Station(**item) for item in stations_list]
-                else:
-                    return [Station(**file_data)]
-            else:
-                return []
+            with instrumentation.stage("validate") as stage:
+                stations = [Station(**item) for item in DataLoader._station_items(file_data)]
+                stage.items = len(stations)
+                return stations
         except ValidationError as e:
             msg = f"Validation error: {e}"
             raise ValueError(msg) from e
+
+    @staticmethod
+    def validate_file(file_path: Path, content: bytes | None = None) -> list[FileError]:
+        """
+        Validates every station of a file and returns all errors, located at the field (or the
+        station) they belong to. Slower than _parse_file, meant for reporting only.
+        """
+        try:
+            if content is None:
+                content = file_path.read_bytes()
+            file_data = DataLoader._decode_file(file_path, content)
+        except (OSError, ValueError) as e:
+            line, column = DataLoader._error_position(e.__cause__)
+            return [FileError(file_path, str(e), line, column)]
+
+        if file_data is None:
+            return []
+
+        items = DataLoader._station_items(file_data)
+        records = DataLoader._record_positions(file_path, content, len(items))
+
+        errors = []
+        for number, (item, record) in enumerate(zip(items, records, strict=True), 1):
+            try:
+                Station.model_validate(item)
+            except ValidationError as e:
+                name = item.get("logon") if isinstance(item, dict) else None
+                label = name or f"Station {number}"
+
+                for error in e.errors():
+                    position = record.locate(error["loc"])
+                    loc = ".".join(str(part) for part in error["loc"])
+                    message = (
+                        f"{label}: {loc}: {error['msg']}" if loc else f"{label}: {error['msg']}"
+                    )
+                    errors.append(FileError(file_path, message, position.line, position.column))
+
+        return errors
+
+    @staticmethod
+    def _error_position(error: BaseException | None) -> tuple[int, int]:
+        """where decoding failed, tomllib only mentions the position in its message"""
+        if hasattr(error, "lineno") and hasattr(error, "colno"):
+            return error.lineno, error.colno
+
+        match = _TOML_ERROR_POSITION.search(str(error))
+        if match:
+            return int(match.group(1)), int(match.group(2))
+        return 1, 1
+
+    @staticmethod
+    def locate_stations(file_path: Path) -> dict[str, Position]:
+        """positions of the stations of a valid file by logon, empty if it cannot be decoded"""
+        try:
+            content = file_path.read_bytes()
+            items = DataLoader._station_items(DataLoader._decode_file(file_path, content))
+        except (OSError, ValueError):
+            return {}
+
+        records = DataLoader._record_positions(file_path, content, len(items))
+        return {
+            str(item["logon"]).strip().upper(): record.start
+            for item, record in zip(items, records, strict=True)
+            if isinstance(item, dict) and "logon" in item
+        }
+
+    @staticmethod
+    def _record_positions(file_path: Path, content: bytes, count: int) -> list[RecordPositions]:
+        """positions of the stations, all at the start of the file if they cannot be mapped"""
+        unknown = [RecordPositions(Position(1, 1))] * count
+
+        try:
+            if file_path.suffix == ".json":
+                # json.loads accepts UTF-16 and UTF-32 as well
+                records = json_positions(content.decode(json.detect_encoding(content)))
+            else:
+                records = toml_positions(content.decode("utf-8-sig"))
+        except ValueError:
+            return unknown
+
+        return records if len(records) == count else unknown
+
+    @staticmethod
+    def _station_items(file_data) -> list:
+        """the raw station records of a decoded file"""
+        if isinstance(file_data, list):
+            return file_data
+        if isinstance(file_data, dict):
+            stations_list = file_data.get("stations")
+            if stations_list and isinstance(stations_list, list):
+                return stations_list
+            return [file_data]
+        return []
+
+    @staticmethod
+    def _decode_file(file_path: Path, content: bytes | None = None):
+        """Decode a JSON or TOML file, returns None for unsupported file types"""
+        if file_path.suffix not in {".json", ".toml"}:
+            return None
+
+        try:
+            if content is None:
+                content = file_path.read_bytes()
+
+            if file_path.suffix == ".json":
+                return json_serializer().loads(content)
+            return toml_serializer().loads(content)
+        except DECODE_ERRORS as e:
+            msg = f"Failed to decode {file_path.suffix} file: {e}"
+            raise ValueError(msg) from e
+        except Exception as e:
+            msg = f"Error reading file: {e}"
+            raise ValueError(msg) from e
@@ -0,0 +1,51 @@
+import json
+import logging
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from datahub.views.event_schedule import EVENT_RULES, EventSchedule
+
+logger = logging.getLogger(__name__)
+
+
+class EventScheduleLoader:
+    """Reads the event schedules (data/event_schedules/*.json)"""
+
+    @staticmethod
+    def load(schedule_dir: Path | str) -> list[EventSchedule]:
+        schedule_dir = Path(schedule_dir)
+        schedules = []
+        errors = []
+
+        for file_path in sorted(schedule_dir.glob("*.json")):
+            try:
+                schedules.append(EventScheduleLoader._parse_file(file_path, schedule_dir))
+            except Exception as e:  # noqa: BLE001
+                errors.append((file_path, e))
+
+        if errors:
+            logger.error("::group::Event schedule validation summary")
+            for file_path, err in errors:
+                print(f"::error file={file_path},line=1::Validation or parsing failed: {err}")
+            logger.error("::endgroup::")
+
+            msg = f"EventScheduleLoader encountered {len(errors)} errors."
+            raise RuntimeError(msg)
+
+        print(f"Loaded {sum(len(s.rules) for s in schedules)} event schedule rules")
+
+        return schedules
+
+    @staticmethod
+    def _parse_file(file_path: Path, schedule_dir: Path) -> EventSchedule:
+        with file_path.open("r", encoding="utf-8") as f:
+            content = json.load(f)
+
+        try:
+            rules = EVENT_RULES.validate_python(content)
+        except ValidationError as e:
+            msg = f"Validation error: {e}"
+            raise ValueError(msg) from e
+
+        return EventSchedule(source=str(file_path.relative_to(schedule_dir)), rules=rules)
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+
+import requests
+
+from datahub.exports.output_writer import OutputWriter
+
+logger = logging.getLogger(__name__)
+
+
+class OfflineError(RuntimeError):
+    """raised in offline mode if the cache holds no copy of the requested page"""
+
+
+class HttpCache:
+    """
+    Disk cache for HTTP GET requests.
+
+    Responses younger than ttl seconds are served from disk without any request. Older ones are
+    revalidated with a conditional request (If-None-Match / If-Modified-Since), so an unchanged
+    page costs a 304 response only. If the server is unreachable, the last stored copy is used.
+    In offline mode no requests are made at all.
+
+    Body and metadata are stored in two files, each replaced atomically. The metadata holds the
+    hash of its body, a body without matching metadata (e.g. after an interrupted write) is
+    still served but always fetched again unconditionally once it is needed online.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        ttl: float = 3600,
+        offline: bool = False,
+        session: requests.Session | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.offline = offline
+        self.session = session or requests.Session()
+
+    def get_text(self, url: str, timeout: float = 10) -> str:
+        meta_path, body_path = self._paths(url)
+        meta, cached = self._read_cached(meta_path, body_path)
+
+        if self.offline:
+            if cached is None:
+                msg = f"No cached copy of {url} available in offline mode"
+                raise OfflineError(msg)
+            return cached
+
+        if cached is not None and time.time() - meta.get("fetched_at", 0) < self.ttl:
+            return cached
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if cached is None:
+                raise
+            logger.warning("Fetching %s failed, using the cached copy: %s", url, e)
+            return cached
+
+        writer = OutputWriter()
+        if response.status_code == 304 and cached is not None:
+            text = cached
+        else:
+            text = response.text
+            # bytes, so that line endings survive the round trip and the hash matches
+            writer.write_bytes(body_path, text.encode("utf-8"))
+
+        # written after the body, an interruption in between leaves a body without its metadata
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag", meta.get("etag")),
+            "last_modified": response.headers.get("Last-Modified", meta.get("last_modified")),
+            "fetched_at": time.time(),
+            "sha256": HttpCache._hash(text),
+        }
+        writer.write_text(meta_path, json.dumps(meta))
+
+        return text
+
+    def snapshot_path(self, url: str) -> Path:
+        """file holding the cached body of url, can be copied to be used as fixture"""
+        return self._paths(url)[1]
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    @staticmethod
+    def _read_cached(meta_path: Path, body_path: Path) -> tuple[dict, str | None]:
+        """metadata and body of a cached page, the metadata is empty unless it fits the body"""
+        try:
+            text = body_path.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return {}, None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}, text
+
+        if meta.get("sha256") != HttpCache._hash(text):
+            return {}, text
+
+        return meta, text
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,190 @@
+"""
+Binary snapshot of the combined dataset, written by the SnapshotExporter.
+
+Layout (little endian, offsets relative to the start of the file):
+
+    header      magic, version, counts and section offsets (HEADER)
+    strings     string_count + 1 u32 offsets into the blob, string i is blob[off[i]:off[i + 1]]
+    blob        UTF-8 bytes of all distinct strings
+    lists       list_count + 1 u32 offsets into the list items
+    list items  u32 string ids
+    records     one fixed-width RECORD per station, in the order of stations.json
+    index       u32 record numbers, sorted by logon
+
+Records refer to strings and lists by id, NONE marks a missing value. The field layout is
+stored as a string too, snapshots written with another layout are rejected.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Self
+
+from datahub.views.station import Station
+
+MAGIC = b"DHSNAP\r\n"
+VERSION = 1
+NONE = 0xFFFFFFFF
+
+STRING_FIELDS = ("logon", "frequency", "abbreviation", "description", "gcap_status", "cpdlc_login")
+LIST_FIELDS = ("schedule_show_always", "schedule_show_booked", "relevant_airports")
+BOOL_FIELDS = ("s1_twr", "s1_theory")
+LAYOUT = ",".join(STRING_FIELDS + LIST_FIELDS + BOOL_FIELDS)
+
+# magic, version, layout string, stations, strings, lists, offsets of the six sections
+HEADER = struct.Struct("<8s11I")
+# string ids, list ids, booleans (0 = false, 1 = true, 2 = None)
+RECORD = struct.Struct(f"<{len(STRING_FIELDS) + len(LIST_FIELDS)}I{len(BOOL_FIELDS)}B")
+BOOL_NONE = 2
+
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+
+
+class StationSnapshot:
+    """
+    Read-only view of a snapshot file through mmap.
+
+    Opening a snapshot only reads its header, independent of the size of the dataset. Lookups
+    by logon or prefix binary search the logon index directly in the mapped file and stations
+    are built from their record once they are accessed.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+        with self.path.open("rb") as f:
+            # the mapping stays valid after the file is closed
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            self._mm.close()
+            msg = f"{self.path} is not a station snapshot"
+            raise ValueError(msg)
+
+        (
+            magic,
+            version,
+            layout,
+            self._count,
+            self._string_count,
+            self._list_count,
+            self._strings,
+            self._blob,
+            self._lists,
+            self._list_items,
+            self._records,
+            self._index,
+        ) = HEADER.unpack_from(self._mm)
+
+        if magic != MAGIC or version != VERSION or self._string(layout) != LAYOUT:
+            self._mm.close()
+            msg = f"{self.path} is not a station snapshot of version {VERSION}"
+            raise ValueError(msg)
+
+        self._stations: dict[int, Station] = {}
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Station]:
+        """all stations in the order of stations.json"""
+        for number in range(self._count):
+            yield self.station(number)
+
+    def __contains__(self, logon: str) -> bool:
+        return self._find(logon) is not None
+
+    def get(self, logon: str) -> Station | None:
+        number = self._find(logon)
+        return self.station(number) if number is not None else None
+
+    def prefix(self, prefix: str) -> list[Station]:
+        """all stations whose logon starts with prefix, sorted by logon"""
+        key = prefix.encode()
+        start = self._bisect(key)
+        # 0xff never occurs in UTF-8, it sorts after every continuation of the prefix
+        end = self._bisect(key + b"\xff", start)
+        return [self.station(self._record_at(position)) for position in range(start, end)]
+
+    def logons(self) -> list[str]:
+        """all logons, sorted"""
+        return [self._logon(position).decode() for position in range(self._count)]
+
+    def station(self, number: int) -> Station:
+        """the station of the given record, built on first access"""
+        station = self._stations.get(number)
+        if station is not None:
+            return station
+
+        if not 0 <= number < self._count:
+            msg = f"record {number} out of range"
+            raise IndexError(msg)
+
+        values = RECORD.unpack_from(self._mm, self._records + number * RECORD.size)
+        strings = values[: len(STRING_FIELDS)]
+        lists = values[len(STRING_FIELDS) : len(STRING_FIELDS) + len(LIST_FIELDS)]
+        bools = values[len(STRING_FIELDS) + len(LIST_FIELDS) :]
+
+        data = {}
+        for name, string_id in zip(STRING_FIELDS, strings, strict=True):
+            if string_id != NONE:
+                data[name] = self._string(string_id)
+        for name, list_id in zip(LIST_FIELDS, lists, strict=True):
+            if list_id != NONE:
+                data[name] = self._list(list_id)
+        for name, value in zip(BOOL_FIELDS, bools, strict=True):
+            if value != BOOL_NONE:
+                data[name] = bool(value)
+
+        station = self._stations[number] = Station.from_trusted(data)
+        return station
+
+    def _find(self, logon: str) -> int | None:
+        key = logon.encode()
+        position = self._bisect(key)
+        if position < self._count and self._logon(position) == key:
+            return self._record_at(position)
+        return None
+
+    def _bisect(self, key: bytes, low: int = 0) -> int:
+        """first position of the logon index whose logon is not less than key"""
+        high = self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._logon(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _record_at(self, position: int) -> int:
+        return _U32.unpack_from(self._mm, self._index + 4 * position)[0]
+
+    def _logon(self, position: int) -> bytes:
+        """logon of the record at position of the logon index, logon is the first field"""
+        record = self._record_at(position)
+        string_id = _U32.unpack_from(self._mm, self._records + record * RECORD.size)[0]
+        return self._bytes(string_id)
+
+    def _bytes(self, string_id: int) -> bytes:
+        start, end = _U32_PAIR.unpack_from(self._mm, self._strings + 4 * string_id)
+        return self._mm[self._blob + start : self._blob + end]
+
+    def _string(self, string_id: int) -> str:
+        return self._bytes(string_id).decode()
+
+    def _list(self, list_id: int) -> list[str]:
+        start, end = _U32_PAIR.unpack_from(self._mm, self._lists + 4 * list_id)
+        string_ids = struct.unpack_from(f"<{end - start}I", self._mm, self._list_items + 4 * start)
+        return [self._string(string_id) for string_id in string_ids]
@@ -0,0 +1,142 @@
+"""
+Maps the stations of a station file back to their position in the source text.
+
+Only used to report errors, the positions are computed from the raw text after decoding
+succeeded, following the same layout rules as the DataLoader: a list of stations, an object
+holding a non-empty stations list or a single station.
+"""
+
+import json
+import re
+from bisect import bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_TOML_STATIONS = re.compile(r"\s*\[\[\s*\"?stations\"?\s*\]\]")
+_TOML_TABLE = re.compile(r"\s*\[")
+_TOML_KEY = re.compile(r"\s*([\"']?)([A-Za-z0-9_-]+)\1\s*=")
+
+
+@dataclass(frozen=True)
+class Position:
+    line: int
+    column: int
+
+
+@dataclass
+class RecordPositions:
+    """position of a station and of its fields"""
+
+    start: Position
+    fields: dict[str, Position] = field(default_factory=dict)
+
+    def locate(self, loc: tuple) -> Position:
+        """position of the field a validation error points to, the station if unknown"""
+        if loc and isinstance(loc[0], str) and loc[0] in self.fields:
+            return self.fields[loc[0]]
+        return self.start
+
+
+class _Lines:
+    def __init__(self, text: str):
+        self.starts = [0, *(match.end() for match in re.finditer(r"\n", text))]
+
+    def position(self, offset: int) -> Position:
+        line = bisect_right(self.starts, offset)
+        return Position(line, offset - self.starts[line - 1] + 1)
+
+
+def json_positions(text: str) -> list[RecordPositions]:
+    """positions of the stations of a valid JSON document"""
+    lines = _Lines(text)
+    idx = _skip(text, 0)
+
+    if text.startswith("[", idx):
+        return [_json_record(text, start, lines) for start in _json_elements(text, idx)]
+
+    if not text.startswith("{", idx):
+        return []
+
+    members = _json_members(text, idx)
+    if "stations" in members:
+        elements = list(_json_elements(text, members["stations"][1]))
+        if elements:
+            return [_json_record(text, start, lines) for start in elements]
+
+    return [_record(lines, idx, members)]
+
+
+def toml_positions(text: str) -> list[RecordPositions]:
+    """positions of the stations of a valid TOML document, indexed by table headers"""
+    top = RecordPositions(Position(1, 1))
+    records: list[RecordPositions] = []
+    current: RecordPositions | None = top
+
+    for number, line in enumerate(text.splitlines(), 1):
+        if _TOML_STATIONS.match(line):
+            current = RecordPositions(Position(number, line.index("[") + 1))
+            records.append(current)
+        elif _TOML_TABLE.match(line):
+            # a table which does not belong to any station
+            current = None
+        elif current is not None and (match := _TOML_KEY.match(line)):
+            current.fields.setdefault(match.group(2), Position(number, match.start(1) + 1))
+
+    return records or [top]
+
+
+def _skip(text: str, idx: int) -> int:
+    return _WHITESPACE.match(text, idx).end()
+
+
+def _json_elements(text: str, idx: int) -> Iterator[int]:
+    """offsets of the elements of the array starting at idx"""
+    if not text.startswith("[", idx):
+        return
+
+    idx = _skip(text, idx + 1)
+    if text.startswith("]", idx):
+        return
+
+    while True:
+        yield idx
+        _, idx = _DECODER.scan_once(text, idx)
+        idx = _skip(text, idx)
+        if not text.startswith(",", idx):
+            return
+        idx = _skip(text, idx + 1)
+
+
+def _json_members(text: str, idx: int) -> dict[str, tuple[int, int]]:
+    """offsets of the keys and values of the object starting at idx"""
+    members = {}
+    idx = _skip(text, idx + 1)
+
+    while text.startswith('"', idx):
+        key, end = scanstring(text, idx + 1)
+        value = _skip(text, _skip(text, end) + 1)
+        # like json.loads, the last of duplicate keys wins
+        members[key] = (idx, value)
+
+        _, idx = _DECODER.scan_once(text, value)
+        idx = _skip(text, idx)
+        if text.startswith(",", idx):
+            idx = _skip(text, idx + 1)
+
+    return members
+
+
+def _json_record(text: str, idx: int, lines: _Lines) -> RecordPositions:
+    members = _json_members(text, idx) if text.startswith("{", idx) else {}
+    return _record(lines, idx, members)
+
+
+def _record(lines: _Lines, idx: int, members: dict[str, tuple[int, int]]) -> RecordPositions:
+    return RecordPositions(
+        start=lines.position(idx),
+        fields={key: lines.position(key_idx) for key, (key_idx, _) in members.items()},
+    )
@@ -0,0 +1,99 @@
+import hashlib
+import inspect
+import json
+import logging
+from functools import cache
+from pathlib import Path
+
+import pydantic
+
+from datahub.validators import frequency, icao, logon
+from datahub.views import schedules, station
+from datahub.views.station import Station
+
+logger = logging.getLogger(__name__)
+
+# modules whose source code defines what a valid station is
+SCHEMA_MODULES = [station, schedules, frequency, icao, logon]
+
+
+class ValidationCache:
+    """
+    Persistent cache of already validated stations.
+
+    Entries are keyed by file path and content hash. The whole cache is discarded as soon as the
+    station schema, one of the validators or the pydantic version changes.
+    """
+
+    def __init__(self, cache_file: Path | str):
+        self.cache_file = Path(cache_file)
+        self.fingerprint = ValidationCache.schema_fingerprint()
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+
+        self._read()
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    @cache
+    def schema_fingerprint() -> str:
+        """Hash over the station schema and the source code of all validators"""
+        digest = hashlib.sha256()
+        digest.update(pydantic.VERSION.encode())
+        digest.update(json.dumps(Station.model_json_schema(), sort_keys=True).encode())
+
+        for module in SCHEMA_MODULES:
+            digest.update(inspect.getsource(module).encode())
+
+        return digest.hexdigest()
+
+    def get(self, file_path: Path | str, content_hash: str) -> list[Station] | None:
+        """returns the cached stations of a file or None if the file changed"""
+        entry = self._entries.get(str(file_path))
+
+        if entry is None or entry["hash"] != content_hash:
+            return None
+
+        return [Station.from_trusted(record) for record in entry["stations"]]
+
+    def put(self, file_path: Path | str, content_hash: str, stations: list[Station]):
+        self._entries[str(file_path)] = {
+            "hash": content_hash,
+            "stations": [s.model_dump() for s in stations],
+        }
+        self._dirty = True
+
+    def save(self):
+        """writes the cache to disk, dropping entries of files which no longer exist"""
+        stale = [key for key in self._entries if not Path(key).is_file()]
+        for key in stale:
+            del self._entries[key]
+
+        if not self._dirty and not stale:
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.cache_file.open("w", encoding="utf-8") as f:
+            json.dump({"fingerprint": self.fingerprint, "entries": self._entries}, f)
+
+        self._dirty = False
+
+    def _read(self):
+        if not self.cache_file.is_file():
+            return
+
+        try:
+            with self.cache_file.open("r", encoding="utf-8") as f:
+                cache_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable validation cache %s: %s", self.cache_file, e)
+            return
+
+        if cache_data.get("fingerprint") != self.fingerprint:
+            return
+
+        self._entries = cache_data.get("entries", {})
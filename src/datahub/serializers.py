@@ -0,0 +1,185 @@
+"""
+Serialization backends for the station files and the API outputs.
+
+JSON is handled by orjson if it is installed and by the stdlib json module otherwise, TOML is
+read with the stdlib tomllib. Every backend produces output byte-identical to json.dumps and
+toml.dumps, so switching backends never changes the API. DATAHUB_JSON and DATAHUB_TOML select
+a backend by name, e.g. DATAHUB_JSON=json to rule out orjson while debugging.
+"""
+
+import json
+import os
+import re
+import tomllib
+from functools import cache
+from typing import Any, TextIO
+
+import toml
+
+JSON_ENV = "DATAHUB_JSON"
+TOML_ENV = "DATAHUB_TOML"
+
+# everything the decoders of all backends raise for invalid documents
+DECODE_ERRORS = (json.JSONDecodeError, tomllib.TOMLDecodeError, toml.TomlDecodeError)
+
+# json escapes everything outside of printable ASCII if ensure_ascii is set, orjson never does
+_NON_ASCII = re.compile(r"[\x7f-\U0010ffff]+")
+
+
+class JsonSerializer:
+    """the stdlib json module"""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: int | None = None, ensure_ascii: bool = True) -> str:
+        """same output as json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)"""
+        return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
+
+    def dump(self, obj: Any, f: TextIO, indent: int | None = None, ensure_ascii: bool = True):
+        f.write(self.dumps(obj, indent, ensure_ascii))
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson, several times faster than json for indented output.
+
+    orjson only indents by two spaces and never escapes non-ASCII characters, both is fixed up
+    afterwards. Compact output uses other separators than json.dumps and is left to json, as
+    are documents orjson rejects (e.g. a BOM, NaN or integers beyond 64 bits), so both
+    serializers accept the same documents and raise the same errors. Documents containing
+    floats are written by json as well, orjson formats exponents differently (1e16 instead of
+    1e+16) and writes NaN and Infinity as null.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj: Any, indent: int | None = None, ensure_ascii: bool = True) -> str:
+        if indent is None or _has_float(obj):
+            return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
+
+        try:
+            text = self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
+
+        if indent != 2:
+            text = _reindent(text, indent)
+        if ensure_ascii:
+            text = _NON_ASCII.sub(
+                lambda m: json.encoder.encode_basestring_ascii(m.group())[1:-1], text
+            )
+
+        return text
+
+
+def _has_float(obj: Any) -> bool:
+    """whether a float occurs anywhere in obj, a fraction of the time orjson takes to dump it"""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is float:
+            return True
+        if value_type is dict:
+            stack.extend(value.values())
+        elif value_type is list or value_type is tuple:
+            stack.extend(value)
+    return False
+
+
+def _reindent(text: str, indent: int) -> str:
+    """
+    changes the two space indentation of orjson to indent spaces
+
+    The levels are replaced from the deepest one up with tabs first (raw tabs never occur in
+    JSON output), a few str.replace calls are much faster than a regex substitution per line.
+    """
+    depth = 0
+    while "\n" + "  " * (depth + 1) in text:
+        depth += 1
+
+    for level in range(depth, 0, -1):
+        text = text.replace("\n" + "  " * level, "\n" + "\t" * level)
+
+    return text.replace("\t", " " * indent)
+
+
+class TomlSerializer:
+    """
+    reads with the stdlib tomllib, writes with the toml package
+
+    No other TOML writer reproduces the format of toml.dumps, which the station files use.
+    """
+
+    name = "tomllib"
+
+    def loads(self, data: bytes | str) -> dict[str, Any]:
+        return tomllib.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+    def dumps(self, obj: dict[str, Any]) -> str:
+        return toml.dumps(obj)
+
+
+class TomlPackageSerializer(TomlSerializer):
+    """the toml package for reading as well, several times slower than tomllib"""
+
+    name = "toml"
+
+    def loads(self, data: bytes | str) -> dict[str, Any]:
+        return toml.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+
+# in order of preference
+JSON_SERIALIZERS: dict[str, type[JsonSerializer]] = {
+    "orjson": OrjsonSerializer,
+    "json": JsonSerializer,
+}
+TOML_SERIALIZERS: dict[str, type[TomlSerializer]] = {
+    "tomllib": TomlSerializer,
+    "toml": TomlPackageSerializer,
+}
+
+
+def available(serializers: dict[str, type]) -> dict[str, Any]:
+    """instances of all serializers whose dependencies are installed"""
+    instances = {}
+    for name, serializer in serializers.items():
+        try:
+            instances[name] = serializer()
+        except ImportError:
+            continue
+    return instances
+
+
+@cache
+def json_serializer() -> JsonSerializer:
+    return _select(JSON_SERIALIZERS, os.environ.get(JSON_ENV))
+
+
+@cache
+def toml_serializer() -> TomlSerializer:
+    return _select(TOML_SERIALIZERS, os.environ.get(TOML_ENV))
+
+
+def _select(serializers: dict[str, type], name: str | None):
+    if name:
+        if name not in serializers:
+            msg = f"Unknown serializer {name}, expected one of {', '.join(serializers)}"
+            raise ValueError(msg)
+        return serializers[name]()
+
+    return next(iter(available(serializers).values()))
@@ -0,0 +1,210 @@
+import hashlib
+import json
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from datahub.loaders.data_loader import PoolMode
+from datahub.validators.frequency import frequency_validator
+from datahub.views.airport_index import AirportIndex
+from datahub.views.data_source import DataSource
+from datahub.views.logon_index import LogonIndex
+from datahub.views.schedule_index import ScheduleIndex
+from datahub.views.station import Station
+from datahub.watch import DataWatcher
+
+if TYPE_CHECKING:
+    from datahub.loaders.validation_cache import ValidationCache
+
+logger = logging.getLogger(__name__)
+
+
+class StationQuery:
+    """In-memory indexes over one version of the dataset, answering the lookups of the service"""
+
+    def __init__(self, data: list[DataSource]):
+        self.stations: dict[str, Station] = {}
+        self.by_frequency: dict[str, list[Station]] = {}
+
+        for ds in data:
+            for station in ds.data:
+                self.stations[station.logon] = station
+                self.by_frequency.setdefault(station.frequency, []).append(station)
+
+        self.logons = LogonIndex(self.stations)
+        # the same index as legacy/airport_stations.json
+        self.airports = AirportIndex.from_data(data)
+        self.schedules = ScheduleIndex.from_data(data)
+
+    def logon(self, logon: str) -> Station | None:
+        return self.stations.get(logon.upper())
+
+    def prefix(self, prefix: str) -> list[Station]:
+        return [self.stations[logon] for logon in self.logons.resolve(prefix.upper())]
+
+    def frequency(self, frequency: str) -> list[Station]:
+        return self.by_frequency.get(frequency_validator(frequency), [])
+
+    def airport(self, icao: str) -> list[Station]:
+        return [self.stations[logon] for logon in self.airports.stations_of(icao.upper())]
+
+    def schedule(self, schedule_type: str) -> dict | None:
+        schedule_type = schedule_type.upper()
+        if schedule_type not in self.schedules.schedule_types:
+            return None
+
+        return {
+            "name": schedule_type,
+            "schedule_show_always": self.schedules.show_always(schedule_type),
+            "schedule_show_booked": self.schedules.show_booked(schedule_type),
+        }
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    Read-only HTTP service over the station data.
+
+    GET /stations/<logon>                 single station
+    GET /stations?prefix=EDDF             stations whose logon starts with the prefix
+    GET /stations?frequency=119.900       stations on a frequency
+    GET /stations?airport=EDDF            stations relevant for an airport (relevant_airports)
+    GET /schedules/<type>                 schedule as in legacy/schedule.json
+    GET /                                 number of stations and schedule types
+
+    Every response carries an ETag, requests with a matching If-None-Match get a 304. The data
+    is reloaded by a DataWatcher, only the changed files are revalidated. As long as the data is
+    invalid, the last valid version is served.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], watcher: DataWatcher):
+        super().__init__(address, QueryHandler)
+        self.watcher = watcher
+        self.query = StationQuery([])
+        self.reload()
+
+    def reload(self) -> bool:
+        """revalidates the changed files, returns True if a new version is served"""
+        result = self.watcher.refresh()
+        if result is None:
+            return False
+
+        DataWatcher.report(result)
+        if not result.ok:
+            return False
+
+        # replacing the reference is atomic, running requests keep their version
+        self.query = StationQuery(self.watcher.data)
+        return True
+
+    def reload_forever(self, interval: float, stop: threading.Event):
+        while not stop.wait(interval):
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Reloading the data failed")
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    server: QueryServer
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        try:
+            status, payload = QueryHandler.route(self.server.query, parts, params)
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+
+        self.send_json(status, payload)
+
+    @staticmethod
+    def route(query: StationQuery, parts: list[str], params: dict[str, str]):
+        if not parts:
+            return HTTPStatus.OK, {
+                "stations": len(query.stations),
+                "schedules": query.schedules.schedule_types,
+            }
+
+        if parts[0] == "stations" and len(parts) == 2:
+            station = query.logon(parts[1])
+            if station is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"unknown logon {parts[1]}"}
+            return HTTPStatus.OK, station.to_dict()
+
+        if parts[0] == "stations" and len(parts) == 1:
+            lookups = {
+                "prefix": query.prefix,
+                "frequency": query.frequency,
+                "airport": query.airport,
+            }
+            if len(params) != 1 or next(iter(params)) not in lookups:
+                msg = f"expected exactly one of the parameters {', '.join(lookups)}"
+                raise ValueError(msg)
+
+            key, value = next(iter(params.items()))
+            return HTTPStatus.OK, [station.to_dict() for station in lookups[key](value)]
+
+        if parts[0] == "schedules" and len(parts) == 2:
+            schedule = query.schedule(parts[1])
+            if schedule is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"unknown schedule {parts[1]}"}
+            return HTTPStatus.OK, schedule
+
+        return HTTPStatus.NOT_FOUND, {"error": "not found"}
+
+    def send_json(self, status: HTTPStatus, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+        if_none_match = {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}
+        if status == HTTPStatus.OK and etag in if_none_match:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+def serve(
+    data_dir: Path | str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    interval: float = 1.0,
+    workers: int | None = None,
+    pool: PoolMode = "thread",
+    cache: "ValidationCache | None" = None,
+):
+    """serves the data until interrupted, reloading changed files every interval seconds"""
+    watcher = DataWatcher(data_dir, workers=workers, pool=pool, cache=cache)
+    server = QueryServer((host, port), watcher)
+    stop = threading.Event()
+    reloader = threading.Thread(
+        target=server.reload_forever, args=(interval, stop), name="reloader", daemon=True
+    )
+    reloader.start()
+
+    print(f"Serving {len(server.query.stations)} stations on http://{host}:{server.server_port}/")
+
+    try:
+        server.serve_forever()
+    finally:
+        stop.set()
+        server.server_close()
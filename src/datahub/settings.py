@@ -1 +1,35 @@
+from pathlib import Path
+
 JSON_INDENT = 4
+
+DATA_DIR = Path("data/")
+API_DIR = Path("api/")
+
+# folders below the data directory which do not hold station files
+EXCLUDE_FOLDERS = frozenset({"event_schedules", "topsky"})
+
+# exporters available to the combine command and the ones run by default
+EXPORTERS = (
+    "data",
+    "stations",
+    "teamspeak",
+    "schedule",
+    "airports",
+    "topsky",
+    "calendar",
+    "bookings",
+    "snapshot",
+)
+DEFAULT_EXPORTERS = ("data", "stations", "teamspeak", "schedule", "airports", "topsky", "calendar")
+
+# relative to the data directory
+CPDLC_MAPPING = Path("topsky/cpdlcMap.json")
+EVENT_SCHEDULES = Path("event_schedules")
+
+VALIDATION_CACHE = Path(".datahub_cache/validation.json")
+BUILD_MANIFEST = Path(".datahub_cache/build_manifest.json")
+HTTP_CACHE = Path(".datahub_cache/http")
+
+VATEUD_URL = "https://fsmine.dhis.org/vateud8"
+# seconds a fetched VATEUD page is used without asking the server for changes
+VATEUD_TTL = 3600
@@ -1,11 +1,18 @@
+import heapq
+from collections.abc import Iterable, Iterator
+from functools import cache
+
 from datahub.validators.logon import LOGON_SUFFIXES
 from datahub.views.data_source import DataSource
 from datahub.views.station import Station
+from datahub.views.station_store import StationStore, StationView
+
+SUFFIX_RANK = {suffix: rank for rank, suffix in enumerate(LOGON_SUFFIXES)}
 
 
 class StationSorter:
     @staticmethod
-    def sort(source: DataSource | list[DataSource]):
+    def sort(source: DataSource | list[DataSource] | StationStore):
         # list data source objects
         if isinstance(source, list) and source and isinstance(source[0], DataSource):
             for ds in source:
@@ -15,8 +22,15 @@ class StationSorter:
         elif isinstance(source, DataSource):
             source.data = StationSorter.sort(source.data)
             return source
+        # compact station store
+        elif isinstance(source, StationStore):
+            return source.take(
+                sorted(range(len(source)), key=lambda i: StationSorter.logon_key(source.logons[i]))
+            )
         # list of stations
-        elif isinstance(source, list) and (not source or isinstance(source[0], Station)):
+        elif isinstance(source, list) and (
+            not source or isinstance(source[0], (Station, StationView))
+        ):
             return StationSorter.sort_stations(source)
         # unsupported types:
         elif isinstance(source, list) and not source:
@@ -27,14 +41,19 @@ class StationSorter:
 
     @staticmethod
     def sort_key(station):
-        logon = StationSorter.get_logon(station)
+        return StationSorter.logon_key(StationSorter.get_logon(station))
+
+    @staticmethod
+    @cache
+    def logon_key(logon: str) -> tuple:
+        """parses a logon once into its sort key (prefix, suffix rank, middle part)"""
         parts = logon.split("_")
 
         prefix = parts[0] if len(parts) > 0 else ""
         middle = parts[1] if len(parts) > 1 else ""
         third = parts[2] if len(parts) > 2 else parts[1] if len(parts) > 1 else ""
 
-        suffix_order = LOGON_SUFFIXES.index(third) if third in LOGON_SUFFIXES else float("inf")
+        suffix_order = SUFFIX_RANK.get(third, float("inf"))
 
         return (prefix, suffix_order, middle)
 
@@ -56,3 +75,20 @@ class StationSorter:
     @staticmethod
     def sort_stations(stations: list[Station]) -> list[Station]:
         return sorted(stations, key=StationSorter.sort_key)
+
+    @staticmethod
+    def merge(station_lists: Iterable[list[Station]]) -> list[Station]:
+        """
+        Combines several station lists into one sorted list.
+
+        The lists are expected to be sorted already (e.g. the per-file lists after sort), in that
+        case they are merged in linear time. Unsorted lists are sorted first. The result is equal
+        to sorting the concatenation of all lists.
+        """
+        return list(StationSorter.imerge(station_lists))
+
+    @staticmethod
+    def imerge(station_lists: Iterable[list[Station]]) -> Iterator[Station]:
+        """lazy variant of merge, yields the stations in sorted order"""
+        sorted_lists = [StationSorter.sort_stations(stations) for stations in station_lists]
+        return heapq.merge(*sorted_lists, key=StationSorter.sort_key)
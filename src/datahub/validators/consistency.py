@@ -0,0 +1,152 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from datahub.views.data_source import DataSource
+from datahub.views.event_schedule import EventSchedule
+from datahub.views.logon_index import LogonIndex
+from datahub.views.station import Station
+
+Severity = Literal["error", "warning"]
+
+
+@dataclass(frozen=True)
+class Index:
+    """a station attribute which has to be unique within its scope"""
+
+    name: str
+    key: Callable[[DataSource, Station], tuple | None]
+    severity: Severity
+
+
+def _fir(source: DataSource) -> str:
+    return Path(source.source).parts[0]
+
+
+def _prefix(station: Station) -> str:
+    return station.logon.split("_")[0]
+
+
+INDEXES = (
+    Index("logon", lambda ds, s: (s.logon,), "error"),
+    Index("cpdlc_login", lambda ds, s: (s.cpdlc_login,) if s.cpdlc_login else None, "error"),
+    # the following duplicates exist on purpose in the current data, they are reported only
+    Index("abbreviation", lambda ds, s: (_fir(ds), s.abbreviation), "warning"),
+    Index("frequency", lambda ds, s: (s.frequency, _prefix(s)), "warning"),
+)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    index: str
+    key: tuple
+    severity: Severity
+    source: str
+    logon: str
+    other_source: str
+    other_logon: str
+
+    def __str__(self) -> str:
+        return (
+            f"Duplicate {self.index} {'/'.join(self.key)} of {self.logon},"
+            f" already used by {self.other_logon} in {self.other_source}"
+        )
+
+
+def find_conflicts(data: list[DataSource], indexes=INDEXES) -> list[Conflict]:
+    """
+    Checks all stations against each other in a single sweep.
+
+    Every station is looked up in one hash index per attribute, a station conflicts with the
+    first station registered under the same key. Stations sharing the same logon are only
+    reported once, as duplicate logon.
+    """
+    seen: list[dict[tuple, tuple[str, Station]]] = [{} for _ in indexes]
+    conflicts = []
+
+    for ds in data:
+        for station in ds.data:
+            for index, entries in zip(indexes, seen, strict=True):
+                key = index.key(ds, station)
+                if key is None:
+                    continue
+
+                other = entries.setdefault(key, (ds.source, station))
+                other_source, other_station = other
+                if other_station is station:
+                    continue
+                if index.name != "logon" and other_station.logon == station.logon:
+                    continue
+
+                conflicts.append(
+                    Conflict(
+                        index=index.name,
+                        key=key,
+                        severity=index.severity,
+                        source=ds.source,
+                        logon=station.logon,
+                        other_source=other_source,
+                        other_logon=other_station.logon,
+                    )
+                )
+
+    return conflicts
+
+
+def report_conflicts(conflicts: list[Conflict], data_dir: Path | str):
+    """prints the conflicts as GitHub annotations, raises if any of them is an error"""
+    from datahub.loaders.data_loader import DataLoader
+
+    data_dir = Path(data_dir)
+    positions = {}
+
+    for conflict in conflicts:
+        file_path = data_dir / conflict.source
+        if file_path not in positions:
+            positions[file_path] = DataLoader.locate_stations(file_path)
+
+        position = positions[file_path].get(conflict.logon)
+        location = f"line={position.line},col={position.column}" if position else "line=1"
+        print(f"::{conflict.severity} file={file_path},{location}::{conflict}")
+
+    errors = sum(conflict.severity == "error" for conflict in conflicts)
+    if errors:
+        msg = f"Consistency check found {errors} errors."
+        raise RuntimeError(msg)
+
+
+@dataclass(frozen=True)
+class DanglingBooking:
+    source: str
+    booking: str
+
+    def __str__(self) -> str:
+        return f"Booking entry {self.booking} does not match any station logon"
+
+
+def find_dangling_bookings(
+    schedules: list[EventSchedule], index: LogonIndex
+) -> list[DanglingBooking]:
+    """booking entries of the event schedules which neither are nor prefix any logon"""
+    dangling = []
+
+    for schedule in schedules:
+        entries = dict.fromkeys(entry for rule in schedule.rules for entry in rule.booking)
+        dangling.extend(
+            DanglingBooking(schedule.source, entry) for entry in entries if not index.resolve(entry)
+        )
+
+    return dangling
+
+
+def report_dangling_bookings(dangling: list[DanglingBooking], schedule_dir: Path | str):
+    """prints the dangling booking entries as GitHub annotations, raises if there are any"""
+    schedule_dir = Path(schedule_dir)
+
+    for booking in dangling:
+        print(f"::error file={schedule_dir / booking.source},line=1::{booking}")
+
+    if dangling:
+        msg = f"Event schedules contain {len(dangling)} dangling booking entries."
+        raise RuntimeError(msg)
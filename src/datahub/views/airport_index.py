@@ -0,0 +1,48 @@
+from collections.abc import Iterable
+
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class AirportIndex:
+    """Inverted index from airport to the stations listing it in relevant_airports, and back"""
+
+    def __init__(self, stations: Iterable[Station] = ()):
+        # dicts keep the insertion order, i.e. the order of the sorted data
+        self._stations: dict[str, dict[str, None]] = {}
+        self._airports: dict[str, list[str]] = {}
+
+        for station in stations:
+            self.add(station)
+
+    @staticmethod
+    def from_data(data: list[DataSource]) -> "AirportIndex":
+        return AirportIndex(station for ds in data for station in ds.data)
+
+    def add(self, station: Station):
+        if not station.relevant_airports:
+            return
+
+        airports = self._airports.setdefault(station.logon, [])
+        for airport in station.relevant_airports:
+            if airport not in airports:
+                airports.append(airport)
+            self._stations.setdefault(airport, {})[station.logon] = None
+
+    @property
+    def airports(self) -> list[str]:
+        return sorted(self._stations)
+
+    def stations_of(self, airport: str) -> list[str]:
+        """logons relevant for the airport, in the order of the data"""
+        return list(self._stations.get(airport, ()))
+
+    def airports_of(self, logon: str) -> list[str]:
+        """airports the station is relevant for"""
+        return list(self._airports.get(logon, ()))
+
+    def to_dict(self) -> dict[str, dict[str, list[str]]]:
+        return {
+            "airports": {airport: self.stations_of(airport) for airport in self.airports},
+            "stations": {logon: self.airports_of(logon) for logon in sorted(self._airports)},
+        }
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from datahub.views.station import Station
+if TYPE_CHECKING:
+    from datahub.views.station import Station
+    from datahub.views.station_store import StationStore
 
 
 @dataclass
 class DataSource:
     source: str
-    data: list[Station]
+    data: "list[Station] | StationStore"
@@ -0,0 +1,107 @@
+import calendar
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter, field_validator
+
+# ISO weekday, 1 = monday
+Weekday = Annotated[int, Field(ge=1, le=7)]
+
+
+class EventRule(BaseModel, ABC):
+    """stations matching an entry of booking (logon prefixes) are wanted on every occurrence"""
+
+    booking: list[str]
+
+    @field_validator("booking")
+    @classmethod
+    def validate_booking(cls, booking: list[str]) -> list[str]:
+        return [entry.strip().upper() for entry in booking]
+
+    @abstractmethod
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        """all dates between start and end (inclusive) the rule applies to, in order"""
+
+
+class WeekdayRule(EventRule):
+    """every week on the given day"""
+
+    rule: Literal["weekday"] = "weekday"
+    day: Weekday
+
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        first = start + timedelta(days=(self.day - start.isoweekday()) % 7)
+        yield from _every(first, end, 7)
+
+
+class EveryXDaysRule(EventRule):
+    """every X days before, on and after one_date"""
+
+    rule: Literal["every_X_days"]
+    one_date: date
+    days: Annotated[int, Field(ge=1)]
+
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        first = start + timedelta(days=(self.one_date - start).days % self.days)
+        yield from _every(first, end, self.days)
+
+
+class EveryXDayInMonthRule(EventRule):
+    """the n-th (0 = first) day_of_week of every month"""
+
+    rule: Literal["every_X_day_in_month"]
+    day_of_week: Weekday
+    number_day_in_month: Annotated[int, Field(ge=0, le=4)]
+
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        year, month = start.year, start.month
+
+        while (year, month) <= (end.year, end.month):
+            first_weekday, days_in_month = calendar.monthrange(year, month)
+            day = 1 + (self.day_of_week - 1 - first_weekday) % 7 + 7 * self.number_day_in_month
+
+            if day <= days_in_month and start <= (occurrence := date(year, month, day)) <= end:
+                yield occurrence
+
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _every(first: date, end: date, step: int) -> Iterator[date]:
+    for offset in range(0, (end - first).days + 1, step):
+        yield first + timedelta(days=offset)
+
+
+def _rule_tag(value) -> str:
+    """entries without a rule are weekday rules"""
+    if isinstance(value, dict):
+        return value.get("rule", "weekday")
+    return getattr(value, "rule", "weekday")
+
+
+AnyEventRule = Annotated[
+    Annotated[WeekdayRule, Tag("weekday")]
+    | Annotated[EveryXDaysRule, Tag("every_X_days")]
+    | Annotated[EveryXDayInMonthRule, Tag("every_X_day_in_month")],
+    Discriminator(_rule_tag),
+]
+
+EVENT_RULES = TypeAdapter(list[AnyEventRule])
+
+
+@dataclass
+class EventSchedule:
+    source: str
+    rules: list[EventRule]
+
+    def wanted(self, start: date, end: date) -> dict[date, list[str]]:
+        """booking entries wanted per date between start and end (inclusive)"""
+        bookings: dict[date, set[str]] = {}
+
+        for rule in self.rules:
+            for occurrence in rule.occurrences(start, end):
+                bookings.setdefault(occurrence, set()).update(rule.booking)
+
+        return {day: sorted(bookings[day]) for day in sorted(bookings)}
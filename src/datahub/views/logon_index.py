@@ -0,0 +1,43 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from datahub.views.data_source import DataSource
+
+# sorts after every character which can appear in a logon
+_MAX_CHAR = "\U0010ffff"
+
+
+class LogonIndex:
+    """
+    Sorted index of all logons, resolves exact logons and logon prefixes.
+
+    All logons starting with a prefix form a contiguous range of the sorted list, which is found
+    with two binary searches, so resolving an entry costs O(log n + matches).
+    """
+
+    def __init__(self, logons: Iterable[str] = ()):
+        self.logons: list[str] = sorted(set(logons))
+
+    @staticmethod
+    def from_data(data: list[DataSource]) -> "LogonIndex":
+        return LogonIndex(station.logon for ds in data for station in ds.data)
+
+    def __len__(self) -> int:
+        return len(self.logons)
+
+    def __contains__(self, logon: str) -> bool:
+        i = bisect_left(self.logons, logon)
+        return i < len(self.logons) and self.logons[i] == logon
+
+    def resolve(self, prefix: str) -> list[str]:
+        """all logons starting with prefix (including an exact match), in sorted order"""
+        start = bisect_left(self.logons, prefix)
+        end = bisect_left(self.logons, prefix + _MAX_CHAR, start)
+        return self.logons[start:end]
+
+    def expand(self, entries: Iterable[str]) -> list[str]:
+        """resolves all entries, returns the sorted union of the matching logons"""
+        logons = set()
+        for entry in entries:
+            logons.update(self.resolve(entry))
+        return sorted(logons)
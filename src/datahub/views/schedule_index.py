@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+
+from datahub.views.data_source import DataSource
+from datahub.views.schedules import MIL_LOGON_PREFIX, MIL_SCHEDULE, SCHEDULE_TYPES
+from datahub.views.station import Station
+
+
+class ScheduleIndex:
+    """Inverted index from schedule type to the logons shown always or only when booked"""
+
+    def __init__(self, stations: Iterable[Station] = ()):
+        self._always: dict[str, set[str]] = {t: set() for t in SCHEDULE_TYPES}
+        self._booked: dict[str, set[str]] = {t: set() for t in SCHEDULE_TYPES}
+
+        for station in stations:
+            self.add(station)
+
+    @staticmethod
+    def from_data(data: list[DataSource]) -> "ScheduleIndex":
+        return ScheduleIndex(station for ds in data for station in ds.data)
+
+    def add(self, station: Station):
+        always = station.schedule_show_always or []
+        booked = station.schedule_show_booked or []
+
+        for schedule_type in always:
+            self._always[schedule_type].add(station.logon)
+        for schedule_type in booked:
+            self._booked[schedule_type].add(station.logon)
+
+        # military stations appear on the MIL schedule if they are on any schedule
+        if station.logon.startswith(MIL_LOGON_PREFIX):
+            if always:
+                self._always[MIL_SCHEDULE].add(station.logon)
+            if booked:
+                self._booked[MIL_SCHEDULE].add(station.logon)
+
+    @property
+    def schedule_types(self) -> list[str]:
+        return sorted(self._always)
+
+    def show_always(self, schedule_type: str) -> list[str]:
+        """logons always shown on the schedule, sorted"""
+        return sorted(self._always[schedule_type])
+
+    def show_booked(self, schedule_type: str) -> list[str]:
+        """logons shown on the schedule if they are booked, sorted"""
+        return sorted(self._booked[schedule_type])
+
+    def schedules_of(self, logon: str) -> tuple[list[str], list[str]]:
+        """schedules a logon is shown on always and when booked"""
+        always = [t for t in self.schedule_types if logon in self._always[t]]
+        booked = [t for t in self.schedule_types if logon in self._booked[t]]
+        return always, booked
@@ -1,4 +1,9 @@
-from typing import Literal
-
+from typing import Literal, get_args
 
 ScheduleType = Literal["EDGG", "EDMM", "EDWW"]
+
+# military stations (logons starting with ET) are shown on their own schedule
+MIL_SCHEDULE = "MIL"
+MIL_LOGON_PREFIX = "ET"
+
+SCHEDULE_TYPES: tuple[str, ...] = (*get_args(ScheduleType), MIL_SCHEDULE)
@@ -21,6 +21,14 @@ class Station(BaseModel):
     cpdlc_login: str | None = None
     s1_theory: bool | None = None
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Station":
+        """
+        Creates a station from already validated and normalized data without running the
+        validators, e.g. records restored from the validation cache.
+        """
+        return cls.model_construct(**data)
+
     def to_dict(self) -> dict:
         """returns the station as dict, hides fields which are None or empty lists"""
         data = self.model_dump(exclude_none=True)
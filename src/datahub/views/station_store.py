@@ -0,0 +1,246 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from datahub.views.data_source import DataSource
+from datahub.views.schedules import SCHEDULE_TYPES
+from datahub.views.station import Station
+
+GCAP_STATUS_CODES = (None, "AFIS", "1", "2")
+
+# bit per schedule type used in the schedule membership masks
+SCHEDULE_BITS = {schedule_type: 1 << i for i, schedule_type in enumerate(SCHEDULE_TYPES)}
+
+_NONE = -1
+
+
+class StationStore(Sequence):
+    """
+    Compact columnar storage of stations for large datasets.
+
+    Logon prefixes are interned into a string table and frequencies are stored as integer kHz.
+    Schedule lists are interned into a small table holding the membership bitmask of every
+    distinct list, each row only stores the table index. Indexing or iterating the store yields
+    StationView objects which expose the same attributes as Station, so exporters and the
+    StationSorter can consume a store directly. Conversion from and to validated Station objects
+    is lossless.
+    """
+
+    __slots__ = (
+        "abbreviations",
+        "airports",
+        "cpdlc_logins",
+        "descriptions",
+        "frequencies",
+        "gcap_status",
+        "logons",
+        "prefix_ids",
+        "prefix_lookup",
+        "prefixes",
+        "s1_theory",
+        "s1_twr",
+        "schedule_always",
+        "schedule_booked",
+        "schedule_list_lookup",
+        "schedule_lists",
+        "schedule_masks",
+    )
+
+    def __init__(self, stations: Iterable["Station | StationView"] = ()):
+        self.prefixes: list[str] = []
+        self.prefix_lookup: dict[str, int] = {}
+        self.schedule_lists: list[tuple[str, ...] | None] = [None]
+        self.schedule_masks = array("B", [0])
+        self.schedule_list_lookup: dict[tuple[str, ...] | None, int] = {None: 0}
+
+        self.logons: list[str] = []
+        self.prefix_ids = array("I")
+        self.frequencies = array("I")
+        self.abbreviations: list[str] = []
+        self.descriptions: list[str | None] = []
+        self.schedule_always = array("H")
+        self.schedule_booked = array("H")
+        self.airports: list[tuple[str, ...] | None] = []
+        self.gcap_status = array("b")
+        self.s1_twr = array("b")
+        self.cpdlc_logins: list[str | None] = []
+        self.s1_theory = array("b")
+
+        for station in stations:
+            self.append(station)
+
+    def __len__(self) -> int:
+        return len(self.logons)
+
+    def __getitem__(self, index: int) -> "StationView":
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "station index out of range"
+            raise IndexError(msg)
+
+        return StationView(self, index)
+
+    def __iter__(self) -> Iterator["StationView"]:
+        for index in range(len(self)):
+            yield StationView(self, index)
+
+    @staticmethod
+    def from_data(data: list[DataSource]) -> list[DataSource]:
+        """converts the stations of all data sources into compact stores"""
+        return [DataSource(source=ds.source, data=StationStore(ds.data)) for ds in data]
+
+    def append(self, station: "Station | StationView"):
+        prefix = station.logon.split("_")[0]
+        prefix_id = self.prefix_lookup.get(prefix)
+        if prefix_id is None:
+            prefix_id = self.prefix_lookup[prefix] = len(self.prefixes)
+            self.prefixes.append(sys.intern(prefix))
+
+        self.logons.append(station.logon)
+        self.prefix_ids.append(prefix_id)
+        self.frequencies.append(round(float(station.frequency) * 1000))
+        self.abbreviations.append(station.abbreviation)
+        self.descriptions.append(station.description)
+        self.schedule_always.append(self._schedule_list_id(station.schedule_show_always))
+        self.schedule_booked.append(self._schedule_list_id(station.schedule_show_booked))
+        self.airports.append(
+            tuple(station.relevant_airports) if station.relevant_airports is not None else None
+        )
+        self.gcap_status.append(GCAP_STATUS_CODES.index(station.gcap_status))
+        self.s1_twr.append(_encode_bool(station.s1_twr))
+        self.cpdlc_logins.append(station.cpdlc_login)
+        self.s1_theory.append(_encode_bool(station.s1_theory))
+
+    def _schedule_list_id(self, schedule_types: list[str] | None) -> int:
+        key = tuple(schedule_types) if schedule_types is not None else None
+        list_id = self.schedule_list_lookup.get(key)
+
+        if list_id is None:
+            list_id = self.schedule_list_lookup[key] = len(self.schedule_lists)
+            self.schedule_lists.append(key)
+
+            mask = 0
+            for schedule_type in key:
+                mask |= SCHEDULE_BITS[schedule_type]
+            self.schedule_masks.append(mask)
+
+        return list_id
+
+    def take(self, indices: Iterable[int]) -> "StationStore":
+        """returns a new store holding the given rows in the given order"""
+        return StationStore(StationView(self, i) for i in indices)
+
+    def to_station(self, index: int) -> Station:
+        return Station.from_trusted(StationView(self, index).to_record())
+
+    def to_stations(self) -> list[Station]:
+        return [self.to_station(i) for i in range(len(self))]
+
+
+class StationView:
+    """Lightweight read-only view of a single row of a StationStore"""
+
+    __slots__ = ("_index", "_store")
+
+    def __init__(self, store: StationStore, index: int):
+        self._store = store
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"StationView({self.logon!r})"
+
+    @property
+    def logon(self) -> str:
+        return self._store.logons[self._index]
+
+    @property
+    def prefix(self) -> str:
+        """interned logon prefix"""
+        return self._store.prefixes[self._store.prefix_ids[self._index]]
+
+    @property
+    def frequency_khz(self) -> int:
+        return self._store.frequencies[self._index]
+
+    @property
+    def frequency(self) -> str:
+        khz = self.frequency_khz
+        return f"{khz // 1000}.{khz % 1000:03d}"
+
+    @property
+    def abbreviation(self) -> str:
+        return self._store.abbreviations[self._index]
+
+    @property
+    def description(self) -> str | None:
+        return self._store.descriptions[self._index]
+
+    @property
+    def schedule_show_always(self) -> list[str] | None:
+        return self._schedule_list(self._store.schedule_always[self._index])
+
+    @property
+    def schedule_show_booked(self) -> list[str] | None:
+        return self._schedule_list(self._store.schedule_booked[self._index])
+
+    @property
+    def schedule_always_mask(self) -> int:
+        """bitmask of the schedules the station is always shown on, see SCHEDULE_BITS"""
+        return self._store.schedule_masks[self._store.schedule_always[self._index]]
+
+    @property
+    def schedule_booked_mask(self) -> int:
+        """bitmask of the schedules the station is shown on if booked, see SCHEDULE_BITS"""
+        return self._store.schedule_masks[self._store.schedule_booked[self._index]]
+
+    @property
+    def relevant_airports(self) -> list[str] | None:
+        airports = self._store.airports[self._index]
+        return list(airports) if airports is not None else None
+
+    @property
+    def gcap_status(self) -> str | None:
+        return GCAP_STATUS_CODES[self._store.gcap_status[self._index]]
+
+    @property
+    def s1_twr(self) -> bool | None:
+        return _decode_bool(self._store.s1_twr[self._index])
+
+    @property
+    def cpdlc_login(self) -> str | None:
+        return self._store.cpdlc_logins[self._index]
+
+    @property
+    def s1_theory(self) -> bool | None:
+        return _decode_bool(self._store.s1_theory[self._index])
+
+    def to_record(self) -> dict:
+        """all fields of the station, equivalent to Station.model_dump"""
+        return {field: getattr(self, field) for field in Station.model_fields}
+
+    def model_dump(self) -> dict:
+        """same as to_record, for code dumping stations such as the ValidationCache"""
+        return self.to_record()
+
+    def to_dict(self) -> dict:
+        """returns the station as dict, hides fields which are None or empty lists"""
+        return {k: v for k, v in self.to_record().items() if v is not None and v != []}
+
+    def to_station(self) -> Station:
+        return self._store.to_station(self._index)
+
+    def _schedule_list(self, list_id: int) -> list[str] | None:
+        schedule_types = self._store.schedule_lists[list_id]
+        return list(schedule_types) if schedule_types is not None else None
+
+
+def _encode_bool(value: bool | None) -> int:
+    return _NONE if value is None else int(value)
+
+
+def _decode_bool(value: int) -> bool | None:
+    return None if value == _NONE else bool(value)
@@ -0,0 +1,251 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from datahub.loaders.data_loader import DataLoader, PoolMode
+from datahub.settings import CPDLC_MAPPING, EXCLUDE_FOLDERS
+from datahub.sorting.station_sorter import StationSorter
+from datahub.validators.consistency import Conflict, find_conflicts
+from datahub.views.data_source import DataSource
+
+if TYPE_CHECKING:
+    from datahub.loaders.validation_cache import ValidationCache
+    from datahub.views.station import Station
+
+logger = logging.getLogger(__name__)
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+@dataclass
+class WatchResult:
+    changed: list[str]
+    stations: int
+    errors: dict[str, str]
+    conflicts: list[Conflict]
+    seconds: float
+    outputs: list[Path] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and all(c.severity != "error" for c in self.conflicts)
+
+
+class DataWatcher:
+    """
+    Keeps the validated dataset in memory and revalidates only the files which changed.
+
+    Changes are detected by comparing the mtime and size of all station files (and the CPDLC
+    mapping). If an api_dir is given, the outputs depending on the changed files are rebuilt
+    using the build manifest, as long as the whole dataset is valid. workers, pool and cache are
+    passed on to the DataLoader for every batch of changed files.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | str,
+        api_dir: Path | str | None = None,
+        exporters: list[str] | None = None,
+        manifest_path: Path | str | None = None,
+        workers: int | None = None,
+        pool: PoolMode = "thread",
+        cache: "ValidationCache | None" = None,
+    ):
+        self.data_dir = Path(data_dir)
+        self.api_dir = Path(api_dir) if api_dir is not None else None
+        self.exporters = exporters
+        self.manifest_path = manifest_path
+        self.cpdlc_mapping = self.data_dir / CPDLC_MAPPING
+        self.workers = workers
+        self.pool = pool
+        self.cache = cache
+
+        # sorted stations of every valid file and the error of every invalid one
+        self.files: dict[Path, list[Station]] = {}
+        self.errors: dict[Path, str] = {}
+        self._order: list[Path] = []
+        self._snapshot: Snapshot = {}
+        # changes of a failed update, retried with the next change
+        self._pending: set[Path] = set()
+        # sources changed since the last successful export, the manifest recomputes them
+        self._unexported: set[str] = set()
+
+    @property
+    def data(self) -> list[DataSource]:
+        """valid data in the order of the DataLoader"""
+        return [
+            DataSource(source=self._source(file_path), data=self.files[file_path])
+            for file_path in self._order
+            if self.files.get(file_path)
+        ]
+
+    def scan(self) -> set[Path]:
+        """returns all files which were added, modified or removed since the last scan"""
+        snapshot = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = snapshot
+
+        return {
+            file_path
+            for file_path in snapshot.keys() | previous.keys()
+            if snapshot.get(file_path) != previous.get(file_path)
+        }
+
+    def refresh(self) -> WatchResult | None:
+        """scans for changes and updates the dataset, returns None if nothing changed"""
+        changed = self.scan()
+        if not changed:
+            return None
+
+        self._pending |= changed
+        result = self.update(self._pending)
+        self._pending = set()
+        return result
+
+    def update(self, changed: set[Path]) -> WatchResult:
+        start = time.perf_counter()
+
+        self._order = DataLoader._collect_files(self.data_dir, set(EXCLUDE_FOLDERS))
+
+        for file_path in changed:
+            self.files.pop(file_path, None)
+            self.errors.pop(file_path, None)
+
+        files = [
+            file_path
+            for file_path in changed
+            if file_path != self.cpdlc_mapping and file_path.is_file()
+        ]
+        results = DataLoader._parse_files(files, self.workers, self.pool, self.cache)
+
+        for file_path, (stations, error) in zip(files, results, strict=True):
+            if error is not None:
+                self.errors[file_path] = error
+            else:
+                self.files[file_path] = StationSorter.sort(stations)
+
+        if self.cache is not None:
+            self.cache.save()
+
+        data = self.data
+        conflicts = find_conflicts(data)
+
+        result = WatchResult(
+            changed=sorted(
+                self._source(file_path) for file_path in changed if file_path != self.cpdlc_mapping
+            ),
+            stations=sum(len(ds.data) for ds in data),
+            errors={self._source(file_path): error for file_path, error in self.errors.items()},
+            conflicts=conflicts,
+            seconds=0.0,
+        )
+
+        self._unexported.update(result.changed)
+        if self.api_dir is not None and result.ok:
+            result.outputs = self._export(data, self._unexported)
+            self._unexported = set()
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def watch(
+        self,
+        interval: float = 0.5,
+        poll: bool = False,
+        stop: threading.Event | None = None,
+    ):
+        """validates the dataset, then revalidates on every change until stop is set"""
+        stop = stop or threading.Event()
+        wake_up = threading.Event()
+        observer = None if poll else self._start_observer(wake_up)
+
+        try:
+            self._refresh_and_report()
+
+            while not stop.is_set():
+                if observer is not None:
+                    # editors often write files in several steps, wait for them to settle
+                    if wake_up.wait(interval):
+                        time.sleep(0.05)
+                        wake_up.clear()
+                else:
+                    stop.wait(interval)
+
+                self._refresh_and_report()
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+
+    def _refresh_and_report(self):
+        """one cycle of watch, a failed cycle is reported and retried with the next change"""
+        try:
+            DataWatcher.report(self.refresh())
+        except Exception:
+            logger.exception("Revalidating the data failed")
+
+    @staticmethod
+    def report(result: WatchResult | None):
+        if result is None:
+            return
+
+        for source, error in sorted(result.errors.items()):
+            print(f"error: {source}: {error}")
+        for conflict in result.conflicts:
+            print(f"{conflict.severity}: {conflict.source}: {conflict}")
+
+        status = "ok" if result.ok else "failed"
+        outputs = f", {len(result.outputs)} outputs written" if result.outputs else ""
+        print(
+            f"{status}: {len(result.changed)} files revalidated in {result.seconds * 1000:.1f} ms,"
+            f" {result.stations} stations{outputs}"
+        )
+
+    def _export(self, data: list[DataSource], changed_files: set[str]) -> list[Path]:
+        from datahub import commands
+        from datahub.exports.build_manifest import BuildManifest
+
+        manifest_path = self.manifest_path or BuildManifest.path_for(self.api_dir)
+        manifest = BuildManifest(manifest_path, self.api_dir, changed_files)
+        writer = commands.export(data, self.api_dir, self.cpdlc_mapping, self.exporters, manifest)
+        manifest.save()
+
+        return writer.changed
+
+    def _take_snapshot(self) -> Snapshot:
+        files = DataLoader._collect_files(self.data_dir, set(EXCLUDE_FOLDERS))
+        if self.cpdlc_mapping.is_file():
+            files.append(self.cpdlc_mapping)
+
+        snapshot = {}
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+    def _source(self, file_path: Path) -> str:
+        return str(file_path.relative_to(self.data_dir))
+
+    def _start_observer(self, wake_up: threading.Event):
+        """uses inotify & co. through watchdog if installed, otherwise the watcher polls"""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake_up.set()
+
+        observer = Observer()
+        observer.schedule(Handler(), str(self.data_dir), recursive=True)
+        observer.start()
+        return observer
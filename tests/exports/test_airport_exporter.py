@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from datahub.exports.airport_exporter import AirportExporter
+from datahub.views.airport_index import AirportIndex
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class TestAirportExporter(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            DataSource(
+                source="edgg/stations.json",
+                data=[
+                    Station(
+                        logon="EDDF_TWR",
+                        frequency="119.900",
+                        abbreviation="DFT",
+                        relevant_airports=["EDDF"],
+                    ),
+                    Station(
+                        logon="EDGG_KTG_CTR",
+                        frequency="128.050",
+                        abbreviation="KTG",
+                        relevant_airports=["EDFH", "EDDF"],
+                    ),
+                    Station(logon="EDDS_TWR", frequency="118.800", abbreviation="STT"),
+                ],
+            ),
+        ]
+
+    def test_index(self):
+        index = AirportIndex.from_data(self.data)
+
+        self.assertEqual(index.airports, ["EDDF", "EDFH"])
+        self.assertEqual(index.stations_of("EDDF"), ["EDDF_TWR", "EDGG_KTG_CTR"])
+        self.assertEqual(index.stations_of("EDDS"), [])
+        self.assertEqual(index.airports_of("EDGG_KTG_CTR"), ["EDFH", "EDDF"])
+        self.assertEqual(index.airports_of("EDDS_TWR"), [])
+
+    def test_projection(self):
+        stations = self.data[0].data
+
+        self.assertEqual(AirportExporter.projection(stations[0]), ["EDDF_TWR", ["EDDF"]])
+        self.assertIsNone(AirportExporter.projection(stations[2]))
+
+    def test_export(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "legacy/airport_stations.json"
+
+            with redirect_stdout(StringIO()):
+                AirportExporter.export(file_path, self.data)
+
+            self.assertEqual(
+                json.loads(file_path.read_text(encoding="utf-8")),
+                {
+                    "airports": {"EDDF": ["EDDF_TWR", "EDGG_KTG_CTR"], "EDFH": ["EDGG_KTG_CTR"]},
+                    "stations": {"EDDF_TWR": ["EDDF"], "EDGG_KTG_CTR": ["EDFH", "EDDF"]},
+                },
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
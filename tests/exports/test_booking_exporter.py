@@ -0,0 +1,28 @@
+import unittest
+
+from datahub.exports.booking_exporter import BookingExporter
+from datahub.views.event_schedule import EVENT_RULES, EventSchedule
+from datahub.views.logon_index import LogonIndex
+
+
+class TestBookingExporter(unittest.TestCase):
+    def test_bookings(self):
+        schedules = [
+            EventSchedule(
+                source="edgg.json",
+                rules=EVENT_RULES.validate_python([
+                    {"day": "1", "booking": ["EDDF", "EDGG_PAD"]},
+                    {"day": "3", "booking": ["EDDF"]},
+                ]),
+            )
+        ]
+        index = LogonIndex(["EDDF_TWR", "EDDF_APP", "EDGG_PAD_CTR", "EDDK_APP"])
+
+        self.assertEqual(
+            BookingExporter.bookings(schedules, index),
+            {"edgg": {"EDDF": ["EDDF_APP", "EDDF_TWR"], "EDGG_PAD": ["EDGG_PAD_CTR"]}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from datahub.exports.build_manifest import BuildManifest
+from datahub.exports.ts_exporter import TeamspeakExporter
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class TestBuildManifest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / "manifest.json"
+        self.output_dir = Path(self.temp_dir.name) / "api"
+        self.output_dir.mkdir()
+        (self.output_dir / "out.json").touch()
+
+        self.data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[Station(logon="EDDF_TWR", frequency="118.500", abbreviation="DFT")],
+            ),
+            DataSource(
+                source="edww/twr.json",
+                data=[Station(logon="EDDH_TWR", frequency="119.975", abbreviation="HHT")],
+            ),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _build(self, data, changed_files=None):
+        manifest = BuildManifest(self.manifest_path, self.output_dir, changed_files)
+        stale = manifest.is_stale("out.json", data, TeamspeakExporter.projection)
+        manifest.save()
+        return stale
+
+    def test_first_build_is_stale(self):
+        self.assertTrue(self._build(self.data))
+
+    def test_unchanged_build_is_not_stale(self):
+        self._build(self.data)
+
+        self.assertFalse(self._build(self.data))
+
+    def test_missing_output_is_stale(self):
+        self._build(self.data)
+        (self.output_dir / "out.json").unlink()
+
+        self.assertTrue(self._build(self.data))
+
+    def test_changed_exporters_are_stale(self):
+        """Test that outputs of another exporter version are rebuilt"""
+        self._build(self.data)
+
+        with patch.object(BuildManifest, "output_fingerprint", return_value="other version"):
+            self.assertTrue(self._build(self.data, changed_files=set()))
+
+    def test_fingerprint_covers_exporters(self):
+        BuildManifest.output_fingerprint.cache_clear()
+        self.addCleanup(BuildManifest.output_fingerprint.cache_clear)
+
+        fingerprint = BuildManifest.output_fingerprint()
+        with patch("datahub.exports.build_manifest.OUTPUT_SOURCES", ("serializers.py",)):
+            BuildManifest.output_fingerprint.cache_clear()
+            self.assertNotEqual(BuildManifest.output_fingerprint(), fingerprint)
+
+    def test_irrelevant_change_is_not_stale(self):
+        """Test that changing a field the output does not depend on keeps the output"""
+        self._build(self.data)
+        self.data[0].data[0] = self.data[0].data[0].model_copy(update={"description": "new"})
+
+        self.assertFalse(self._build(self.data, changed_files={"edgg/twr.json"}))
+
+    def test_relevant_change_is_stale(self):
+        self._build(self.data)
+        self.data[0].data[0] = self.data[0].data[0].model_copy(update={"frequency": "118.780"})
+
+        self.assertTrue(self._build(self.data, changed_files={"edgg/twr.json"}))
+
+    def test_changed_files_limit_inspected_sources(self):
+        """Test that sources outside of changed_files are taken from the manifest"""
+        self._build(self.data)
+        self.data[0].data[0] = self.data[0].data[0].model_copy(update={"frequency": "118.780"})
+
+        self.assertFalse(self._build(self.data, changed_files={"edww/twr.json"}))
+
+    def test_removed_source_is_stale(self):
+        self._build(self.data)
+
+        self.assertTrue(self._build(self.data[:1]))
+
+    def test_contribution_records_stations(self):
+        contribution = BuildManifest.contribution(self.data[0].data, TeamspeakExporter.projection)
+
+        self.assertEqual(contribution["stations"], ["EDDF_TWR"])
+
+    def test_contribution_without_stations(self):
+        self.assertIsNone(BuildManifest.contribution(self.data[0].data, lambda _: None))
+
+    def test_manifest_per_output_dir(self):
+        self.assertEqual(BuildManifest.path_for("api"), BuildManifest.path_for(Path("api/")))
+        self.assertNotEqual(BuildManifest.path_for("api"), BuildManifest.path_for("other"))
+
+
+if __name__ == "__main__":
+    unittest.main()
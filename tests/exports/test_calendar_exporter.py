@@ -0,0 +1,62 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from datahub.exports.calendar_exporter import CalendarExporter
+from datahub.views.event_schedule import EVENT_RULES, EventSchedule
+
+
+class TestCalendarExporter(unittest.TestCase):
+    def setUp(self):
+        self.schedules = [
+            EventSchedule(
+                source="edgg.json",
+                rules=EVENT_RULES.validate_python([{"day": "1", "booking": ["EDDF"]}]),
+            ),
+            EventSchedule(
+                source="edww.json",
+                rules=EVENT_RULES.validate_python([
+                    {
+                        "rule": "every_X_days",
+                        "one_date": "2025-01-07",
+                        "days": "7",
+                        "booking": ["EDDH"],
+                    }
+                ]),
+            ),
+        ]
+
+    def test_calendar(self):
+        calendar = CalendarExporter.calendar(self.schedules, date(2025, 1, 5), days=7)
+
+        self.assertEqual(
+            calendar,
+            {
+                "start": "2025-01-05",
+                "end": "2025-01-11",
+                "dates": {
+                    "2025-01-06": {"edgg": ["EDDF"]},
+                    "2025-01-07": {"edww": ["EDDH"]},
+                },
+            },
+        )
+
+    def test_export(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "event_calendar.json"
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                CalendarExporter.export(file_path, self.schedules, date(2025, 1, 1))
+
+            calendar = json.loads(file_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(calendar["end"], "2025-12-31")
+        self.assertEqual(len(calendar["dates"]), 52 + 52)
+
+
+if __name__ == "__main__":
+    unittest.main()
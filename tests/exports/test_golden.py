@@ -0,0 +1,73 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from datahub.exports.airport_exporter import AirportExporter
+from datahub.exports.data_exporter import DataExporter
+from datahub.exports.schedule_exporter import ScheduleExporter
+from datahub.exports.ts_exporter import TeamspeakExporter
+from datahub.loaders.data_loader import DataLoader
+from datahub.serializers import (
+    JSON_ENV,
+    JSON_SERIALIZERS,
+    TOML_ENV,
+    TOML_SERIALIZERS,
+    available,
+    json_serializer,
+    toml_serializer,
+)
+from datahub.sorting.station_sorter import StationSorter
+
+GOLDEN = Path(__file__).parent / "fixtures/golden"
+
+
+class TestGoldenOutputs(unittest.TestCase):
+    """the outputs of every serializer backend are byte-identical to the recorded ones"""
+
+    def tearDown(self):
+        json_serializer.cache_clear()
+        toml_serializer.cache_clear()
+
+    def export(self, output_dir: Path):
+        data = StationSorter.sort(DataLoader.load(GOLDEN / "input"))
+
+        DataExporter.export(output_dir / "json", data, combine=True)
+        DataExporter.export(output_dir / "toml", data, combine=True, target_format="toml")
+        TeamspeakExporter.export(output_dir / "legacy/atc_station_mappings.json", data)
+        ScheduleExporter.export(output_dir / "legacy/schedule.json", data)
+        AirportExporter.export(output_dir / "legacy/airport_stations.json", data)
+
+    def test_outputs(self):
+        expected_dir = GOLDEN / "expected"
+        expected = sorted(p.relative_to(expected_dir) for p in expected_dir.rglob("*.*"))
+
+        for json_name in available(JSON_SERIALIZERS):
+            for toml_name in available(TOML_SERIALIZERS):
+                with (
+                    self.subTest(json=json_name, toml=toml_name),
+                    patch.dict(os.environ, {JSON_ENV: json_name, TOML_ENV: toml_name}),
+                    tempfile.TemporaryDirectory() as temp_dir,
+                ):
+                    json_serializer.cache_clear()
+                    toml_serializer.cache_clear()
+
+                    output_dir = Path(temp_dir)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        self.export(output_dir)
+
+                    written = sorted(p.relative_to(output_dir) for p in output_dir.rglob("*.*"))
+                    self.assertEqual(written, expected)
+                    for path in expected:
+                        self.assertEqual(
+                            (output_dir / path).read_bytes(),
+                            (expected_dir / path).read_bytes(),
+                            path,
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
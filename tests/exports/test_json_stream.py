@@ -0,0 +1,41 @@
+import io
+import json
+import unittest
+
+from datahub.exports.json_stream import dump_array
+
+
+class TestDumpArray(unittest.TestCase):
+    def _assert_same_as_json_dump(self, items, ensure_ascii=False):
+        expected = io.StringIO()
+        json.dump(items, expected, indent=4, ensure_ascii=ensure_ascii)
+
+        result = io.StringIO()
+        dump_array(iter(items), result, ensure_ascii=ensure_ascii)
+
+        self.assertEqual(result.getvalue(), expected.getvalue())
+
+    def test_empty_array(self):
+        self._assert_same_as_json_dump([])
+
+    def test_stations(self):
+        self._assert_same_as_json_dump([
+            {
+                "logon": "EDDF_TWR",
+                "frequency": "118.500",
+                "schedule_show_always": ["EDGG"],
+                "relevant_airports": [],
+                "s1_twr": True,
+            },
+            {"logon": "EDMM_ALB_CTR", "description": "München Radar\nAlb", "nested": {"a": [1]}},
+        ])
+
+    def test_scalars_and_nested_lists(self):
+        self._assert_same_as_json_dump([1, "a", None, [], {}, [[1, 2], {"x": "ä"}]])
+
+    def test_ensure_ascii(self):
+        self._assert_same_as_json_dump([{"description": "Düsseldorf"}], ensure_ascii=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub.exports.output_writer import OutputWriter
+
+
+class TestOutputWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "legacy" / "out.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writes_new_file(self):
+        writer = OutputWriter()
+
+        self.assertTrue(writer.write_text(self.path, "[]"))
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "[]")
+        self.assertEqual(writer.changed, [self.path])
+
+    def test_unchanged_content_keeps_file(self):
+        OutputWriter().write_text(self.path, "[]")
+        os.utime(self.path, (0, 0))
+
+        writer = OutputWriter()
+
+        self.assertFalse(writer.write_text(self.path, "[]"))
+        self.assertEqual(self.path.stat().st_mtime, 0)
+        self.assertEqual(writer.unchanged, [self.path])
+        self.assertEqual(writer.summary(), "0 of 1 files changed")
+
+    def test_changed_content_replaces_file(self):
+        OutputWriter().write_text(self.path, "[]")
+
+        writer = OutputWriter()
+
+        self.assertTrue(writer.write_text(self.path, "[1]"))
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "[1]")
+
+    def test_writes_bytes(self):
+        writer = OutputWriter()
+
+        self.assertTrue(writer.write_bytes(self.path, b"\x00\xff\r\n"))
+        self.assertFalse(writer.write_bytes(self.path, b"\x00\xff\r\n"))
+        self.assertEqual(self.path.read_bytes(), b"\x00\xff\r\n")
+
+    def test_no_temporary_files_are_left(self):
+        writer = OutputWriter()
+        writer.write_text(self.path, "[]")
+        writer.write_text(self.path, "[]")
+
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_failed_write_keeps_existing_file(self):
+        OutputWriter().write_text(self.path, "[]")
+
+        with self.assertRaises(RuntimeError), OutputWriter().open(self.path) as f:
+            f.write("[1")
+            raise RuntimeError
+
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "[]")
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+
+if __name__ == "__main__":
+    unittest.main()
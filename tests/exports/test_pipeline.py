@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+
+from datahub.exports.pipeline import ExportPipeline, StationVisitor
+from datahub.instrumentation import instrumentation
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class RecordingVisitor(StationVisitor):
+    def __init__(self):
+        self.events = []
+
+    def begin_source(self, source):
+        self.events.append(("begin", source.source))
+
+    def visit(self, source, station):
+        self.events.append(("visit", station.logon))
+
+    def end_source(self, source):
+        self.events.append(("end", source.source))
+
+    def finish(self):
+        self.events.append(("finish",))
+
+
+class TestExportPipeline(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[
+                    Station(logon="EDDF_TWR", frequency="118.500", abbreviation="DFT"),
+                    Station(logon="EDDS_TWR", frequency="118.800", abbreviation="STT"),
+                ],
+            ),
+            DataSource(
+                source="edww/twr.json",
+                data=[Station(logon="EDDH_TWR", frequency="119.975", abbreviation="HHT")],
+            ),
+        ]
+
+    def test_visitors_receive_events_in_order(self):
+        visitor = RecordingVisitor()
+        ExportPipeline([visitor]).run(self.data)
+
+        self.assertEqual(
+            visitor.events,
+            [
+                ("begin", "edgg/twr.json"),
+                ("visit", "EDDF_TWR"),
+                ("visit", "EDDS_TWR"),
+                ("end", "edgg/twr.json"),
+                ("begin", "edww/twr.json"),
+                ("visit", "EDDH_TWR"),
+                ("end", "edww/twr.json"),
+                ("finish",),
+            ],
+        )
+
+    def test_all_visitors_receive_every_station(self):
+        pipeline = ExportPipeline()
+        first = pipeline.register(RecordingVisitor())
+        second = pipeline.register(RecordingVisitor())
+
+        pipeline.run(self.data)
+
+        self.assertEqual(first.events, second.events)
+
+    def test_instrumented_run_records_export_stages(self):
+        visitor = RecordingVisitor()
+
+        with (
+            patch.object(instrumentation, "enabled", True),
+            patch.object(instrumentation, "stages", {}),
+        ):
+            ExportPipeline([visitor]).run(self.data)
+            stages = instrumentation.stages
+
+        self.assertEqual(visitor.events[-1], ("finish",))
+        self.assertEqual(stages["export/RecordingVisitor"].items, 3)
+
+    def test_default_visitor_is_noop(self):
+        ExportPipeline([StationVisitor()]).run(self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
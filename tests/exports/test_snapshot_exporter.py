@@ -0,0 +1,127 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub.exports.snapshot_exporter import SnapshotExporter
+from datahub.loaders.snapshot_loader import (
+    BOOL_FIELDS,
+    LIST_FIELDS,
+    STRING_FIELDS,
+    StationSnapshot,
+)
+from datahub.sorting.station_sorter import StationSorter
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+
+class TestSnapshotExporter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.file_path = Path(self.temp_dir.name) / "stations.snapshot"
+
+        self.data = [
+            DataSource(
+                source="edmm/twr.json",
+                data=[
+                    Station(
+                        logon="EDDM_TWR",
+                        frequency="118.705",
+                        abbreviation="MNT",
+                        description="München Tower",
+                        schedule_show_always=["EDMM"],
+                        relevant_airports=["EDDM"],
+                        s1_twr=True,
+                    ),
+                    Station(
+                        logon="EDDM_N_TWR",
+                        frequency="120.505",
+                        abbreviation="MNN",
+                        schedule_show_booked=[],
+                        s1_theory=False,
+                    ),
+                ],
+            ),
+            DataSource(
+                source="edgg/ctr.json",
+                data=[
+                    Station(
+                        logon="EDGG_KTG_CTR",
+                        frequency="128.050",
+                        abbreviation="KTG",
+                        schedule_show_always=["EDGG"],
+                        cpdlc_login="EDGG",
+                        gcap_status="2",
+                    ),
+                    Station(logon="EDDMX_TWR", frequency="119.900", abbreviation="MXT"),
+                ],
+            ),
+        ]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            SnapshotExporter.export(self.file_path, self.data)
+
+        self.snapshot = StationSnapshot(self.file_path)
+        self.addCleanup(self.snapshot.close)
+
+    def test_layout_covers_all_station_fields(self):
+        self.assertEqual(set(STRING_FIELDS + LIST_FIELDS + BOOL_FIELDS), set(Station.model_fields))
+
+    def test_round_trip(self):
+        # same order as stations.json
+        expected = list(StationSorter.imerge(ds.data for ds in self.data))
+
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertEqual(
+            [station.to_dict() for station in self.snapshot],
+            [station.to_dict() for station in expected],
+        )
+        self.assertEqual(self.snapshot.logons(), sorted(station.logon for station in expected))
+
+    def test_lookup(self):
+        station = self.snapshot.get("EDDM_TWR")
+
+        self.assertEqual(station.description, "München Tower")
+        self.assertEqual(station.relevant_airports, ["EDDM"])
+        self.assertTrue(station.s1_twr)
+        self.assertIsNone(station.s1_theory)
+        self.assertIs(self.snapshot.get("EDDM_TWR"), station)
+
+        self.assertIn("EDGG_KTG_CTR", self.snapshot)
+        self.assertNotIn("EDDM", self.snapshot)
+        self.assertIsNone(self.snapshot.get("EDDF_TWR"))
+
+    def test_prefix(self):
+        self.assertEqual(
+            [station.logon for station in self.snapshot.prefix("EDDM")],
+            ["EDDMX_TWR", "EDDM_N_TWR", "EDDM_TWR"],
+        )
+        self.assertEqual(
+            [station.logon for station in self.snapshot.prefix("EDDM_")],
+            ["EDDM_N_TWR", "EDDM_TWR"],
+        )
+        self.assertEqual(self.snapshot.prefix("EDDF"), [])
+
+    def test_empty_snapshot(self):
+        file_path = Path(self.temp_dir.name) / "empty.snapshot"
+        with contextlib.redirect_stdout(io.StringIO()):
+            SnapshotExporter.export(file_path, [])
+
+        with StationSnapshot(file_path) as snapshot:
+            self.assertEqual(len(snapshot), 0)
+            self.assertIsNone(snapshot.get("EDDM_TWR"))
+            self.assertEqual(list(snapshot), [])
+
+    def test_rejects_other_files(self):
+        file_path = Path(self.temp_dir.name) / "stations.json"
+
+        for content in (b"[]", b"[" + b" " * 100 + b"]"):
+            file_path.write_bytes(content)
+            with self.assertRaisesRegex(ValueError, "not a station snapshot"):
+                StationSnapshot(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
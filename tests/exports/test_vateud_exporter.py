@@ -0,0 +1,150 @@
+import contextlib
+import csv
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub.exports.vateud_exporter import (
+    FREQUENCY_MISMATCH,
+    MISSING_IN_STATIONS,
+    MISSING_IN_VATEUD,
+    NAME_MISMATCH,
+    VateudExporter,
+    VateudStation,
+)
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+
+FIXTURE = Path(__file__).parent / "fixtures" / "vateud8.html"
+
+
+class TestVateudExporter(unittest.TestCase):
+    def test_get_vateud_stations_applies_exclude_rules(self):
+        stations = VateudExporter._get_vateud_stations(
+            FIXTURE.read_text(encoding="utf-8"),
+            [
+                lambda s: s.country_id != "2",
+                lambda s: not s.callsign.startswith(("ED", "ET")),
+                lambda s: s.callsign.endswith("ATIS"),
+            ],
+        )
+
+        self.assertEqual([s.callsign for s in stations], ["EDDF_TWR", "EDDH_TWR", "ETNL_TWR"])
+        self.assertEqual(stations[0].name, "Frankfurt Tower")
+        self.assertEqual(stations[0].frequency, "119.900")
+
+    def test_lxml_parser_matches_bs4_parser(self):
+        page = FIXTURE.read_text(encoding="utf-8")
+
+        self.assertEqual(
+            list(VateudExporter._parse_vateud_stations(page)),
+            VateudExporter._get_vateud_stations(page, VateudExporter.exclude_rules()),
+        )
+
+    def test_diff(self):
+        stations = [
+            Station(logon="EDDF_TWR", frequency="119.900", abbreviation="DFT", description="Tower"),
+            Station(logon="EDDH_TWR", frequency="118.505", abbreviation="HHT", description="Tower"),
+            Station(logon="EDDK_TWR", frequency="124.975", abbreviation="KKT", description="Tower"),
+            Station(logon="EDDL_TWR", frequency="118.305", abbreviation="LLT"),
+        ]
+        vateud_stations = [
+            VateudStation("2", "EDDF_TWR", "TOWER", "119.9", "EDDF"),
+            VateudStation("2", "EDDH_TWR", "Tower", "118.500", "EDDH"),
+            VateudStation("2", "EDDK_TWR", "Köln Tower", "invalid", "EDDK"),
+            VateudStation("2", "EDDB_TWR", "Berlin Tower", "120.030", "EDDB"),
+        ]
+
+        changes = VateudExporter.diff(stations, vateud_stations)
+
+        self.assertEqual(
+            [(c.callsign, c.remarks) for c in changes],
+            [
+                ("EDDL_TWR", [MISSING_IN_VATEUD]),
+                ("EDDB_TWR", [MISSING_IN_STATIONS]),
+                ("EDDH_TWR", [FREQUENCY_MISMATCH]),
+                ("EDDK_TWR", [FREQUENCY_MISMATCH, NAME_MISMATCH]),
+            ],
+        )
+
+        summary = VateudExporter.summary(changes, len(stations), len(vateud_stations))
+        self.assertEqual(summary[FREQUENCY_MISMATCH], 2)
+        self.assertEqual(summary[NAME_MISMATCH], 1)
+
+    def test_diff_duplicate_logon(self):
+        station = Station(logon="EDDF_TWR", frequency="119.900", abbreviation="DFT")
+        vateud_stations = [VateudStation("2", "EDDF_TWR", "", "119.900", "EDDF")]
+
+        self.assertEqual(VateudExporter.diff([station, station], vateud_stations), [])
+
+    def test_export_keeps_given_suffix(self):
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            for output, formats, written in (
+                ("report.txt", ["csv"], ["report.txt"]),
+                ("report", ["json"], ["report.json"]),
+                ("report.txt", ["csv", "json"], ["report.csv", "report.json"]),
+            ):
+                with self.subTest(output=output, formats=formats):
+                    out_dir = Path(tmp) / "-".join([output, *formats])
+                    VateudExporter.export(out_dir / output, [], snapshot=FIXTURE, formats=formats)
+
+                    self.assertEqual(sorted(p.name for p in out_dir.iterdir()), written)
+
+    def test_export_from_snapshot(self):
+        data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[
+                    Station(
+                        logon="EDDF_TWR",
+                        frequency="119.900",
+                        abbreviation="DFT",
+                        description="Frankfurt  tower",
+                    ),
+                    Station(
+                        logon="EDDS_TWR",
+                        frequency="118.805",
+                        abbreviation="STT",
+                        description="Stuttgart Tower",
+                    ),
+                ],
+            )
+        ]
+
+        for parser in ("lxml", "bs4"):
+            with self.subTest(parser=parser):
+                self.assert_export(data, parser)
+
+    def assert_export(self, data, parser):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "vateud.csv"
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                VateudExporter.export(
+                    csv_path, data, snapshot=FIXTURE, parser=parser, formats=("csv", "json")
+                )
+
+            with csv_path.open(encoding="utf-8", newline="") as f:
+                rows = list(csv.reader(f, delimiter=";"))
+
+            report = json.loads(csv_path.with_suffix(".json").read_text(encoding="utf-8"))
+
+        self.assertIn("Missing in Stations: 2", output.getvalue())
+        self.assertEqual(report["summary"]["Missing in VATEUD"], 1)
+        self.assertEqual(len(report["changes"]), 3)
+
+        self.assertEqual(
+            rows[1:],
+            [
+                ["", "", "", "EDDS_TWR", "Stuttgart Tower", "118.805", "Missing in VATEUD"],
+                ["EDDH_TWR", "Hamburg Tower", "118.505", "", "", "", "Missing in Stations"],
+                ["ETNL_TWR", "Laage Tower", "118.255", "", "", "", "Missing in Stations"],
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import toml
 
@@ -200,6 +201,136 @@ class TestDataLoader(unittest.TestCase):
         for data_item in result:
             self.assertTrue(all(isinstance(s, Station) for s in data_item.data))
 
+    def test_load_with_thread_pool_keeps_order(self):
+        """Test that a thread pool returns the same data sources as a sequential load"""
+        expected = DataLoader.load(self.data_dir)
+        result = DataLoader.load(self.data_dir, workers=4, pool="thread")
+
+        self.assertEqual(result, expected)
+
+    def test_load_with_process_pool_keeps_order(self):
+        """Test that a process pool returns the same data sources as a sequential load"""
+        expected = DataLoader.load(self.data_dir)
+        result = DataLoader.load(self.data_dir, workers=2, pool="process")
+
+        self.assertEqual(result, expected)
+
+    def test_load_with_workers_aggregates_errors(self):
+        """Test that errors of all files are collected when loading concurrently"""
+        with Path.open(self.data_dir / "edgg" / "invalid.json", "w") as f:
+            json.dump({"logon": "EDDF_TWR", "frequency": "100.000", "abbreviation": "X"}, f)
+        with Path.open(self.data_dir / "edww" / "broken.json", "w") as f:
+            f.write("{")
+
+        with (
+            patch("builtins.print") as mock_print,
+            self.assertRaisesRegex(RuntimeError, "2 errors"),
+        ):
+            DataLoader.load(self.data_dir, workers=4)
+
+        annotations = [call.args[0] for call in mock_print.call_args_list]
+        self.assertTrue(any("invalid.json" in line for line in annotations))
+        self.assertTrue(any("broken.json" in line for line in annotations))
+
+    def test_validate_file_collects_all_errors(self):
+        """Test that every invalid station of a file is reported at its field"""
+        file_path = self.data_dir / "edgg" / "invalid.json"
+        stations = [
+            {"logon": "EDDF_TWR", "frequency": "100.000", "abbreviation": "DFT"},
+            {"logon": "EDDS_TWR", "frequency": "118.800", "abbreviation": "STT"},
+            {"logon": "EDDH_TWR", "frequency": "119.975"},
+        ]
+        file_path.write_text(json.dumps(stations, indent=4), encoding="utf-8")
+
+        errors = DataLoader.validate_file(file_path)
+
+        self.assertEqual(
+            [(error.line, error.column) for error in errors],
+            [(4, 9), (12, 5)],
+        )
+        self.assertIn("EDDF_TWR: frequency:", errors[0].message)
+        self.assertIn("EDDH_TWR: abbreviation: Field required", errors[1].message)
+
+    def test_validate_file_toml(self):
+        """Test that errors in TOML files are located through the stations tables"""
+        file_path = self.data_dir / "edww" / "invalid.toml"
+        file_path.write_text(
+            "[[stations]]\n"
+            'logon = "EDDH_TWR"\n'
+            'frequency = "119.975"\n'
+            'abbreviation = "HHT"\n'
+            "\n"
+            "[[stations]]\n"
+            'logon = "EDDV_TWR"\n'
+            'frequency = "100.000"\n'
+            'abbreviation = "VT"\n'
+            'cpdlc_login = "EDDVX"\n',
+            encoding="utf-8",
+        )
+
+        errors = DataLoader.validate_file(file_path)
+
+        self.assertEqual([(error.line, error.column) for error in errors], [(8, 1), (10, 1)])
+
+    def test_validate_file_utf16(self):
+        """Test that stations of UTF-16 files, which json accepts, are located as well"""
+        file_path = self.data_dir / "edgg" / "invalid.json"
+        stations = [{"logon": "EDDF_TWR", "frequency": "100.000", "abbreviation": "DFT"}]
+        file_path.write_text(json.dumps(stations, indent=4), encoding="utf-16")
+
+        (error,) = DataLoader.validate_file(file_path)
+
+        self.assertEqual((error.line, error.column), (4, 9))
+
+    def test_validate_file_reports_unreadable_file(self):
+        """Test that a file which cannot be read again is reported instead of raising"""
+        file_path = self.data_dir / "edgg" / "missing.json"
+
+        (error,) = DataLoader.validate_file(file_path)
+
+        self.assertEqual((error.file_path, error.line, error.column), (file_path, 1, 1))
+
+    def test_validate_file_reports_decode_position(self):
+        """Test that decoding errors keep the position of the decoder"""
+        file_path = self.data_dir / "edgg" / "broken.json"
+        file_path.write_text('[\n    {"logon": }\n]', encoding="utf-8")
+
+        (error,) = DataLoader.validate_file(file_path)
+
+        self.assertEqual((error.line, error.column), (2, 15))
+
+    def test_validate_file_reports_toml_decode_position(self):
+        """Test that the position of TOML decoding errors is taken from the message"""
+        file_path = self.data_dir / "edww" / "broken.toml"
+        file_path.write_text('logon = "EDDH_TWR"\nfrequency = \n', encoding="utf-8")
+
+        (error,) = DataLoader.validate_file(file_path)
+
+        self.assertEqual(error.line, 2)
+        self.assertIn("Failed to decode .toml file", error.message)
+
+    def test_load_all_errors_annotates_stations(self):
+        """Test that all errors are annotated at their line when requested"""
+        stations = [
+            {"logon": "EDDF_TWR", "frequency": "100.000", "abbreviation": "DFT"},
+            {"logon": "EDDH_TWR", "frequency": "119.975"},
+        ]
+        (self.data_dir / "edgg" / "invalid.json").write_text(
+            json.dumps(stations, indent=4), encoding="utf-8"
+        )
+
+        with (
+            patch("builtins.print") as mock_print,
+            self.assertRaisesRegex(RuntimeError, "1 errors"),
+        ):
+            DataLoader.load(self.data_dir, exclude_folders={"temp"}, all_errors=True)
+
+        annotations = [call.args[0] for call in mock_print.call_args_list]
+        self.assertEqual(len(annotations), 2)
+        self.assertTrue(annotations[0].startswith("::error file="))
+        self.assertIn("invalid.json,line=4,col=9::", annotations[0])
+        self.assertIn("invalid.json,line=7,col=5::", annotations[1])
+
 
 if __name__ == "__main__":
     unittest.main()
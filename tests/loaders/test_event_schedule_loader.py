@@ -0,0 +1,48 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub.loaders.event_schedule_loader import EventScheduleLoader
+
+
+class TestEventScheduleLoader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.schedule_dir = Path(self.temp_dir.name)
+
+    def write(self, name: str, content):
+        (self.schedule_dir / name).write_text(json.dumps(content), encoding="utf-8")
+
+    def load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return EventScheduleLoader.load(self.schedule_dir)
+
+    def test_on_data(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            schedules = EventScheduleLoader.load("data/event_schedules")
+
+        self.assertIn("edgg.json", [schedule.source for schedule in schedules])
+
+    def test_load(self):
+        self.write("edgg.json", [{"day": "5", "booking": ["EDDF"]}])
+        self.write("mil.json", [])
+        (self.schedule_dir / "README.md").write_text("# not a schedule", encoding="utf-8")
+
+        schedules = self.load()
+
+        self.assertEqual([schedule.source for schedule in schedules], ["edgg.json", "mil.json"])
+        self.assertEqual(len(schedules[0].rules), 1)
+
+    def test_invalid_file(self):
+        self.write("edgg.json", [{"rule": "every_X_days", "booking": ["EDDF"]}])
+
+        with self.assertRaises(RuntimeError):
+            self.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from datahub.loaders.http_cache import HttpCache, OfflineError
+
+
+class StandInServer(ThreadingHTTPServer):
+    """local stand-in for a remote page supporting ETag based conditional requests"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.body = "<html>v1</html>"
+        self.etag = '"v1"'
+        self.requests: list[dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/vateud8"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInServer
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = self.server.body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_dir = Path(self.temp_dir.name)
+
+        self.server = StandInServer()
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_fresh_copy_is_served_from_disk(self):
+        cache = HttpCache(self.cache_dir, ttl=3600)
+
+        self.assertEqual(cache.get_text(self.server.url), "<html>v1</html>")
+        self.assertEqual(cache.get_text(self.server.url), "<html>v1</html>")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_stale_copy_is_revalidated(self):
+        cache = HttpCache(self.cache_dir, ttl=0)
+        cache.get_text(self.server.url)
+
+        self.assertEqual(cache.get_text(self.server.url), "<html>v1</html>")
+        self.assertEqual(self.server.requests[-1].get("If-None-Match"), '"v1"')
+
+        self.server.body, self.server.etag = "<html>v2</html>", '"v2"'
+        self.assertEqual(cache.get_text(self.server.url), "<html>v2</html>")
+        self.assertEqual(cache.snapshot_path(self.server.url).read_text(), "<html>v2</html>")
+
+    def test_offline(self):
+        with self.assertRaises(OfflineError):
+            HttpCache(self.cache_dir, offline=True).get_text(self.server.url)
+
+        HttpCache(self.cache_dir).get_text(self.server.url)
+        self.server.body = "<html>changed</html>"
+
+        text = HttpCache(self.cache_dir, ttl=0, offline=True).get_text(self.server.url)
+
+        self.assertEqual(text, "<html>v1</html>")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_body_without_matching_metadata_is_fetched_unconditionally(self):
+        self.server.body = "<html>\r\nv1\r\n</html>"
+        cache = HttpCache(self.cache_dir, ttl=3600)
+        cache.get_text(self.server.url)
+        cache.get_text(self.server.url)
+        self.assertEqual(len(self.server.requests), 1)
+
+        # as if the process died between writing a new body and its metadata
+        cache.snapshot_path(self.server.url).write_text("<html>partial</html>")
+
+        self.assertEqual(
+            HttpCache(self.cache_dir, offline=True).get_text(self.server.url),
+            "<html>partial</html>",
+        )
+        self.assertEqual(cache.get_text(self.server.url), "<html>\r\nv1\r\n</html>")
+        self.assertIsNone(self.server.requests[-1].get("If-None-Match"))
+
+    def test_unreachable_server_uses_cached_copy(self):
+        url = self.server.url
+        HttpCache(self.cache_dir).get_text(url)
+
+        self.server.shutdown()
+        self.server.server_close()
+
+        with self.assertLogs("datahub.loaders.http_cache", level="WARNING"):
+            text = HttpCache(self.cache_dir, ttl=0).get_text(url, timeout=1)
+
+        self.assertEqual(text, "<html>v1</html>")
+
+    def test_unreachable_server_without_cached_copy(self):
+        url = self.server.url
+        self.server.shutdown()
+        self.server.server_close()
+
+        with self.assertRaises(requests.RequestException):
+            HttpCache(self.cache_dir).get_text(url, timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import unittest
+
+from datahub.loaders.source_positions import Position, json_positions, toml_positions
+
+
+class TestSourcePositions(unittest.TestCase):
+    def test_json_list(self):
+        text = json.dumps([{"logon": "EDDF_TWR", "frequency": "118.500"}, {"logon": "X"}], indent=2)
+
+        records = json_positions(text)
+
+        self.assertEqual([record.start for record in records], [Position(2, 3), Position(6, 3)])
+        self.assertEqual(records[0].fields["frequency"], Position(4, 5))
+        self.assertEqual(records[1].locate(("logon",)), Position(7, 5))
+        self.assertEqual(records[1].locate(("frequency",)), Position(6, 3))
+
+    def test_json_stations_object(self):
+        text = '{"name": "x", "stations": [{"logon": "A"}, {"logon": "B", "x": [1, {"y": 2}]}]}'
+
+        records = json_positions(text)
+
+        self.assertEqual([record.start.column for record in records], [28, 44])
+        self.assertEqual(list(records[1].fields), ["logon", "x"])
+
+    def test_json_single_station(self):
+        (record,) = json_positions('\n{"logon": "A", "stations": []}')
+
+        self.assertEqual(record.start, Position(2, 1))
+        self.assertEqual(record.fields["logon"], Position(2, 2))
+
+    def test_json_escaped_keys(self):
+        (record,) = json_positions('[{"a\\"b": "\\u00e4{", "logon": "A"}]')
+
+        self.assertEqual(set(record.fields), {'a"b', "logon"})
+        self.assertEqual(record.fields["logon"], Position(1, 22))
+
+    def test_toml_tables(self):
+        text = (
+            'title = "x"\n\n[[stations]]\nlogon = "A"\n  "frequency" = "1"\n[other]\nlogon = "B"\n'
+        )
+
+        records = toml_positions(text)
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].start, Position(3, 1))
+        self.assertEqual(records[0].fields, {"logon": Position(4, 1), "frequency": Position(5, 3)})
+
+    def test_toml_single_station(self):
+        (record,) = toml_positions('logon = "A"\nfrequency = "1"\n')
+
+        self.assertEqual(record.start, Position(1, 1))
+        self.assertEqual(record.fields["frequency"], Position(2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from datahub.exports.data_exporter import DataExporter
+from datahub.loaders.data_loader import DataLoader
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.views.station import Station
+
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.temp_dir.name) / "data"
+        self.cache_file = Path(self.temp_dir.name) / "cache" / "validation.json"
+
+        (self.data_dir / "edgg").mkdir(parents=True)
+
+        self.station_file = self.data_dir / "edgg" / "twr.json"
+        self._write_stations([
+            {
+                "logon": "eddf_twr",
+                "frequency": "118.5",
+                "abbreviation": "DFT",
+                "schedule_show_always": ["EDGG"],
+                "schedule_show_booked": ["EDGG", "EDWW"],
+                "relevant_airports": ["eddf"],
+            },
+        ])
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_stations(self, stations):
+        with Path.open(self.station_file, "w") as f:
+            json.dump(stations, f)
+
+    def _load(self):
+        return DataLoader.load(self.data_dir, cache=ValidationCache(self.cache_file))
+
+    def test_cached_stations_equal_validated_stations(self):
+        """Test that stations restored from the cache equal freshly validated stations"""
+        expected = DataLoader.load(self.data_dir)
+
+        self._load()
+        result = self._load()
+
+        self.assertEqual(result, expected)
+        self.assertEqual(result[0].data[0].to_dict(), expected[0].data[0].to_dict())
+
+    def test_unchanged_files_skip_validation(self):
+        """Test that unchanged files are neither decoded nor validated"""
+        self._load()
+
+        with patch.object(DataLoader, "_parse_file") as mock_parse:
+            self._load()
+
+        mock_parse.assert_not_called()
+
+    def test_changed_files_are_validated(self):
+        """Test that a content change invalidates the cache entry"""
+        self._load()
+        self._write_stations([{"logon": "EDDS_TWR", "frequency": "118.800", "abbreviation": "S"}])
+
+        result = self._load()
+
+        self.assertEqual(result[0].data[0].logon, "EDDS_TWR")
+
+    def test_invalid_files_are_not_cached(self):
+        """Test that files failing validation are reported again on the next run"""
+        self._write_stations([{"logon": "EDDF_TWR", "frequency": "100", "abbreviation": "DFT"}])
+
+        for _ in range(2):
+            with patch("builtins.print"), self.assertRaises(RuntimeError):
+                self._load()
+
+    def test_schema_change_invalidates_cache(self):
+        """Test that a different schema fingerprint discards all entries"""
+        self._load()
+
+        with patch.object(ValidationCache, "schema_fingerprint", return_value="changed"):
+            cache = ValidationCache(self.cache_file)
+
+        content_hash = ValidationCache.content_hash(self.station_file.read_bytes())
+        self.assertIsNone(cache.get(self.station_file, content_hash))
+
+    def test_cache_returns_station_objects(self):
+        self._load()
+
+        cache = ValidationCache(self.cache_file)
+        content_hash = ValidationCache.content_hash(self.station_file.read_bytes())
+        stations = cache.get(self.station_file, content_hash)
+
+        self.assertTrue(all(isinstance(s, Station) for s in stations))
+
+    def test_exported_files_skip_validation(self):
+        """Test that files written by the DataExporter are trusted on the next load"""
+        cache = ValidationCache(self.cache_file)
+        data = DataLoader.load(self.data_dir, cache=cache)
+
+        DataExporter.export(self.data_dir, data, cache=cache)
+
+        with patch.object(DataLoader, "_parse_file") as mock_parse:
+            result = self._load()
+
+        mock_parse.assert_not_called()
+        self.assertEqual(result, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
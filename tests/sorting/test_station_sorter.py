@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from datahub.sorting.station_sorter import StationSorter
+from datahub.views.station import Station
+
+
+def _station(logon):
+    return Station(logon=logon, frequency="118.500", abbreviation=logon[-3:])
+
+
+class TestStationSorter(unittest.TestCase):
+    def test_logon_key(self):
+        self.assertEqual(StationSorter.logon_key("EDDF_TWR"), ("EDDF", 3, "TWR"))
+        self.assertEqual(StationSorter.logon_key("EDDF_N_TWR"), ("EDDF", 3, "N"))
+        self.assertEqual(StationSorter.logon_key("EDDF"), ("EDDF", float("inf"), ""))
+
+    def test_sort_key_accepts_strings_dicts_and_stations(self):
+        station = _station("EDDF_APP")
+
+        self.assertEqual(StationSorter.sort_key(station), StationSorter.sort_key("EDDF_APP"))
+        self.assertEqual(StationSorter.sort_key({"logon": "EDDF_APP"}), ("EDDF", 5, "APP"))
+
+    def test_sort_orders_by_prefix_and_suffix(self):
+        stations = [_station(logon) for logon in ["EDDF_TWR", "EDDB_APP", "EDDF_DEL", "EDDF_N_GND"]]
+
+        result = StationSorter.sort(stations)
+
+        self.assertEqual(
+            [s.logon for s in result], ["EDDB_APP", "EDDF_DEL", "EDDF_N_GND", "EDDF_TWR"]
+        )
+
+    def test_merge_equals_full_sort(self):
+        logons = [
+            f"{prefix}_{middle}_{suffix}"
+            for prefix in ["EDDF", "EDDM", "EDDH", "ETNL"]
+            for middle in ["N", "S", "X"]
+            for suffix in ["DEL", "GND", "TWR", "APP"]
+        ]
+        random.Random(0).shuffle(logons)
+        stations = [_station(logon) for logon in logons]
+
+        chunks = [stations[i : i + 7] for i in range(0, len(stations), 7)]
+        sorted_chunks = [StationSorter.sort_stations(chunk) for chunk in chunks]
+
+        expected = StationSorter.sort_stations(stations)
+
+        self.assertEqual(StationSorter.merge(sorted_chunks), expected)
+        self.assertEqual(StationSorter.merge(chunks), expected)
+
+    def test_merge_keeps_order_of_equal_keys(self):
+        first = _station("EDDF_TWR")
+        second = _station("EDDF_TWR")
+
+        result = StationSorter.merge([[first], [second]])
+
+        self.assertIs(result[0], first)
+        self.assertIs(result[1], second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from datahub.cli import build_parser, main
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.data_dir = Path(self.temp_dir.name) / "data"
+        self.api_dir = Path(self.temp_dir.name) / "api"
+
+        (self.data_dir / "edgg").mkdir(parents=True)
+        (self.data_dir / "topsky").mkdir()
+
+        stations = [
+            {"logon": "EDDF_TWR", "frequency": "119.900", "abbreviation": "DFT"},
+            {
+                "logon": "EDGG_CTR",
+                "frequency": "135.725",
+                "abbreviation": "GGC",
+                "cpdlc_login": "EDGG",
+            },
+        ]
+        (self.data_dir / "edgg/stations.json").write_text(json.dumps(stations), encoding="utf-8")
+        (self.data_dir / "topsky/cpdlcMap.json").write_text(
+            json.dumps({"EDGG": "LANGEN RADAR CTR"}), encoding="utf-8"
+        )
+
+    def run_cli(self, *argv: str) -> str:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main([*argv, "--data-dir", str(self.data_dir), "--no-cache"])
+        return output.getvalue()
+
+    def test_defaults(self):
+        args = build_parser().parse_args(["combine"])
+
+        self.assertEqual(args.data_dir, Path("data"))
+        self.assertEqual(args.api_dir, Path("api"))
+        self.assertIsNone(args.exporters)
+        self.assertFalse(args.incremental)
+
+    def test_unknown_exporter_is_rejected(self):
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            build_parser().parse_args(["combine", "--only", "unknown"])
+
+    def test_check(self):
+        self.assertIn("Loaded 2 stations", self.run_cli("check"))
+
+    def test_check_fails_on_invalid_data(self):
+        (self.data_dir / "edgg/broken.json").write_text("[{}]", encoding="utf-8")
+
+        with self.assertRaises(RuntimeError):
+            self.run_cli("check")
+
+    def test_vateud_offline_without_cached_copy(self):
+        with (
+            patch("datahub.commands.HTTP_CACHE", Path(self.temp_dir.name) / "http"),
+            self.assertRaises(SystemExit) as context,
+        ):
+            self.run_cli("vateud", "--offline", "--output", str(self.api_dir / "vateud"))
+
+        self.assertIn("No cached copy", str(context.exception.code))
+        self.assertFalse(self.api_dir.exists())
+
+    def test_combine(self):
+        self.run_cli("combine", "--api-dir", str(self.api_dir))
+
+        self.assertTrue((self.api_dir / "edgg/stations.json").is_file())
+        self.assertTrue((self.api_dir / "stations.json").is_file())
+        self.assertTrue((self.api_dir / "legacy/atc_station_mappings.json").is_file())
+        self.assertTrue((self.api_dir / "legacy/schedule.json").is_file())
+        self.assertTrue((self.api_dir / "topsky/TopSkyCPDLC.txt").is_file())
+
+    def test_combine_selected_exporters(self):
+        self.run_cli("combine", "--api-dir", str(self.api_dir), "--only", "stations")
+
+        outputs = [p.relative_to(self.api_dir).as_posix() for p in self.api_dir.rglob("*.*")]
+        self.assertEqual(outputs, ["stations.json"])
+
+    def test_report(self):
+        report_path = Path(self.temp_dir.name) / "report.json"
+        self.run_cli("check", "--report", str(report_path))
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        self.assertEqual(report["command"], "check")
+        self.assertEqual(report["stages"]["validate"]["items"], 2)
+
+    def test_help_does_not_import_exporters(self):
+        code = (
+            "import contextlib, io, sys\n"
+            "from datahub.cli import main\n"
+            "with contextlib.suppress(SystemExit), contextlib.redirect_stdout(io.StringIO()):\n"
+            "    main(['--help'])\n"
+            "heavy = ('pydantic', 'requests', 'datahub.exports')\n"
+            "print(any(m.startswith(heavy) for m in sys.modules))"
+        )
+        src_dir = Path(__file__).parents[1] / "src"
+        env = {**os.environ, "PYTHONPATH": str(src_dir)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
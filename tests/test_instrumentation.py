@@ -0,0 +1,79 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub.instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.tmp = Path(self.temp_dir.name)
+
+    def test_disabled_records_nothing(self):
+        instr = Instrumentation()
+
+        with instr.stage("parse", items=3):
+            pass
+
+        self.assertEqual(instr.stages, {})
+
+    def test_stages_accumulate(self):
+        instr = Instrumentation()
+        instr.enabled = True
+
+        with instr.stage("parse", items=2):
+            pass
+        with instr.stage("parse") as stage:
+            stage.items = 3
+
+        metrics = instr.stages["parse"]
+        self.assertEqual(metrics.calls, 2)
+        self.assertEqual(metrics.items, 5)
+        self.assertGreaterEqual(metrics.wall_seconds, 0)
+
+    def test_session_writes_report(self):
+        instr = Instrumentation()
+        report_path = self.tmp / "report" / "check.json"
+
+        with instr.session("check", report_path=report_path), instr.stage("validate", items=4):
+            [bytearray(1024) for _ in range(10)]
+
+        self.assertFalse(instr.enabled)
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        self.assertEqual(report["command"], "check")
+        self.assertEqual(report["stages"]["validate"]["items"], 4)
+        self.assertIn("total", report["stages"])
+        self.assertIsNotNone(report["peak_traced_memory_bytes"])
+
+    def test_session_writes_report_on_failure(self):
+        instr = Instrumentation()
+        report_path = self.tmp / "report.json"
+
+        with self.assertRaises(RuntimeError), instr.session("check", report_path=report_path):
+            msg = "invalid data"
+            raise RuntimeError(msg)
+
+        self.assertTrue(report_path.is_file())
+
+    def test_session_writes_cprofile_dump(self):
+        instr = Instrumentation()
+        profile_path = self.tmp / "check.prof"
+
+        with instr.session("check", profile_path=profile_path):
+            sum(range(1000))
+
+        self.assertTrue(profile_path.is_file())
+
+    def test_session_without_outputs_stays_disabled(self):
+        instr = Instrumentation()
+
+        with instr.session("check"):
+            self.assertFalse(instr.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
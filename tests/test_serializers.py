@@ -0,0 +1,127 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import toml
+
+from datahub.serializers import (
+    DECODE_ERRORS,
+    JSON_ENV,
+    JSON_SERIALIZERS,
+    TOML_ENV,
+    TOML_SERIALIZERS,
+    available,
+    json_serializer,
+    toml_serializer,
+)
+
+DOCUMENTS = [
+    [],
+    {},
+    [[], {}, [{}]],
+    {"logon": "EDDM_TWR", "s1_twr": True, "s1_theory": False, "description": None, "rank": 3},
+    ["München", "Ørland \u2013 Zürich", "🛩", "\x7f\x00\x1f", 'quote " backslash \\ tab \t nl \n'],
+    {"nested": {"list": ["a", ["b", {"c": ["d"]}]], "empty": []}, "int": -12345678901234},
+    {"floats": [1e16, 1e-07, 0.1, -2.5, 1.0], "nested": [{"nan": float("nan")}, float("inf")]},
+]
+
+
+class TestJsonSerializers(unittest.TestCase):
+    def test_dumps_matches_json(self):
+        for name, serializer in available(JSON_SERIALIZERS).items():
+            for document in DOCUMENTS:
+                for indent in (None, 2, 4):
+                    for ensure_ascii in (True, False):
+                        with self.subTest(
+                            name, document=document, indent=indent, ascii=ensure_ascii
+                        ):
+                            self.assertEqual(
+                                serializer.dumps(document, indent, ensure_ascii),
+                                json.dumps(document, indent=indent, ensure_ascii=ensure_ascii),
+                            )
+
+    def test_dumps_falls_back_for_unsupported_values(self):
+        for name, serializer in available(JSON_SERIALIZERS).items():
+            with self.subTest(name):
+                document = {"big": 2**70, "keys": {1: "int key"}}
+                self.assertEqual(
+                    serializer.dumps(document, indent=4), json.dumps(document, indent=4)
+                )
+
+    def test_loads_matches_json(self):
+        documents = [
+            b'[{"logon": "EDDM_TWR", "frequency": "118.705"}]',
+            b'{"description": "M\\u00fcnchen \\ud83d\\udee9"}',
+            b'\xef\xbb\xbf{"bom": true}',
+            b'{"nan": NaN, "big": 123456789012345678901234567890}',
+        ]
+
+        for name, serializer in available(JSON_SERIALIZERS).items():
+            for document in documents:
+                with self.subTest(name, document=document):
+                    self.assertEqual(
+                        json.dumps(serializer.loads(document)), json.dumps(json.loads(document))
+                    )
+
+    def test_loads_raises_decode_errors(self):
+        for name, serializer in available(JSON_SERIALIZERS).items():
+            with self.subTest(name), self.assertRaises(json.JSONDecodeError) as context:
+                serializer.loads(b'[\n    {"logon": }\n]')
+
+            self.assertEqual((context.exception.lineno, context.exception.colno), (2, 15))
+
+
+class TestTomlSerializers(unittest.TestCase):
+    def test_loads_matches_toml(self):
+        document = toml.dumps({
+            "stations": [
+                {"logon": "EDDM_TWR", "description": "München", "s1_twr": True},
+                {"logon": "EDDF_TWR", "schedule_show_always": ["EDGG", "EDMM"]},
+            ]
+        })
+
+        for name, serializer in available(TOML_SERIALIZERS).items():
+            with self.subTest(name):
+                self.assertEqual(serializer.loads(document.encode()), toml.loads(document))
+                self.assertEqual(serializer.dumps(toml.loads(document)), document)
+
+    def test_loads_raises_decode_errors(self):
+        for name, serializer in available(TOML_SERIALIZERS).items():
+            with self.subTest(name), self.assertRaises(DECODE_ERRORS):
+                serializer.loads(b'logon = "EDDM_TWR"\nfrequency = \n')
+
+
+class TestSelection(unittest.TestCase):
+    def tearDown(self):
+        json_serializer.cache_clear()
+        toml_serializer.cache_clear()
+
+    def test_environment_selects_backend(self):
+        with patch.dict(os.environ, {JSON_ENV: "json", TOML_ENV: "toml"}):
+            json_serializer.cache_clear()
+            toml_serializer.cache_clear()
+
+            self.assertEqual(json_serializer().name, "json")
+            self.assertEqual(toml_serializer().name, "toml")
+
+    def test_default_is_fastest_available(self):
+        with patch.dict(os.environ, clear=False) as environ:
+            environ.pop(JSON_ENV, None)
+            environ.pop(TOML_ENV, None)
+            json_serializer.cache_clear()
+            toml_serializer.cache_clear()
+
+            self.assertEqual(json_serializer().name, next(iter(available(JSON_SERIALIZERS))))
+            self.assertEqual(toml_serializer().name, "tomllib")
+
+    def test_unknown_backend(self):
+        with patch.dict(os.environ, {JSON_ENV: "simplejson"}):
+            json_serializer.cache_clear()
+
+            with self.assertRaisesRegex(ValueError, "orjson, json"):
+                json_serializer()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import requests
+
+from datahub.serve import QueryServer
+from datahub.watch import DataWatcher
+
+
+class TestQueryServer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.data_dir = Path(self.temp_dir.name) / "data"
+        (self.data_dir / "edgg").mkdir(parents=True)
+        self.write([
+            {
+                "logon": "EDDF_TWR",
+                "frequency": "119.900",
+                "abbreviation": "DFT",
+                "schedule_show_always": ["EDGG"],
+            },
+            {
+                "logon": "EDDF_N_APP",
+                "frequency": "120.805",
+                "abbreviation": "DFN",
+                "relevant_airports": ["EDFH"],
+            },
+            {
+                "logon": "EDGG_GIN_CTR",
+                "frequency": "120.805",
+                "abbreviation": "GIN",
+                "relevant_airports": ["EDFH"],
+            },
+        ])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.server = QueryServer(("127.0.0.1", 0), DataWatcher(self.data_dir))
+
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def write(self, stations: list[dict]):
+        file_path = self.data_dir / "edgg/stations.json"
+        file_path.write_text(json.dumps(stations), encoding="utf-8")
+
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return requests.get(self.url + path, timeout=5, **kwargs)
+
+    def logons(self, path: str) -> list[str]:
+        response = self.get(path)
+        self.assertEqual(response.status_code, 200)
+        return [station["logon"] for station in response.json()]
+
+    def test_summary(self):
+        self.assertEqual(self.get("/").json()["stations"], 3)
+
+    def test_logon(self):
+        response = self.get("/stations/eddf_twr")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["frequency"], "119.900")
+        self.assertEqual(self.get("/stations/EDDM_TWR").status_code, 404)
+
+    def test_lookups(self):
+        self.assertEqual(self.logons("/stations?prefix=EDDF"), ["EDDF_N_APP", "EDDF_TWR"])
+        self.assertEqual(
+            self.logons("/stations?frequency=120.8050"), ["EDDF_N_APP", "EDGG_GIN_CTR"]
+        )
+        self.assertEqual(self.logons("/stations?airport=edfh"), ["EDDF_N_APP", "EDGG_GIN_CTR"])
+        # like legacy/airport_stations.json, only relevant_airports counts, not the logon
+        self.assertEqual(self.logons("/stations?airport=EDDF"), [])
+
+    def test_invalid_lookups(self):
+        self.assertEqual(self.get("/stations").status_code, 400)
+        self.assertEqual(self.get("/stations?frequency=100.000").status_code, 400)
+        self.assertEqual(self.get("/unknown").status_code, 404)
+
+    def test_schedule(self):
+        schedule = self.get("/schedules/edgg").json()
+
+        self.assertEqual(schedule["schedule_show_always"], ["EDDF_TWR"])
+        self.assertEqual(self.get("/schedules/XXXX").status_code, 404)
+
+    def test_etag(self):
+        response = self.get("/stations?prefix=EDDF")
+        etag = response.headers["ETag"]
+
+        cached = self.get("/stations?prefix=EDDF", headers={"If-None-Match": etag})
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+
+    def test_hot_reload(self):
+        etag = self.get("/stations/EDDF_TWR").headers["ETag"]
+
+        self.write([{"logon": "EDDF_TWR", "frequency": "118.505", "abbreviation": "DFT"}])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.server.reload())
+
+        response = self.get("/stations/EDDF_TWR", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["frequency"], "118.505")
+        self.assertEqual(self.get("/").json()["stations"], 1)
+
+    def test_invalid_data_keeps_last_version(self):
+        self.write([{"logon": "EDDF_TWR"}])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(self.server.reload())
+
+        self.assertEqual(self.get("/").json()["stations"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
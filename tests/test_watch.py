@@ -0,0 +1,192 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from datahub.loaders.data_loader import DataLoader
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.watch import DataWatcher
+
+
+class TestDataWatcher(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        root = Path(self.temp_dir.name)
+        self.data_dir = root / "data"
+        self.api_dir = root / "api"
+        (self.data_dir / "edgg").mkdir(parents=True)
+        (self.data_dir / "edww").mkdir()
+
+        self.write("edgg/twr.json", [self.station("EDDF_TWR", "119.900")])
+        self.write("edww/twr.json", [self.station("EDDH_TWR", "118.505")])
+
+        self.watcher = DataWatcher(self.data_dir)
+
+    @staticmethod
+    def station(logon: str, frequency: str) -> dict:
+        return {"logon": logon, "frequency": frequency, "abbreviation": "TWR"}
+
+    def write(self, source: str, content):
+        file_path = self.data_dir / source
+        file_path.write_text(json.dumps(content), encoding="utf-8")
+
+        # make sure the change is visible even on file systems with coarse timestamps
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_initial_refresh_loads_all_files(self):
+        result = self.watcher.refresh()
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.changed, ["edgg/twr.json", "edww/twr.json"])
+        self.assertEqual(result.stations, 2)
+
+    def test_no_changes(self):
+        self.watcher.refresh()
+
+        self.assertIsNone(self.watcher.refresh())
+
+    def test_only_changed_file_is_revalidated(self):
+        self.watcher.refresh()
+        self.write(
+            "edgg/twr.json",
+            [self.station("EDDS_TWR", "118.805"), self.station("EDDF_TWR", "119.900")],
+        )
+
+        result = self.watcher.refresh()
+
+        self.assertEqual(result.changed, ["edgg/twr.json"])
+        self.assertEqual(result.stations, 3)
+
+        # stations are kept sorted
+        sources = {ds.source: [s.logon for s in ds.data] for ds in self.watcher.data}
+        self.assertEqual(sources["edgg/twr.json"], ["EDDF_TWR", "EDDS_TWR"])
+
+    def test_invalid_file(self):
+        self.watcher.refresh()
+        self.write("edgg/twr.json", [{"logon": "EDDF_TWR"}])
+
+        result = self.watcher.refresh()
+
+        self.assertFalse(result.ok)
+        self.assertIn("edgg/twr.json", result.errors)
+        self.assertEqual(result.stations, 1)
+
+        self.write("edgg/twr.json", [self.station("EDDF_TWR", "119.900")])
+        self.assertTrue(self.watcher.refresh().ok)
+
+    def test_duplicate_logon_across_files(self):
+        self.watcher.refresh()
+        self.write("edww/dup.json", [self.station("EDDF_TWR", "119.900")])
+
+        result = self.watcher.refresh()
+
+        self.assertFalse(result.ok)
+        errors = [c for c in result.conflicts if c.severity == "error"]
+        self.assertEqual(
+            [(c.index, c.source, c.other_source) for c in errors],
+            [("logon", "edww/dup.json", "edgg/twr.json")],
+        )
+
+    def test_removed_file(self):
+        self.watcher.refresh()
+        (self.data_dir / "edww/twr.json").unlink()
+
+        result = self.watcher.refresh()
+
+        self.assertEqual(result.changed, ["edww/twr.json"])
+        self.assertEqual([ds.source for ds in self.watcher.data], ["edgg/twr.json"])
+
+    def test_rebuilds_affected_outputs(self):
+        watcher = DataWatcher(
+            self.data_dir,
+            self.api_dir,
+            exporters=["data", "stations"],
+            manifest_path=Path(self.temp_dir.name) / "manifest.json",
+        )
+
+        result = watcher.refresh()
+        self.assertEqual(len(result.outputs), 3)
+
+        self.write("edww/twr.json", [self.station("EDDH_TWR", "121.805")])
+        result = watcher.refresh()
+
+        written = sorted(p.relative_to(self.api_dir).as_posix() for p in result.outputs)
+        self.assertEqual(written, ["edww/twr.json", "stations.json"])
+
+    def test_no_outputs_while_invalid(self):
+        watcher = DataWatcher(
+            self.data_dir,
+            self.api_dir,
+            manifest_path=Path(self.temp_dir.name) / "manifest.json",
+        )
+        self.write("edgg/twr.json", [{"logon": "EDDF_TWR"}])
+
+        result = watcher.refresh()
+
+        self.assertEqual(result.outputs, [])
+        self.assertFalse(self.api_dir.exists())
+
+    def test_changes_while_invalid_are_exported_after_recovery(self):
+        watcher = DataWatcher(
+            self.data_dir,
+            self.api_dir,
+            exporters=["data", "stations"],
+            manifest_path=Path(self.temp_dir.name) / "manifest.json",
+        )
+        watcher.refresh()
+
+        self.write("edgg/twr.json", [{"logon": "EDDF_TWR"}])
+        self.assertFalse(watcher.refresh().ok)
+
+        self.write("edww/twr.json", [self.station("EDDH_TWR", "121.805")])
+        self.assertEqual(watcher.refresh().outputs, [])
+
+        self.write("edgg/twr.json", [self.station("EDDF_TWR", "119.900")])
+        result = watcher.refresh()
+
+        self.assertTrue(result.ok)
+        written = sorted(p.relative_to(self.api_dir).as_posix() for p in result.outputs)
+        self.assertEqual(written, ["edww/twr.json", "stations.json"])
+        self.assertIn("121.805", (self.api_dir / "stations.json").read_text(encoding="utf-8"))
+
+    def test_failed_export_is_retried_with_next_change(self):
+        watcher = DataWatcher(
+            self.data_dir,
+            self.api_dir,
+            exporters=["data", "stations"],
+            manifest_path=Path(self.temp_dir.name) / "manifest.json",
+        )
+
+        with (
+            patch("datahub.commands.export", side_effect=OSError("disk full")),
+            self.assertLogs("datahub.watch", "ERROR"),
+        ):
+            watcher._refresh_and_report()
+        self.assertFalse(self.api_dir.exists())
+
+        self.write("edww/twr.json", [self.station("EDDH_TWR", "121.805")])
+        result = watcher.refresh()
+
+        self.assertEqual(result.changed, ["edgg/twr.json", "edww/twr.json"])
+        self.assertEqual(len(result.outputs), 3)
+
+    def test_uses_validation_cache(self):
+        cache_file = Path(self.temp_dir.name) / "cache.json"
+        DataWatcher(self.data_dir, cache=ValidationCache(cache_file)).refresh()
+
+        cache = ValidationCache(cache_file)
+        with patch.object(DataLoader, "_parse_file") as parse:
+            result = DataWatcher(self.data_dir, cache=cache).refresh()
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.stations, 2)
+        parse.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import contextlib
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from datahub.validators.consistency import (
+    find_conflicts,
+    find_dangling_bookings,
+    report_conflicts,
+    report_dangling_bookings,
+)
+from datahub.views.data_source import DataSource
+from datahub.views.event_schedule import EVENT_RULES, EventSchedule
+from datahub.views.logon_index import LogonIndex
+from datahub.views.station import Station
+
+
+def station(logon: str, frequency: str, abbreviation: str, **kwargs) -> Station:
+    return Station(logon=logon, frequency=frequency, abbreviation=abbreviation, **kwargs)
+
+
+class TestConsistency(TestCase):
+    def test_consistent_data(self):
+        data = [
+            DataSource(source="edgg/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")]),
+            DataSource(source="edww/twr.json", data=[station("EDDH_TWR", "118.505", "DFT")]),
+        ]
+
+        self.assertEqual(find_conflicts(data), [])
+
+    def test_duplicate_logon(self):
+        data = [
+            DataSource(source="edgg/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")]),
+            DataSource(source="edww/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")]),
+        ]
+
+        conflicts = find_conflicts(data)
+
+        # only reported as duplicate logon, not additionally as duplicate frequency
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0].index, "logon")
+        self.assertEqual(conflicts[0].severity, "error")
+        self.assertEqual(conflicts[0].source, "edww/twr.json")
+        self.assertEqual(conflicts[0].other_source, "edgg/twr.json")
+
+    def test_duplicate_cpdlc_login(self):
+        data = [
+            DataSource(
+                source="edgg/ctr.json",
+                data=[
+                    station("EDGG_DKB_CTR", "136.955", "GKB", cpdlc_login="EDGA"),
+                    station("EDGG_BAD_CTR", "127.505", "GBA", cpdlc_login="EDGA"),
+                    station("EDGG_RUD_CTR", "133.655", "GRU"),
+                    station("EDGG_GIN_CTR", "120.655", "GGI"),
+                ],
+            ),
+        ]
+
+        conflicts = find_conflicts(data)
+
+        self.assertEqual([(c.index, c.logon) for c in conflicts], [("cpdlc_login", "EDGG_BAD_CTR")])
+
+    def test_duplicate_abbreviation_within_fir(self):
+        data = [
+            DataSource(source="edgg/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")]),
+            DataSource(source="edgg/gnd.json", data=[station("EDDF_GND", "121.905", "DFT")]),
+        ]
+
+        conflicts = find_conflicts(data)
+
+        self.assertEqual([(c.index, c.severity) for c in conflicts], [("abbreviation", "warning")])
+        self.assertEqual(conflicts[0].key, ("edgg", "DFT"))
+
+    def test_duplicate_frequency_and_prefix(self):
+        data = [
+            DataSource(
+                source="edgg/del.json",
+                data=[
+                    station("EDDF_DEL", "121.905", "DFD"),
+                    station("EDDF_CO_DEL", "121.905", "DFC"),
+                    station("EDDS_DEL", "121.905", "DSD"),
+                ],
+            ),
+        ]
+
+        conflicts = find_conflicts(data)
+
+        self.assertEqual([(c.index, c.logon) for c in conflicts], [("frequency", "EDDF_CO_DEL")])
+        self.assertIn("EDDF_DEL", str(conflicts[0]))
+
+    def test_report_raises_on_errors_only(self):
+        data = [
+            DataSource(source="edgg/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")]),
+            DataSource(source="edgg/gnd.json", data=[station("EDDF_GND", "121.905", "DFT")]),
+        ]
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                report_conflicts(find_conflicts(data), data_dir)
+
+            self.assertIn(f"::warning file={data_dir}/edgg/gnd.json,line=1::", output.getvalue())
+
+            data.append(
+                DataSource(source="edww/twr.json", data=[station("EDDF_TWR", "119.900", "DFT")])
+            )
+            with self.assertRaises(RuntimeError), contextlib.redirect_stdout(io.StringIO()):
+                report_conflicts(find_conflicts(data), data_dir)
+
+    def test_report_points_at_the_station(self):
+        stations = [
+            {"logon": "EDDF_GND", "frequency": "121.905", "abbreviation": "DFG"},
+            {"logon": "eddf_twr", "frequency": "119.900", "abbreviation": "DFG"},
+        ]
+        data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[Station(**stations[0]), Station(**stations[1])],
+            )
+        ]
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            file_path = Path(data_dir) / "edgg/twr.json"
+            file_path.parent.mkdir()
+            file_path.write_text(json.dumps(stations, indent=4), encoding="utf-8")
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                report_conflicts(find_conflicts(data), data_dir)
+
+        self.assertIn(f"::warning file={file_path},line=7,col=5::", output.getvalue())
+
+
+class TestDanglingBookings(TestCase):
+    def setUp(self):
+        self.index = LogonIndex(["EDDF_TWR", "EDDK_APP", "EDGG_PAD_CTR"])
+
+    def schedule(self, *bookings: list[str]) -> EventSchedule:
+        rules = [{"day": "1", "booking": booking} for booking in bookings]
+        return EventSchedule(source="edgg.json", rules=EVENT_RULES.validate_python(rules))
+
+    def test_resolvable_bookings(self):
+        schedules = [self.schedule(["EDDF", "EDDK_APP"], ["EDGG_PAD"])]
+
+        self.assertEqual(find_dangling_bookings(schedules, self.index), [])
+
+    def test_dangling_bookings_are_reported_once(self):
+        schedules = [self.schedule(["EDDF", "EDDM"], ["EDDM", "EDDK_TWR"])]
+
+        dangling = find_dangling_bookings(schedules, self.index)
+
+        self.assertEqual([d.booking for d in dangling], ["EDDM", "EDDK_TWR"])
+
+        output = io.StringIO()
+        with self.assertRaises(RuntimeError), contextlib.redirect_stdout(output):
+            report_dangling_bookings(dangling, "data/event_schedules")
+
+        self.assertIn("::error file=data/event_schedules/edgg.json,line=1::", output.getvalue())
@@ -0,0 +1,136 @@
+import unittest
+from datetime import date, timedelta
+
+from pydantic import ValidationError
+
+from datahub.views.event_schedule import (
+    EVENT_RULES,
+    EventRule,
+    EventSchedule,
+    EveryXDayInMonthRule,
+    EveryXDaysRule,
+    WeekdayRule,
+)
+
+
+def days_between(start: date, end: date):
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+
+class TestEventRules(unittest.TestCase):
+    start = date(2025, 1, 1)
+    end = date(2026, 12, 31)
+
+    def test_parse_rules(self):
+        rules = EVENT_RULES.validate_python([
+            {"day": "5", "booking": ["eddf"]},
+            {"rule": "weekday", "day": "1", "booking": ["EDDK"]},
+            {"rule": "every_X_days", "one_date": "2023-08-11", "days": "14", "booking": ["EDDS"]},
+            {
+                "rule": "every_X_day_in_month",
+                "day_of_week": 3,
+                "number_day_in_month": 1,
+                "booking": ["EDDM"],
+            },
+        ])
+
+        self.assertEqual(
+            [type(rule) for rule in rules],
+            [WeekdayRule, WeekdayRule, EveryXDaysRule, EveryXDayInMonthRule],
+        )
+        self.assertEqual(rules[0].booking, ["EDDF"])
+        self.assertEqual(rules[2].days, 14)
+
+    def test_invalid_rules(self):
+        invalid = [
+            {"day": "8", "booking": ["EDDF"]},
+            {"rule": "every_X_days", "one_date": "2023-08-11", "days": "0", "booking": []},
+            {"rule": "every_X_day_in_month", "day_of_week": 3, "booking": []},
+            {"rule": "unknown", "booking": []},
+            {"day": "1"},
+        ]
+
+        for entry in invalid:
+            with self.subTest(entry=entry), self.assertRaises(ValidationError):
+                EVENT_RULES.validate_python([entry])
+
+    def test_base_rule_is_abstract(self):
+        with self.assertRaises(TypeError):
+            EventRule(booking=["EDDF"])
+
+    def test_weekday(self):
+        for day in range(1, 8):
+            rule = WeekdayRule(day=day, booking=[])
+            expected = [d for d in days_between(self.start, self.end) if d.isoweekday() == day]
+
+            self.assertEqual(list(rule.occurrences(self.start, self.end)), expected)
+
+    def test_every_x_days(self):
+        for one_date in (date(2023, 8, 11), date(2025, 6, 3), date(2027, 2, 1)):
+            for days in (1, 7, 14, 42):
+                rule = EveryXDaysRule(rule="every_X_days", one_date=one_date, days=days, booking=[])
+                expected = [
+                    d for d in days_between(self.start, self.end) if (d - one_date).days % days == 0
+                ]
+
+                self.assertEqual(list(rule.occurrences(self.start, self.end)), expected)
+
+    def test_every_x_day_in_month(self):
+        for day_of_week in range(1, 8):
+            for number in range(5):
+                rule = EveryXDayInMonthRule(
+                    rule="every_X_day_in_month",
+                    day_of_week=day_of_week,
+                    number_day_in_month=number,
+                    booking=[],
+                )
+                expected = [
+                    d
+                    for d in days_between(self.start, self.end)
+                    if d.isoweekday() == day_of_week and (d.day - 1) // 7 == number
+                ]
+
+                self.assertEqual(list(rule.occurrences(self.start, self.end)), expected)
+
+    def test_second_wednesday(self):
+        rule = EveryXDayInMonthRule(
+            rule="every_X_day_in_month", day_of_week=3, number_day_in_month=1, booking=[]
+        )
+
+        occurrences = list(rule.occurrences(date(2025, 10, 1), date(2025, 12, 31)))
+
+        self.assertEqual(occurrences, [date(2025, 10, 8), date(2025, 11, 12), date(2025, 12, 10)])
+
+    def test_empty_range(self):
+        rule = WeekdayRule(day=1, booking=[])
+
+        self.assertEqual(list(rule.occurrences(date(2025, 1, 2), date(2025, 1, 5))), [])
+
+    def test_wanted_merges_rules(self):
+        schedule = EventSchedule(
+            source="edgg.json",
+            rules=EVENT_RULES.validate_python([
+                {"day": "1", "booking": ["EDDF", "EDGG_GIN"]},
+                {
+                    "rule": "every_X_days",
+                    "one_date": "2025-01-06",
+                    "days": "14",
+                    "booking": ["EDDK"],
+                },
+            ]),
+        )
+
+        wanted = schedule.wanted(date(2025, 1, 6), date(2025, 1, 13))
+
+        self.assertEqual(
+            wanted,
+            {
+                date(2025, 1, 6): ["EDDF", "EDDK", "EDGG_GIN"],
+                date(2025, 1, 13): ["EDDF", "EDGG_GIN"],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
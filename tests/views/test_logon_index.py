@@ -0,0 +1,62 @@
+import unittest
+
+from datahub.views.data_source import DataSource
+from datahub.views.logon_index import LogonIndex
+from datahub.views.station import Station
+
+
+class TestLogonIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = LogonIndex([
+            "EDDF_TWR",
+            "EDDF_N_APP",
+            "EDDFX_TWR",
+            "EDDK_APP",
+            "EDGG_PAD_CTR",
+            "EDGG_PADX_CTR",
+            "EDDF_TWR",
+        ])
+
+    def test_from_data(self):
+        data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[Station(logon="EDDF_TWR", frequency="119.900", abbreviation="DFT")],
+            )
+        ]
+
+        self.assertEqual(LogonIndex.from_data(data).logons, ["EDDF_TWR"])
+
+    def test_duplicates_are_removed(self):
+        self.assertEqual(len(self.index), 6)
+
+    def test_contains(self):
+        self.assertIn("EDDK_APP", self.index)
+        self.assertNotIn("EDDK", self.index)
+        self.assertNotIn("ZZZZ", self.index)
+
+    def test_resolve_exact(self):
+        self.assertEqual(self.index.resolve("EDDK_APP"), ["EDDK_APP"])
+
+    def test_resolve_prefix(self):
+        self.assertEqual(self.index.resolve("EDDF"), ["EDDFX_TWR", "EDDF_N_APP", "EDDF_TWR"])
+        self.assertEqual(self.index.resolve("EDDF_"), ["EDDF_N_APP", "EDDF_TWR"])
+        self.assertEqual(self.index.resolve("EDGG_PAD"), ["EDGG_PADX_CTR", "EDGG_PAD_CTR"])
+
+    def test_resolve_unknown(self):
+        self.assertEqual(self.index.resolve("EDDM"), [])
+        self.assertEqual(self.index.resolve("ZZZZ"), [])
+
+    def test_resolve_matches_linear_scan(self):
+        for prefix in ("", "E", "EDD", "EDDF_T", "EDGG_PAD_CTR", "EDGH"):
+            expected = sorted(logon for logon in set(self.index.logons) if logon.startswith(prefix))
+            self.assertEqual(self.index.resolve(prefix), expected)
+
+    def test_expand(self):
+        self.assertEqual(
+            self.index.expand(["EDDK", "EDDF_TWR", "EDDK_APP"]), ["EDDF_TWR", "EDDK_APP"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
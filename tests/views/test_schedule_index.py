@@ -0,0 +1,67 @@
+import unittest
+
+from datahub.views.data_source import DataSource
+from datahub.views.schedule_index import ScheduleIndex
+from datahub.views.schedules import SCHEDULE_TYPES
+from datahub.views.station import Station
+
+
+class TestScheduleIndex(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            DataSource(
+                source="edgg/twr.json",
+                data=[
+                    Station(
+                        logon="EDDF_TWR",
+                        frequency="118.500",
+                        abbreviation="DFT",
+                        schedule_show_always=["EDGG"],
+                        schedule_show_booked=["EDWW"],
+                    ),
+                    Station(
+                        logon="EDDS_TWR",
+                        frequency="118.800",
+                        abbreviation="STT",
+                        schedule_show_booked=["EDGG"],
+                    ),
+                ],
+            ),
+            DataSource(
+                source="edgg/military.json",
+                data=[
+                    Station(
+                        logon="ETOU_TWR",
+                        frequency="122.100",
+                        abbreviation="OUT",
+                        schedule_show_always=["EDGG"],
+                    ),
+                    Station(logon="ETAR_TWR", frequency="122.100", abbreviation="ART"),
+                ],
+            ),
+        ]
+        self.index = ScheduleIndex.from_data(self.data)
+
+    def test_schedule_types_include_mil(self):
+        self.assertEqual(self.index.schedule_types, ["EDGG", "EDMM", "EDWW", "MIL"])
+        self.assertIn("MIL", SCHEDULE_TYPES)
+
+    def test_show_always(self):
+        self.assertEqual(self.index.show_always("EDGG"), ["EDDF_TWR", "ETOU_TWR"])
+        self.assertEqual(self.index.show_always("EDMM"), [])
+
+    def test_show_booked(self):
+        self.assertEqual(self.index.show_booked("EDGG"), ["EDDS_TWR"])
+        self.assertEqual(self.index.show_booked("EDWW"), ["EDDF_TWR"])
+
+    def test_mil_schedule_contains_scheduled_military_stations(self):
+        self.assertEqual(self.index.show_always("MIL"), ["ETOU_TWR"])
+        self.assertEqual(self.index.show_booked("MIL"), [])
+
+    def test_schedules_of(self):
+        self.assertEqual(self.index.schedules_of("EDDF_TWR"), (["EDGG"], ["EDWW"]))
+        self.assertEqual(self.index.schedules_of("ETAR_TWR"), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -144,6 +144,25 @@ class TestStation(unittest.TestCase):
         self.assertIsNone(station.relevant_airports)
         self.assertIsNone(station.gcap_status)
 
+    def test_from_trusted_equals_validated_station(self):
+        """Test that a trusted station built from validated data equals the validated station"""
+        station = Station(
+            logon="eddf_twr",
+            frequency="118.5",
+            abbreviation="DFT",
+            schedule_show_always=["EDGG"],
+            relevant_airports=["eddf"],
+        )
+
+        self.assertEqual(Station.from_trusted(station.model_dump()), station)
+        self.assertEqual(Station.from_trusted(station.to_dict()).to_dict(), station.to_dict())
+
+    def test_from_trusted_skips_validation(self):
+        station = Station.from_trusted({"logon": "eddf_twr", "frequency": "1", "abbreviation": "D"})
+
+        self.assertEqual(station.logon, "eddf_twr")
+        self.assertIsNone(station.description)
+
 
 if __name__ == "__main__":
     unittest.main()
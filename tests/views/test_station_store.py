@@ -0,0 +1,118 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from datahub import commands
+from datahub.exports.build_manifest import BuildManifest
+from datahub.loaders.validation_cache import ValidationCache
+from datahub.settings import EXPORTERS
+from datahub.sorting.station_sorter import StationSorter
+from datahub.views.data_source import DataSource
+from datahub.views.station import Station
+from datahub.views.station_store import SCHEDULE_BITS, StationStore, StationView
+
+
+class TestStationStore(unittest.TestCase):
+    def setUp(self):
+        self.stations = [
+            Station(
+                logon="EDDF_TWR",
+                frequency="118.500",
+                abbreviation="DFT",
+                description="Frankfurt Tower",
+                schedule_show_booked=["EDWW", "EDGG"],
+                relevant_airports=["EDDF", "EDFE"],
+                gcap_status="1",
+                s1_twr=False,
+                cpdlc_login="EDDF",
+            ),
+            Station(
+                logon="EDDF_APP",
+                frequency="120.805",
+                abbreviation="DFA",
+                schedule_show_always=["EDGG"],
+                schedule_show_booked=[],
+                s1_theory=True,
+            ),
+            Station(logon="EDDF_DEL", frequency="121.900", abbreviation="DFD"),
+        ]
+        self.store = StationStore(self.stations)
+
+    def test_incremental_export_of_store(self):
+        """Test that every exporter runs incrementally on a store, writing the same outputs"""
+        data = StationSorter.sort([DataSource(source="edgg/twr.json", data=self.stations)])
+
+        with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+            root = Path(temp_dir)
+            cpdlc_mapping = root / "cpdlcMap.json"
+            cpdlc_mapping.write_text(json.dumps({"EDDF": "FRANKFURT TOWER"}), encoding="utf-8")
+
+            outputs = {}
+            for name, export_data in (("list", data), ("store", StationStore.from_data(data))):
+                api_dir = root / name
+                manifest = BuildManifest(root / f"{name}.json", api_dir)
+                commands.export(export_data, api_dir, cpdlc_mapping, list(EXPORTERS), manifest)
+                manifest.save()
+
+                outputs[name] = {
+                    p.relative_to(api_dir): p.read_bytes()
+                    for p in api_dir.rglob("*")
+                    if p.is_file()
+                }
+
+        self.assertEqual(outputs["store"], outputs["list"])
+        self.assertIn(Path("stations.snapshot"), outputs["store"])
+
+    def test_validation_cache_accepts_views(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ValidationCache(Path(temp_dir) / "cache.json")
+            cache.put("edgg/twr.json", "hash", list(self.store))
+
+            self.assertEqual(cache.get("edgg/twr.json", "hash"), self.stations)
+
+    def test_conversion_is_lossless(self):
+        self.assertEqual(self.store.to_stations(), self.stations)
+
+    def test_views_match_stations(self):
+        for view, station in zip(self.store, self.stations, strict=True):
+            self.assertIsInstance(view, StationView)
+            self.assertEqual(view.to_dict(), station.to_dict())
+            self.assertEqual(view.frequency, station.frequency)
+            self.assertEqual(view.schedule_show_booked, station.schedule_show_booked)
+
+    def test_prefixes_are_interned(self):
+        self.assertEqual(self.store.prefixes, ["EDDF"])
+        self.assertEqual(self.store[2].prefix, "EDDF")
+
+    def test_frequency_in_khz(self):
+        self.assertEqual(self.store[1].frequency_khz, 120805)
+
+    def test_schedule_masks(self):
+        self.assertEqual(
+            self.store[0].schedule_booked_mask, SCHEDULE_BITS["EDWW"] | SCHEDULE_BITS["EDGG"]
+        )
+        self.assertEqual(self.store[1].schedule_always_mask, SCHEDULE_BITS["EDGG"])
+        self.assertEqual(self.store[2].schedule_always_mask, 0)
+
+    def test_indexing(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store[-1].logon, "EDDF_DEL")
+
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+    def test_sorter_consumes_store(self):
+        result = StationSorter.sort(self.store)
+
+        self.assertIsInstance(result, StationStore)
+        self.assertEqual(
+            [s.logon for s in result],
+            [s.logon for s in StationSorter.sort_stations(self.stations)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()